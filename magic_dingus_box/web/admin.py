@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 import json
 import socket
 import os
@@ -8,10 +7,12 @@ import re
 import subprocess
 import sys
 import secrets
+import shutil
+import tempfile
 import threading
 import time
+import traceback
 import uuid
-import zipfile
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
@@ -368,7 +369,6 @@ def create_app(data_dir: Path, config=None) -> Flask:
     upload_temp_dir = data_dir / "upload_temp"
     upload_temp_dir.mkdir(parents=True, exist_ok=True)
     os.environ["TMPDIR"] = str(upload_temp_dir)
-    import tempfile
     tempfile.tempdir = str(upload_temp_dir)
 
     
@@ -411,6 +411,33 @@ def create_app(data_dir: Path, config=None) -> Flask:
     roms_dir = data_dir / "roms"
     device_info_file = data_dir / "device_info.json"
 
+    # Content counts walk the whole media and ROM trees, and device discovery
+    # polls /admin/device/info every 30s. Reuse the last count until the admin
+    # changes something (any non-GET request) or the TTL catches outside edits.
+    CONTENT_STATS_TTL = 60.0
+    content_stats_cache: dict[str, Any] = {"stats": None, "time": 0.0}
+
+    def get_content_stats() -> dict:
+        """Count playlists, videos and ROMs, reusing a recent count when possible."""
+        cached = content_stats_cache["stats"]
+        if cached is not None and time.monotonic() - content_stats_cache["time"] < CONTENT_STATS_TTL:
+            return dict(cached)
+
+        stats = {
+            'playlists': len(list(playlists_dir.glob("*.y*ml"))) if playlists_dir.exists() else 0,
+            'videos': len(list(media_dir.rglob("*.mp4"))) if media_dir.exists() else 0,
+            'roms': sum(1 for _ in roms_dir.rglob("*") if _.is_file()) if roms_dir.exists() else 0,
+        }
+        content_stats_cache["stats"] = stats
+        content_stats_cache["time"] = time.monotonic()
+        return dict(stats)
+
+    @app.after_request
+    def _invalidate_content_stats(response):  # type: ignore[no-redef]
+        if request.method != "GET":
+            content_stats_cache["stats"] = None
+        return response
+
     def get_device_info() -> dict:
         """Get device identity and stats."""
         try:
@@ -427,11 +454,7 @@ def create_app(data_dir: Path, config=None) -> Flask:
             info['local_ip'] = get_local_ip()
             
             # Add content stats
-            info['stats'] = {
-                'playlists': len(list(playlists_dir.glob("*.y*ml"))) if playlists_dir.exists() else 0,
-                'videos': len(list(media_dir.rglob("*.mp4"))) if media_dir.exists() else 0,
-                'roms': sum(1 for _ in roms_dir.rglob("*") if _.is_file()) if roms_dir.exists() else 0,
-            }
+            info['stats'] = get_content_stats()
             
             return info
         except Exception as e:
@@ -460,7 +483,6 @@ def create_app(data_dir: Path, config=None) -> Flask:
             if device_info_file.exists():
                 info = json.loads(device_info_file.read_text())
             else:
-                import uuid
                 info = {'device_id': str(uuid.uuid4())}
 
             info['device_name'] = new_name
@@ -538,11 +560,7 @@ def create_app(data_dir: Path, config=None) -> Flask:
             stats["warnings"] = stats.get("warnings", []) + [f"App service is {app_status}"]
 
         # Content stats
-        stats["content"] = {
-            "playlists": len(list(playlists_dir.glob("*.y*ml"))) if playlists_dir.exists() else 0,
-            "videos": len(list(media_dir.rglob("*.mp4"))) if media_dir.exists() else 0,
-            "roms": sum(1 for _ in roms_dir.rglob("*") if _.is_file()) if roms_dir.exists() else 0,
-        }
+        stats["content"] = get_content_stats()
 
         return success_response(data=stats)
 
@@ -570,6 +588,11 @@ def create_app(data_dir: Path, config=None) -> Flask:
         - data/device_info.json - Device identity info (if exists)
         - manifest.json - Backup metadata
         """
+        # Backup/restore are rare admin actions; zipfile (and its compression
+        # modules) is imported here rather than on every service start
+        import io
+        import zipfile
+
         buffer = io.BytesIO()
 
         with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
@@ -631,6 +654,8 @@ def create_app(data_dir: Path, config=None) -> Flask:
         Accepts a ZIP file created by the backup endpoint.
         Restores playlists, settings, and device info.
         """
+        import zipfile
+
         if "file" not in request.files:
             return error_response("NO_FILE", "No backup file provided")
 
@@ -827,7 +852,6 @@ def create_app(data_dir: Path, config=None) -> Flask:
             return error_response("VALIDATION_ERROR", str(e))
         except Exception as e:
             print(f"Error saving playlist {name}: {e}", file=sys.stderr)
-            import traceback
             traceback.print_exc()
             return error_response("INTERNAL_ERROR", str(e), status=500)
 
@@ -1128,8 +1152,7 @@ def create_app(data_dir: Path, config=None) -> Flask:
             if result.returncode != 0:
                 return {'needs_transcode': True, 'reason': 'Could not probe video'}
 
-            import json as json_module
-            data = json_module.loads(result.stdout)
+            data = json.loads(result.stdout)
 
             # Extract video stream info
             streams = data.get('streams', [])
@@ -1221,7 +1244,6 @@ def create_app(data_dir: Path, config=None) -> Flask:
                 counter += 1
 
             # Move file to media folder
-            import shutil
             shutil.move(str(temp_input), str(output_path))
 
             return success_response(data={
@@ -1307,6 +1329,38 @@ def create_app(data_dir: Path, config=None) -> Flask:
     # Lock for serializing M3U generation
     m3u_lock = threading.Lock()
 
+    # A multi-disc upload arrives as one request per disc; wait until uploads have
+    # been quiet for this long and then regenerate the M3U playlists once.
+    M3U_DEBOUNCE_SECONDS = 2.0
+    m3u_timer: dict[str, Any] = {"timer": None}
+    m3u_timer_lock = threading.Lock()
+
+    def run_m3u_generator():
+        # Acquire lock to ensure only one script instance runs at a time
+        with m3u_lock:
+            try:
+                script_path = data_dir.parent / "magic_dingus_box_cpp" / "scripts" / "generate_m3u_playlists.sh"
+                if script_path.exists():
+                    # Output is discarded, so don't pipe it back into this process
+                    subprocess.run(
+                        [str(script_path)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=30
+                    )
+            except Exception as e:
+                print(f"M3U generator error: {e}", file=sys.stderr)
+
+    def schedule_m3u_generator():
+        """(Re)start the debounce timer so a burst of uploads runs the generator once."""
+        with m3u_timer_lock:
+            if m3u_timer["timer"] is not None:
+                m3u_timer["timer"].cancel()
+            timer = threading.Timer(M3U_DEBOUNCE_SECONDS, run_m3u_generator)
+            timer.daemon = True
+            m3u_timer["timer"] = timer
+            timer.start()
+
     @app.post("/admin/upload/rom/<system>")
     @require_csrf
     def upload_rom(system):  # type: ignore[no-redef]
@@ -1333,25 +1387,9 @@ def create_app(data_dir: Path, config=None) -> Flask:
         f.save(str(out))
         
         # Auto-generate M3U playlists for PS1 multi-disc games
+        # Runs in the background (debounced) to not block the response
         if safe_system.lower() == 'ps1':
-            def run_m3u_generator():
-                # Acquire lock to ensure only one script instance runs at a time
-                with m3u_lock:
-                    try:
-                        script_path = data_dir.parent / "magic_dingus_box_cpp" / "scripts" / "generate_m3u_playlists.sh"
-                        if script_path.exists():
-                            subprocess.run(
-                                [str(script_path)],
-                                capture_output=True,
-                                timeout=30
-                            )
-                    except Exception as e:
-                        print(f"M3U generator error: {e}", file=sys.stderr)
-            
-            # Run in background thread to not block response
-            thread = threading.Thread(target=run_m3u_generator)
-            thread.daemon = True
-            thread.start()
+            schedule_m3u_generator()
         
         return success_response(data={"path": str(out.relative_to(data_dir.parent))}, message="ROM uploaded")
 
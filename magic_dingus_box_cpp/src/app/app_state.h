@@ -52,33 +52,40 @@ struct PlaylistItem {
     std::string emulator_system;  // System name (NES, SNES, etc.)
 };
 
+enum class PlaylistKind {
+    NONE,   // Empty, or mixed items that are neither video nor all-game
+    VIDEO,  // Contains any video content
+    GAME    // Contains only games (no videos)
+};
+
 struct Playlist {
     std::string title;
     std::string curator;
     std::string path;
     std::vector<PlaylistItem> items;
+    PlaylistKind kind = PlaylistKind::NONE;  // Set by classify() once items are loaded
     
-    // Check if this playlist contains only games (no videos)
-    bool is_game_playlist() const {
-        if (items.empty()) return false;
+    // Scan the items once and record the playlist kind
+    void classify() {
+        kind = PlaylistKind::NONE;
+        if (items.empty()) return;
+        bool all_games = true;
         for (const auto& item : items) {
+            if (item.source_type == "local" || item.source_type == "youtube") {
+                kind = PlaylistKind::VIDEO;
+                return;
+            }
             if (item.source_type != "emulated_game") {
-                return false;
+                all_games = false;
             }
         }
-        return true;
-    }
-    
-    // Check if this playlist contains any video content
-    bool is_video_playlist() const {
-        if (items.empty()) return false;
-        for (const auto& item : items) {
-            if (item.source_type == "local" || item.source_type == "youtube") {
-                return true;
-            }
+        if (all_games) {
+            kind = PlaylistKind::GAME;
         }
-        return false;
     }
+    
+    bool is_game_playlist() const { return kind == PlaylistKind::GAME; }
+    bool is_video_playlist() const { return kind == PlaylistKind::VIDEO; }
 };
 
 struct AppState {
@@ -188,6 +195,9 @@ public:
     bool intro_complete;  // True after intro has finished (prevents replaying)
     bool intro_fading_out;  // True when intro video is fading out
     std::chrono::steady_clock::time_point intro_fade_out_start_time;  // When intro fade-out started
+    // Length of the intro fade-out. The main loop stops the intro and the renderer draws
+    // the black overlay from this one value, so the picture and audio end together
+    static constexpr std::chrono::milliseconds INTRO_FADE_OUT_DURATION{300};
     
     // Loading state
     std::atomic<bool> is_loading_game{false}; // True when a game is being launched
@@ -208,11 +218,20 @@ public:
         
         // Helper to cycle intensity: OFF -> Low (0.15) -> Medium (0.3) -> High (0.5) -> OFF
         // Note: Different effects might need different scales, but this is a good baseline
+        // Each step is {upper bound of current level, next level}; anything above wraps to OFF
+        static constexpr float INTENSITY_CYCLE[][2] = {
+            {0.0f, 0.15f},
+            {0.2f, 0.30f},
+            {0.4f, 0.50f},
+        };
         void cycle_setting(float& setting) {
-            if (setting <= 0.0f) setting = 0.15f;
-            else if (setting <= 0.2f) setting = 0.30f;
-            else if (setting <= 0.4f) setting = 0.50f;
-            else setting = 0.0f;
+            for (const auto& step : INTENSITY_CYCLE) {
+                if (setting <= step[0]) {
+                    setting = step[1];
+                    return;
+                }
+            }
+            setting = 0.0f;
         }
         
         // Cycle display mode: CRT_NATIVE <-> MODERN_TV
@@ -257,14 +276,14 @@ public:
                 sink_name = "alsa_output.platform-fef00700.hdmi.hdmi-stereo";
             }
             
-            // Set the default sink for new streams
-            std::string set_default = "pactl set-default-sink " + sink_name + " >/dev/null 2>&1";
-            system(set_default.c_str());
-            
-            // Move all currently playing streams to the new sink
-            // This ensures the currently playing video switches immediately
-            std::string move_streams = "for i in $(pactl list short sink-inputs 2>/dev/null | cut -f1); do pactl move-sink-input $i " + sink_name + " 2>/dev/null; done";
-            system(move_streams.c_str());
+            // Set the default sink for new streams, then move all currently playing
+            // streams to the new sink so the current video switches immediately.
+            // Both run in one shell so a switch costs a single fork; streams are only
+            // moved once the default sink has actually been set. Not skipped when the
+            // sink looks unchanged: PulseAudio can move it on its own (e.g. on hotplug)
+            std::string command = "pactl set-default-sink " + sink_name + " >/dev/null 2>&1 && "
+                                  "for i in $(pactl list short sink-inputs 2>/dev/null | cut -f1); do pactl move-sink-input $i " + sink_name + " 2>/dev/null; done";
+            system(command.c_str());
         }
         
         // Get volume offset label for display
@@ -276,11 +295,20 @@ public:
         }
         
         // Cycle through volume offset options
+        // Each step is {lower bound of current offset, next offset}; anything below wraps to Normal
+        static constexpr float VOLUME_OFFSET_CYCLE[][2] = {
+            {0.0f, -3.0f},
+            {-4.0f, -6.0f},
+            {-7.0f, -12.0f},
+        };
         void cycle_volume_offset() {
-            if (retroarch_volume_offset_db >= 0.0f) retroarch_volume_offset_db = -3.0f;
-            else if (retroarch_volume_offset_db >= -4.0f) retroarch_volume_offset_db = -6.0f;
-            else if (retroarch_volume_offset_db >= -7.0f) retroarch_volume_offset_db = -12.0f;
-            else retroarch_volume_offset_db = 0.0f;
+            for (const auto& step : VOLUME_OFFSET_CYCLE) {
+                if (retroarch_volume_offset_db >= step[0]) {
+                    retroarch_volume_offset_db = step[1];
+                    return;
+                }
+            }
+            retroarch_volume_offset_db = 0.0f;
         }
         
         // Cycle through audio output options
@@ -2,11 +2,15 @@
 #include "../video/video_player.h"
 #include "../video/gst_player.h"
 #include "../utils/path_resolver.h"
+#include "../utils/process_utils.h"
 #include "../retroarch/retroarch_launcher.h"
 #include "../platform/drm_display.h"
 #include "app_state.h"
 
 #include <sstream>
+#include <cstdio>
+#include <csignal>
+#include <pthread.h>
 #include <iomanip>
 #include <iostream>
 #include <filesystem>
@@ -26,6 +30,16 @@ Controller::Controller(video::VideoPlayer* player)
 {
 }
 
+Controller::~Controller() {
+    // The mixer worker owns mixer_pipe_ while it runs; let it finish before closing
+    if (mixer_future_.valid()) {
+        mixer_future_.wait();
+    }
+    if (mixer_pipe_) {
+        pclose(mixer_pipe_);  // EOF on stdin ends amixer
+    }
+}
+
 void Controller::load_file(const std::string& path, double start, double end, bool loop) {
     if (player_) {
         player_->load_file(path, start, end, loop);
@@ -43,24 +57,79 @@ void Controller::set_system_volume(int percent) {
     
     current_system_volume_ = percent;
     
-    // 1. Try to set 'Master' volume
-    std::string command_master = "amixer sset 'Master' " + std::to_string(percent) + "% > /dev/null 2>&1";
-    int ret_master = std::system(command_master.c_str());
-    
-    // 2. Try to set 'PCM' volume (fallback or additional)
-    std::string command_pcm = "amixer sset 'PCM' " + std::to_string(percent) + "% > /dev/null 2>&1";
-    int ret_pcm = std::system(command_pcm.c_str());
-    
-    if (ret_master != 0 && ret_pcm != 0) {
-        std::cerr << "Warning: Failed to set system volume (amixer Master/PCM both failed)" << std::endl;
+    // 1. Queue the ALSA mixer update; a worker already running picks up the new level
+    bool start_worker = false;
+    {
+        std::lock_guard<std::mutex> lock(mixer_mutex_);
+        pending_mixer_volume_ = percent;
+        if (!mixer_worker_running_) {
+            mixer_worker_running_ = true;
+            start_worker = true;
+        }
+    }
+    if (start_worker) {
+        mixer_future_ = std::async(std::launch::async, [this]() { run_mixer_worker(); });
     }
     
-    // 3. Set player software volume as well (belt and suspenders)
+    // 2. Set player software volume as well (belt and suspenders)
     if (player_) {
         player_->set_volume(percent);
     }
 }
 
+void Controller::run_mixer_worker() {
+    // Writing to an amixer that has exited must fail with EPIPE rather than raise
+    // SIGPIPE, which would terminate the whole process
+    sigset_t pipe_signal;
+    sigemptyset(&pipe_signal);
+    sigaddset(&pipe_signal, SIGPIPE);
+    pthread_sigmask(SIG_BLOCK, &pipe_signal, nullptr);
+
+    while (true) {
+        int percent;
+        {
+            std::lock_guard<std::mutex> lock(mixer_mutex_);
+            if (pending_mixer_volume_ < 0) {
+                mixer_worker_running_ = false;
+                return;
+            }
+            percent = pending_mixer_volume_;
+            pending_mixer_volume_ = -1;
+        }
+        
+        // The mixer already holds this level (e.g. volume up pressed at 100%)
+        if (percent == applied_mixer_volume_) {
+            continue;
+        }
+        
+        // Set 'Master' and 'PCM' (fallback or additional) through one amixer that stays
+        // in --stdin mode between changes, so a change is a pipe write, not a fork/exec.
+        // In that mode amixer skips controls the card doesn't have, so a failed write
+        // means it has exited (e.g. the mixer couldn't be opened); restart it once.
+        bool written = false;
+        for (int attempt = 0; attempt < 2 && !written; ++attempt) {
+            if (!mixer_pipe_) {
+                mixer_pipe_ = popen("amixer -s -q > /dev/null 2>&1", "we");
+                if (!mixer_pipe_) {
+                    break;
+                }
+            }
+            written = std::fprintf(mixer_pipe_, "sset Master %d%%\nsset PCM %d%%\n", percent, percent) > 0 &&
+                      std::fflush(mixer_pipe_) == 0;
+            if (!written) {
+                pclose(mixer_pipe_);
+                mixer_pipe_ = nullptr;
+            }
+        }
+        if (!written) {
+            std::cerr << "Warning: Failed to set system volume (amixer Master/PCM failed)" << std::endl;
+            applied_mixer_volume_ = -1;
+        } else {
+            applied_mixer_volume_ = percent;
+        }
+    }
+}
+
 utils::Result<> Controller::load_file_with_resolution(const std::string& path, const std::string& playlist_dir, double start, double end, bool loop) {
     if (!player_) {
         return utils::Result<>::fail("Player not initialized");
@@ -139,6 +208,14 @@ bool Controller::is_paused() const {
     return player_ ? player_->is_paused() : false;
 }
 
+bool Controller::is_at_end() const {
+    return player_ ? player_->is_at_end() : false;
+}
+
+bool Controller::has_error() const {
+    return player_ ? player_->has_error() : false;
+}
+
 double Controller::get_position() const {
     return player_ ? player_->get_position() : 0.0;
 }
@@ -289,20 +366,29 @@ void Controller::update_state(AppState& state) {
 }
 
 // Helper to wait with callback
-void wait_with_callback(int milliseconds, std::function<void()> callback) {
-    auto start = std::chrono::steady_clock::now();
-    auto duration = std::chrono::milliseconds(milliseconds);
+void wait_with_callback(int milliseconds, const std::function<void()>& callback) {
+    auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(milliseconds);
     
-    while (std::chrono::steady_clock::now() - start < duration) {
-        if (callback) {
-            callback();
+    // Nothing to animate - a single sleep covers the whole wait
+    if (!callback) {
+        std::this_thread::sleep_until(deadline);
+        return;
+    }
+    
+    while (true) {
+        callback();
+        // Sleep one frame (keeps animation smooth without 100% CPU), but never past
+        // the deadline and never draw an extra frame once it has been reached
+        auto next_frame = std::chrono::steady_clock::now() + std::chrono::milliseconds(16);
+        if (next_frame >= deadline) {
+            std::this_thread::sleep_until(deadline);
+            return;
         }
-        // Small sleep to prevent 100% CPU usage but keep animation smooth
-        std::this_thread::sleep_for(std::chrono::milliseconds(16));
+        std::this_thread::sleep_until(next_frame);
     }
 }
 
-utils::Result<> Controller::load_playlist_item(AppState& state, const app::Playlist& playlist, int item_index, const std::string& playlist_directory, std::function<void()> progress_callback) {
+utils::Result<> Controller::load_playlist_item(AppState& state, const app::Playlist& playlist, int item_index, const std::string& playlist_directory, const std::function<void()>& progress_callback) {
     if (item_index < 0 || item_index >= static_cast<int>(playlist.items.size())) {
         std::string error = "Invalid item index " + std::to_string(item_index) + " for playlist " + playlist.title;
         std::cerr << "Error: " << error << std::endl;
@@ -312,7 +398,9 @@ utils::Result<> Controller::load_playlist_item(AppState& state, const app::Playl
     const auto& item = playlist.items[item_index];
 
     // Check for Master Shuffle (index 0 in playlist 0)
-    if (playlist.title == "[S] Master Shuffle") {
+    // Playlists are passed by reference into state, so identify it by position
+    // rather than comparing titles on every load
+    if (!state.playlists.empty() && &playlist == &state.playlists.front()) {
         std::cout << "Master Shuffle selected! Starting global shuffle..." << std::endl;
         return utils::Result<>::ok();
     }
@@ -320,41 +408,34 @@ utils::Result<> Controller::load_playlist_item(AppState& state, const app::Playl
     if (item.source_type == "local") {
         std::cout << "Starting playlist transition..." << std::endl;
 
-        // Stop current playback
-        stop();
-        std::cout << "Stopped playback, loading new file..." << std::endl;
-
-        // Brief delay for MPV to stop
-        wait_with_callback(200, progress_callback);
-
-        // Load the new file
+        // Load the new file in place: the player swaps the URI on its existing pipeline
+        // and starts playback, so there is no separate stop / settle delay / play
         std::cout << "Loading file: " << item.path << std::endl;
         auto load_result = load_file_with_resolution(item.path, playlist_directory, 0.0, 0.0, false);
         if (load_result) {
             std::cout << "File loaded successfully, starting playback..." << std::endl;
 
-            play();
-
-            // Update player state immediately after play
-            if (auto gst_player = dynamic_cast<video::GstPlayer*>(player_)) {
-                gst_player->update_state();
+            // Wait (up to 1s) for playback to start instead of a fixed delay
+            auto gst_player = dynamic_cast<video::GstPlayer*>(player_);
+            auto start_deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(1000);
+            while (true) {
+                if (gst_player) {
+                    gst_player->update_state();
+                }
+                if (is_playing() || std::chrono::steady_clock::now() >= start_deadline) {
+                    break;
+                }
+                wait_with_callback(16, progress_callback);
             }
 
-            // Brief delay for playback to start
-            wait_with_callback(1000, progress_callback);
-
             // Verify playback actually started
             if (!is_playing()) {
                 std::cerr << "Warning: Playback did not start after load - this may cause playlist switching issues" << std::endl;
             }
 
-            // Debug: Check audio-related properties after video starts
-            try {
-                double vol = player_->get_volume();
-                std::cout << "DEBUG: After playlist transition - volume=" << vol << std::endl;
-            } catch (const std::exception& e) {
-                std::cerr << "DEBUG: Error checking audio properties: " << e.what() << std::endl;
-            }
+            // The player volume was written by load_file_with_resolution(); report that
+            // rather than reading the property back through the pipeline
+            std::cout << "DEBUG: After playlist transition - volume=" << current_system_volume_ << std::endl;
 
             return utils::Result<>::ok();
         } else {
@@ -418,21 +499,13 @@ utils::Result<> Controller::load_playlist_item(AppState& state, const app::Playl
         
         // Stop GStreamer completely before launching RetroArch
         // This ensures all resources (EGL, DRM, threads) are released
+        // cleanup() sets the pipeline to NULL synchronously and clears the player's
+        // playing state, so the result can be read back straight away
         if (player_) {
             std::cout << "Cleaning up GStreamer pipeline before RetroArch launch..." << std::endl;
             player_->cleanup();
-            // Wait a moment for cleanup to finish? cleanup() should be synchronous for pipeline destruction.
-            std::this_thread::sleep_for(std::chrono::milliseconds(100));
-        } // Wait for stop to complete
-        wait_with_callback(300, progress_callback);
-        
-        // Verify player stopped with retry loop
-        int retry_count = 0;
-        const int max_retries = 10;
-        while (is_playing() && retry_count < max_retries) {
-            wait_with_callback(100, progress_callback);
-            retry_count++;
         }
+        if (progress_callback) progress_callback();
         
         if (is_playing()) {
             std::cerr << "Warning: GStreamer did not stop cleanly before RetroArch launch" << std::endl;
@@ -468,9 +541,8 @@ utils::Result<> Controller::load_playlist_item(AppState& state, const app::Playl
         // CRITICAL: Wake up controller before launching RetroArch
         // Controller may be in sleep mode after GStreamer/DRM cleanup
         std::cout << "Waking up controller before RetroArch launch..." << std::endl;
-        std::system("sudo udevadm trigger --action=change --sysname-match=js* 2>/dev/null || true");
-        std::system("sudo udevadm trigger --action=change --sysname-match=event* 2>/dev/null || true");
-        wait_with_callback(200, progress_callback);
+        platform::InputManager::wake_controllers();
+        if (progress_callback) progress_callback();
         std::cout << "Controller wake-up signal sent" << std::endl;
         
         // Launch the game (BLOCKING)
@@ -488,7 +560,7 @@ utils::Result<> Controller::load_playlist_item(AppState& state, const app::Playl
         // CRITICAL: Ensure RetroArch is truly dead before we try to take back control
         // This prevents "zombie" processes from holding onto DRM/Input resources
         std::cout << "RetroArch exited. Ensuring process termination..." << std::endl;
-        std::system("pkill -9 retroarch 2>/dev/null || true");
+        utils::signal_processes(utils::find_processes_by_name("retroarch"), SIGKILL);
         
         // Add delay here to ensure RetroArch has fully released DRM master and kernel resources
         std::cout << "Waiting for system to settle..." << std::endl;
@@ -523,11 +595,7 @@ utils::Result<> Controller::load_playlist_item(AppState& state, const app::Playl
             
             bool input_initialized = false;
             for (int i = 0; i < 3; ++i) {
-                // Re-wake controller before initializing
-                std::system("sudo udevadm trigger --action=change --sysname-match=js* 2>/dev/null || true");
-                std::system("sudo udevadm trigger --action=change --sysname-match=event* 2>/dev/null || true");
-                std::this_thread::sleep_for(std::chrono::milliseconds(300));
-                
+                // initialize() re-wakes the controller itself before opening devices
                 if (input_manager_->initialize()) {
                     input_initialized = true;
                     std::cout << "Input devices initialized successfully." << std::endl;
@@ -610,7 +678,7 @@ void Controller::load_next_item(AppState& state, const std::string& playlist_dir
     
     // Move to next item
     int next_index;
-    int playlist_size = static_cast<int>(playlist.items.size());
+    const int playlist_size = static_cast<int>(playlist.items.size());
     
     if (state.shuffle) {
         // Shuffle mode: Use queue-based selection (Fisher-Yates)
@@ -673,8 +741,8 @@ void Controller::load_next_item(AppState& state, const std::string& playlist_dir
         state.current_item_index = old_index;  // Revert index
         state.last_advanced_item_index = -1;  // Reset advance flag to allow retry
         // Try next item if there are more
-        if (playlist.items.size() > 1) {
-            state.current_item_index = (state.current_item_index + 1) % playlist.items.size();
+        if (playlist_size > 1) {
+            state.current_item_index = (state.current_item_index + 1) % playlist_size;
             if (state.current_item_index != old_index) {  // Only if we have another item
                 // Stop current playback before trying next item
                 player_->stop();
@@ -694,7 +762,7 @@ void Controller::load_next_item(AppState& state, const std::string& playlist_dir
         
         std::cout << "Advanced to next item in playlist: " << playlist.title 
                   << " (item " << (old_index + 1) << " -> " << (state.current_item_index + 1) 
-                  << "/" << playlist.items.size() << ")" << std::endl;
+                  << "/" << playlist_size << ")" << std::endl;
     }
 }
 
@@ -714,8 +782,9 @@ void Controller::load_previous_item(AppState& state, const std::string& playlist
     bool was_ui_visible = state.ui_visible_when_playing;
     
     // Move to previous item (loop back to end if at start)
+    const int playlist_size = static_cast<int>(playlist.items.size());
     int old_index = state.current_item_index;
-    state.current_item_index = (state.current_item_index - 1 + playlist.items.size()) % playlist.items.size();
+    state.current_item_index = (state.current_item_index - 1 + playlist_size) % playlist_size;
     
     // Set advance flags BEFORE loading to prevent multiple advances
     // Mark that we've advanced from the old index
@@ -733,8 +802,8 @@ void Controller::load_previous_item(AppState& state, const std::string& playlist
         state.current_item_index = old_index;  // Revert index
         state.last_advanced_item_index = -1;  // Reset advance flag to allow retry
         // Try previous item if there are more
-        if (playlist.items.size() > 1) {
-            state.current_item_index = (state.current_item_index - 1 + playlist.items.size()) % playlist.items.size();
+        if (playlist_size > 1) {
+            state.current_item_index = (state.current_item_index - 1 + playlist_size) % playlist_size;
             if (state.current_item_index != old_index) {  // Only if we have another item
                 load_playlist_item(state, playlist, state.current_item_index, playlist_directory, nullptr);
             }
@@ -750,7 +819,7 @@ void Controller::load_previous_item(AppState& state, const std::string& playlist
         
         std::cout << "Advanced to previous item in playlist: " << playlist.title 
                   << " (item " << (old_index + 1) << " -> " << (state.current_item_index + 1) 
-                  << "/" << playlist.items.size() << ")" << std::endl;
+                  << "/" << playlist_size << ")" << std::endl;
     }
 }
 
@@ -820,11 +889,14 @@ void Controller::generate_shuffle_queue(AppState& state, int playlist_size) {
     static std::random_device rd;
     static std::mt19937 gen(rd());
     
-    // Create sequential indices
-    state.shuffle_queue.clear();
-    state.shuffle_queue.reserve(playlist_size);
-    for (int i = 0; i < playlist_size; ++i) {
-        state.shuffle_queue.push_back(i);
+    // An exhausted queue already holds every index once, so it only needs reshuffling;
+    // rebuild the sequential indices when the playlist (or its size) changed
+    if (static_cast<int>(state.shuffle_queue.size()) != playlist_size) {
+        state.shuffle_queue.clear();
+        state.shuffle_queue.reserve(playlist_size);
+        for (int i = 0; i < playlist_size; ++i) {
+            state.shuffle_queue.push_back(i);
+        }
     }
     
     // Fisher-Yates shuffle
@@ -858,13 +930,20 @@ void Controller::generate_master_shuffle_queue(AppState& state) {
     static std::random_device rd;
     static std::mt19937 gen(rd());
     
-    state.master_shuffle_queue.clear();
-    
     // Collect all items from all playlists (skip playlist 0 which is Master Shuffle itself)
-    for (size_t playlist_idx = 1; playlist_idx < state.playlists.size(); ++playlist_idx) {
-        const auto& playlist = state.playlists[playlist_idx];
-        for (size_t item_idx = 0; item_idx < playlist.items.size(); ++item_idx) {
-            state.master_shuffle_queue.emplace_back(static_cast<int>(playlist_idx), static_cast<int>(item_idx));
+    // Playlists are fixed after startup, so the (playlist, item) pairs are only built
+    // when the queue is empty; an exhausted queue is reshuffled in place
+    if (state.master_shuffle_queue.empty()) {
+        size_t total_items = 0;
+        for (size_t playlist_idx = 1; playlist_idx < state.playlists.size(); ++playlist_idx) {
+            total_items += state.playlists[playlist_idx].items.size();
+        }
+        state.master_shuffle_queue.reserve(total_items);
+        for (size_t playlist_idx = 1; playlist_idx < state.playlists.size(); ++playlist_idx) {
+            const auto& playlist = state.playlists[playlist_idx];
+            for (size_t item_idx = 0; item_idx < playlist.items.size(); ++item_idx) {
+                state.master_shuffle_queue.emplace_back(static_cast<int>(playlist_idx), static_cast<int>(item_idx));
+            }
         }
     }
     
@@ -4,8 +4,11 @@
 #include "../video/video_player.h"
 #include "../retroarch/retroarch_launcher.h"
 #include "../utils/result.h"
+#include <cstdio>
 #include <string>
 #include <functional>
+#include <future>
+#include <mutex>
 
 namespace platform {
     class DrmDisplay;  // Forward declaration
@@ -17,6 +20,7 @@ namespace app {
 class Controller {
 public:
     Controller(video::VideoPlayer* player);
+    ~Controller();
     
     // Set display reference for DRM cleanup before RetroArch launch
     void set_display(platform::DrmDisplay* display) { display_ = display; }
@@ -39,6 +43,8 @@ public:
     bool is_paused() const;
     double get_position() const;
     double get_duration() const;
+    bool is_at_end() const;
+    bool has_error() const;
     
     // Status text
     std::string status_text() const;
@@ -53,7 +59,7 @@ public:
     // Load a playlist item (video or game)
     // progress_callback: Optional callback to run while waiting (e.g. for loading animation)
     // Returns Result with error message on failure
-    utils::Result<> load_playlist_item(AppState& state, const app::Playlist& playlist, int item_index, const std::string& playlist_directory, std::function<void()> progress_callback = nullptr);
+    utils::Result<> load_playlist_item(AppState& state, const app::Playlist& playlist, int item_index, const std::string& playlist_directory, const std::function<void()>& progress_callback = nullptr);
     
     // Navigation
     void load_next_item(AppState& state, const std::string& playlist_directory);
@@ -80,6 +86,16 @@ private:
     platform::DrmDisplay* display_;  // For DRM cleanup before RetroArch launch
     platform::InputManager* input_manager_;  // For controller release before RetroArch launch
     int current_system_volume_ = 100;
+
+    // amixer runs on a background worker so volume changes don't stall the UI thread.
+    // Requests made while it is busy coalesce into the latest level.
+    std::mutex mixer_mutex_;
+    int pending_mixer_volume_ = -1;  // -1 = nothing queued
+    bool mixer_worker_running_ = false;
+    int applied_mixer_volume_ = -1;  // Last level amixer set (worker-only); -1 = none yet
+    FILE* mixer_pipe_ = nullptr;  // amixer kept running in --stdin mode (worker-only); null until first use
+    std::future<void> mixer_future_;  // Declared last so it is joined before the rest is torn down
+    void run_mixer_worker();
     
     // Shuffle queue helpers
     void generate_shuffle_queue(AppState& state, int playlist_size);
@@ -1,6 +1,9 @@
 #include "playlist_loader.h"
+#include "../utils/config.h"
 
 #include <yaml-cpp/yaml.h>
+#include <json/json.h>
+#include <chrono>
 #include <fstream>
 #include <iostream>
 #include <filesystem>
@@ -9,17 +12,102 @@ namespace fs = std::filesystem;
 
 namespace app {
 
+namespace {
+    // Bump when the cached playlist record layout or parsing rules change
+    constexpr int PLAYLIST_CACHE_VERSION = 1;
+
+    Json::Value playlist_to_json(const Playlist& pl) {
+        Json::Value record;
+        record["title"] = pl.title;
+        record["curator"] = pl.curator;
+        Json::Value items(Json::arrayValue);
+        for (const auto& item : pl.items) {
+            Json::Value entry;
+            entry["path"] = item.path;
+            entry["source_type"] = item.source_type;
+            entry["title"] = item.title;
+            entry["artist"] = item.artist;
+            entry["emulator_core"] = item.emulator_core;
+            entry["emulator_system"] = item.emulator_system;
+            items.append(entry);
+        }
+        record["items"] = items;
+        return record;
+    }
+
+    Playlist playlist_from_json(const Json::Value& record, const std::string& path) {
+        Playlist pl;
+        pl.path = path;
+        pl.title = record.get("title", "").asString();
+        pl.curator = record.get("curator", "").asString();
+        for (const auto& entry : record["items"]) {
+            PlaylistItem item;
+            item.path = entry.get("path", "").asString();
+            item.source_type = entry.get("source_type", "").asString();
+            item.title = entry.get("title", "").asString();
+            item.artist = entry.get("artist", "").asString();
+            item.emulator_core = entry.get("emulator_core", "").asString();
+            item.emulator_system = entry.get("emulator_system", "").asString();
+            pl.items.push_back(std::move(item));
+        }
+        pl.classify();
+        return pl;
+    }
+}
+
 std::vector<Playlist> PlaylistLoader::load_playlists(const std::string& directory) {
     std::vector<Playlist> playlists;
     
+    // Parsed playlists are cached per YAML path along with the file's mtime and size,
+    // so a boot only re-parses the playlists that changed since the last one
+    const std::string cache_path = config::get_playlist_cache_file();
+    Json::Value cached_records(Json::objectValue);
+    {
+        std::ifstream cache_file(cache_path);
+        Json::Value cache;
+        Json::CharReaderBuilder reader;
+        std::string errors;
+        if (cache_file && Json::parseFromStream(reader, cache_file, &cache, &errors) &&
+            cache.get("version", 0).asInt() == PLAYLIST_CACHE_VERSION &&
+            cache["playlists"].isObject()) {
+            cached_records = cache["playlists"];
+        }
+    }
+    Json::Value fresh_records(Json::objectValue);
+    int parsed = 0;
+    
     try {
         for (const auto& entry : fs::directory_iterator(directory)) {
             // Check if it's a regular file using status
             auto status = entry.status();
             if (fs::is_regular_file(status) && entry.path().extension() == ".yaml") {
+                const std::string path = entry.path().string();
+                
+                std::error_code size_ec, time_ec;
+                auto size = static_cast<Json::UInt64>(entry.file_size(size_ec));
+                auto mtime = static_cast<Json::Int64>(std::chrono::duration_cast<std::chrono::nanoseconds>(
+                    entry.last_write_time(time_ec).time_since_epoch()).count());
+                bool stat_ok = !size_ec && !time_ec;
+                
+                const Json::Value cached = cached_records.get(path, Json::Value());
+                if (stat_ok && cached.isObject() &&
+                    cached.get("mtime", 0).asInt64() == mtime &&
+                    cached.get("size", 0).asUInt64() == size) {
+                    playlists.push_back(playlist_from_json(cached, path));
+                    fresh_records[path] = cached;
+                    continue;
+                }
+                
                 try {
-                    Playlist pl = load_playlist(entry.path().string());
-                    playlists.push_back(pl);
+                    Playlist pl = load_playlist(path);
+                    parsed++;
+                    if (stat_ok) {
+                        Json::Value record = playlist_to_json(pl);
+                        record["mtime"] = mtime;
+                        record["size"] = size;
+                        fresh_records[path] = record;
+                    }
+                    playlists.push_back(std::move(pl));
                 } catch (const std::exception& e) {
                     std::cerr << "Failed to load playlist " << entry.path() << ": " << e.what() << std::endl;
                 }
@@ -29,6 +117,25 @@ std::vector<Playlist> PlaylistLoader::load_playlists(const std::string& director
         std::cerr << "Failed to read playlist directory: " << e.what() << std::endl;
     }
     
+    // Rewrite the cache only when a playlist was parsed or one disappeared
+    if (parsed > 0 || fresh_records.size() != cached_records.size()) {
+        Json::Value cache;
+        cache["version"] = PLAYLIST_CACHE_VERSION;
+        cache["playlists"] = fresh_records;
+        
+        std::error_code ec;
+        fs::create_directories(fs::path(cache_path).parent_path(), ec);
+        std::ofstream cache_file(cache_path);
+        if (cache_file) {
+            Json::StreamWriterBuilder writer;
+            writer["indentation"] = "";
+            cache_file << Json::writeString(writer, cache) << std::endl;
+        } else {
+            std::cerr << "Warning: Failed to write playlist cache: " << cache_path << std::endl;
+        }
+    }
+    std::cout << "Playlists: " << playlists.size() - parsed << " from cache, " << parsed << " parsed" << std::endl;
+    
     return playlists;
 }
 
@@ -115,6 +222,7 @@ Playlist PlaylistLoader::load_playlist(const std::string& path) {
         throw;
     }
     
+    pl.classify();
     return pl;
 }
 
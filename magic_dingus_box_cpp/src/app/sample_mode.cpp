@@ -4,32 +4,41 @@ namespace app {
 
 SampleMode::SampleMode()
     : active_(false)
+    , markers_dirty_(true)
 {
 }
 
 void SampleMode::enter() {
     active_ = true;
     markers_.clear();
+    markers_dirty_ = true;
 }
 
 void SampleMode::exit() {
     active_ = false;
     markers_.clear();
+    markers_dirty_ = true;
 }
 
 void SampleMode::add_marker(double timestamp) {
     markers_.push_back(timestamp);
+    markers_dirty_ = true;
 }
 
 void SampleMode::undo_marker() {
     if (!markers_.empty()) {
         markers_.pop_back();
+        markers_dirty_ = true;
     }
 }
 
 void SampleMode::update_state(AppState& state) {
     state.sample_mode_active = active_;
-    state.markers = markers_;
+    // Called every frame; only copy the marker list when it actually changed
+    if (markers_dirty_) {
+        state.markers = markers_;
+        markers_dirty_ = false;
+    }
 }
 
 } // namespace app
@@ -15,13 +15,14 @@ public:
     
     void add_marker(double timestamp);
     void undo_marker();
-    std::vector<double> get_markers() const { return markers_; }
+    const std::vector<double>& get_markers() const { return markers_; }
     
     void update_state(AppState& state);
 
 private:
     bool active_;
     std::vector<double> markers_;
+    bool markers_dirty_;  // markers_ changed since the last update_state()
 };
 
 } // namespace app
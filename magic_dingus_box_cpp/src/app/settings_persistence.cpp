@@ -10,25 +10,15 @@ namespace fs = std::filesystem;
 
 namespace app {
 
+// Serialized settings as last read from or written to disk this session. Menu
+// actions save on every change, so a save that matches it skips the file write.
+std::string SettingsPersistence::last_saved_json_;
+
 std::string SettingsPersistence::get_settings_path() {
     return config::get_settings_file();
 }
 
-utils::Result<> SettingsPersistence::save_settings(const AppState& state) {
-    std::string path = get_settings_path();
-
-    // Create directory if it doesn't exist
-    fs::path dir = fs::path(path).parent_path();
-    if (!fs::exists(dir)) {
-        std::error_code ec;
-        fs::create_directories(dir, ec);
-        if (ec) {
-            std::string error = "Failed to create config directory: " + ec.message();
-            LOG_ERROR("{}", error);
-            return utils::Result<>::fail(error);
-        }
-    }
-
+std::string SettingsPersistence::serialize(const AppState& state) {
     // Build JSON using JsonCpp
     Json::Value root;
 
@@ -61,7 +51,34 @@ utils::Result<> SettingsPersistence::save_settings(const AppState& state) {
     audio["retroarch_volume_offset_db"] = state.audio_settings.retroarch_volume_offset_db;
     root["audio"] = audio;
 
-    // Write to file with styled formatting
+    // Styled formatting
+    Json::StreamWriterBuilder builder;
+    builder["indentation"] = "  ";
+    return Json::writeString(builder, root) + "\n";
+}
+
+utils::Result<> SettingsPersistence::save_settings(const AppState& state) {
+    std::string path = get_settings_path();
+    std::string json = serialize(state);
+
+    if (json == last_saved_json_) {
+        LOG_DEBUG("Settings unchanged, skipping write to {}", path);
+        return utils::Result<>::ok();
+    }
+
+    // Create directory if it doesn't exist
+    fs::path dir = fs::path(path).parent_path();
+    if (!fs::exists(dir)) {
+        std::error_code ec;
+        fs::create_directories(dir, ec);
+        if (ec) {
+            std::string error = "Failed to create config directory: " + ec.message();
+            LOG_ERROR("{}", error);
+            return utils::Result<>::fail(error);
+        }
+    }
+
+    // Write to file
     std::ofstream file(path);
     if (!file.is_open()) {
         std::string error = "Failed to open settings file for writing: " + path;
@@ -69,12 +86,9 @@ utils::Result<> SettingsPersistence::save_settings(const AppState& state) {
         return utils::Result<>::fail(error);
     }
 
-    Json::StreamWriterBuilder builder;
-    builder["indentation"] = "  ";
-    std::unique_ptr<Json::StreamWriter> writer(builder.newStreamWriter());
-    writer->write(root, &file);
-    file << std::endl;
+    file << json;
     file.close();
+    last_saved_json_ = std::move(json);
 
     LOG_DEBUG("Settings saved to {}", path);
     return utils::Result<>::ok();
@@ -148,6 +162,9 @@ utils::Result<> SettingsPersistence::load_settings(AppState& state) {
         state.audio_settings.apply_output();
     }
 
+    // Remember what is on disk so saving an unchanged state doesn't rewrite it
+    last_saved_json_ = serialize(state);
+
     LOG_DEBUG("Settings loaded from {}", path);
     return utils::Result<>::ok();
 }
@@ -18,6 +18,10 @@ public:
 
 private:
     static std::string get_settings_path();
+
+    // Settings as the JSON text written to disk
+    static std::string serialize(const AppState& state);
+    static std::string last_saved_json_;
 };
 
 } // namespace app
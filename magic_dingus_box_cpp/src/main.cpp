@@ -19,6 +19,7 @@
 #include "ui/virtual_keyboard.h"
 
 #include <json/json.h>
+#include <algorithm>
 #include <iostream>
 #include <memory>
 #include <chrono>
@@ -29,15 +30,19 @@
 #include <ctime>
 #include <fstream>
 #include <filesystem>
+#include <future>
 #include <xf86drm.h>
 #include <xf86drmMode.h>
 #include <gbm.h>
 #include <GLES3/gl3.h>
 // GStreamer is now the only video backend - MPV headers removed
 #include <cstring>
+#include <cstdio>
 #include <cerrno>
+#include <cmath>
 #include <sys/select.h>
 #include <unistd.h>
+#include <fcntl.h>
 
 using namespace platform;
 using namespace video;
@@ -59,6 +64,40 @@ static void page_flip_handler(int /*fd*/, unsigned int /*frame*/,
     }
 }
 
+// Single-instance guard: only one engine can hold DRM master, so a second copy exits
+// instead of fighting over the display. The lock file is never truncated and the lock
+// is a one-byte fcntl record lock on it, so a normal start costs an open and a fcntl.
+// The owner's PID is written after the locked byte for diagnostics.
+static bool acquire_instance_lock() {
+    const std::string path = config::get_instance_lock_file();
+    int fd = open(path.c_str(), O_RDWR | O_CREAT | O_CLOEXEC, 0644);
+    if (fd < 0) {
+        // Don't refuse to start just because the lock file can't be created
+        LOG_WARN("Could not open instance lock {}: {}", path, std::strerror(errno));
+        return true;
+    }
+
+    if (lockf(fd, F_TLOCK, 1) != 0) {
+        char owner[24] = {};
+        ssize_t n = pread(fd, owner, sizeof(owner) - 1, 8);
+        std::string owner_pid = n > 0 ? std::string(owner, static_cast<size_t>(n)) : "";
+        owner_pid.erase(owner_pid.find_last_not_of(" \n") + 1);
+        LOG_ERROR("Another instance is already running (pid {})", owner_pid.empty() ? "unknown" : owner_pid);
+        close(fd);
+        return false;
+    }
+
+    // Fixed-width, space-padded PID so a shorter one fully overwrites a longer one
+    char pid_field[16];
+    int len = std::snprintf(pid_field, sizeof(pid_field), "%-14d\n", static_cast<int>(getpid()));
+    if (pwrite(fd, pid_field, static_cast<size_t>(len), 8) < 0) {
+        LOG_DEBUG("Could not record PID in {}: {}", path, std::strerror(errno));
+    }
+
+    // fd intentionally stays open: the lock is held for the life of the process
+    return true;
+}
+
 int main(int /* argc */, char* /* argv */[]) {
     // Initialize logging system
     // Log to file in config directory if available, otherwise console only
@@ -68,6 +107,11 @@ int main(int /* argc */, char* /* argv */[]) {
     LOG_INFO("Magic Dingus Box C++ Kiosk Engine (Async PageFlip)");
     LOG_DEBUG("Log file: {}", log_path.empty() ? "console only" : log_path);
 
+    if (!acquire_instance_lock()) {
+        logging::shutdown();
+        return 1;
+    }
+
     // Initialize random number generator for Master Shuffle
     std::srand(static_cast<unsigned int>(std::time(nullptr)));
 
@@ -77,6 +121,27 @@ int main(int /* argc */, char* /* argv */[]) {
         LOG_WARN("For DRM/KMS mode, stop X11 first: sudo systemctl stop lightdm.service");
     }
 
+    // Load playlists in the background while the display, GStreamer and UI renderer
+    // come up. This is pure file I/O (YAML parsing) and touches no GL or pipeline state.
+    // Try multiple paths: relative to executable, relative to build dir, and absolute
+    struct LoadedPlaylists {
+        std::vector<Playlist> playlists;
+        std::string dir;
+    };
+    auto playlists_future = std::async(std::launch::async, []() {
+        LoadedPlaylists loaded;
+        for (const auto& path : config::get_playlist_search_paths()) {
+            std::ifstream test(path + "/test");
+            if (test.good() || fs::exists(path)) {
+                test.close();
+                loaded.playlists = PlaylistLoader::load_playlists(path);
+                loaded.dir = path;
+                break;
+            }
+        }
+        return loaded;
+    });
+
     // Initialize DRM/KMS display (use "auto" to find the right device)
     DrmDisplay display;
     if (!display.initialize("auto")) {
@@ -267,21 +332,10 @@ int main(int /* argc */, char* /* argv */[]) {
     LOG_DEBUG("Body font: {}", body_font_path);
     LOG_INFO("UI renderer initialized");
     
-    // Load playlists
-    // Try multiple paths: relative to executable, relative to build dir, and absolute
-    std::vector<std::string> playlist_paths = config::get_playlist_search_paths();
-    
-    std::vector<Playlist> all_playlists;
-    std::string playlist_dir;
-    for (const auto& path : playlist_paths) {
-        std::ifstream test(path + "/test");
-        if (test.good() || fs::exists(path)) {
-            test.close();
-            all_playlists = PlaylistLoader::load_playlists(path);
-            playlist_dir = path;
-            break;
-        }
-    }
+    // Collect playlists loaded in the background during startup
+    LoadedPlaylists loaded_playlists = playlists_future.get();
+    std::vector<Playlist> all_playlists = std::move(loaded_playlists.playlists);
+    std::string playlist_dir = std::move(loaded_playlists.dir);
     
     if (all_playlists.empty()) {
         LOG_WARN("No playlists loaded");
@@ -290,13 +344,14 @@ int main(int /* argc */, char* /* argv */[]) {
     }
     
     // Separate video and game playlists (matching Python version)
+    // Single pass over the kind recorded at load time
     std::vector<Playlist> video_playlists;
     std::vector<Playlist> game_playlists;
-    for (const auto& pl : all_playlists) {
-        if (pl.is_video_playlist()) {
-            video_playlists.push_back(pl);
-        } else if (pl.is_game_playlist()) {
-            game_playlists.push_back(pl);
+    for (auto& pl : all_playlists) {
+        switch (pl.kind) {
+            case app::PlaylistKind::VIDEO: video_playlists.push_back(std::move(pl)); break;
+            case app::PlaylistKind::GAME: game_playlists.push_back(std::move(pl)); break;
+            case app::PlaylistKind::NONE: break;
         }
     }
     
@@ -371,6 +426,12 @@ int main(int /* argc */, char* /* argv */[]) {
         }
     }
     
+    // Decode the selected bezel PNG while the intro starts up; the first Modern TV
+    // frame then only has to upload it instead of decoding it on the render thread
+    if (state.display_settings.mode == app::DisplayMode::MODERN_TV && !state.available_bezels.empty()) {
+        ui_renderer.prefetch_bezel(state.available_bezels[state.display_settings.bezel_index].file);
+    }
+    
     // Initialize controller and sample mode
     Controller controller(&player);
     controller.set_display(&display);  // Set display reference for DRM cleanup
@@ -407,23 +468,27 @@ int main(int /* argc */, char* /* argv */[]) {
     std::cout << "Checking for intro video in " << intro_paths.size() << " locations..." << std::endl;
     for (const auto& path : intro_paths) {
         std::cout << "  Checking: " << path << std::endl;
-        // Try direct path check first (avoids path resolver warnings)
-        if (fs::exists(path)) {
-            try {
-                fs::path canonical_path = fs::canonical(path);
-                intro_video_path = canonical_path.string();
-                std::cout << "Found intro video: " << intro_video_path << std::endl;
-                break;
-            } catch (const std::exception& e) {
-                // Canonical failed, try absolute path
-                fs::path abs_path = fs::absolute(path);
-                if (fs::exists(abs_path)) {
-                    intro_video_path = abs_path.string();
-                    std::cout << "Found intro video: " << intro_video_path << std::endl;
-                    break;
-                }
-            }
+        // Try direct path check first (avoids path resolver warnings).
+        // canonical() fails for a missing file, so it doubles as the existence check
+        std::error_code ec;
+        fs::path canonical_path = fs::canonical(path, ec);
+        if (!ec) {
+            intro_video_path = canonical_path.string();
+            std::cout << "Found intro video: " << intro_video_path << std::endl;
+            break;
         }
+        if (ec != std::errc::no_such_file_or_directory && fs::exists(path)) {
+            // Canonical failed on an existing file, try absolute path
+            intro_video_path = fs::absolute(path).string();
+            std::cout << "Found intro video: " << intro_video_path << std::endl;
+            break;
+        }
+    }
+    
+    // Probe the RetroArch audio device in the background while the intro prerolls,
+    // so the aplay enumeration overlaps startup instead of delaying the first game launch
+    if (controller.get_retroarch_launcher().is_available()) {
+        controller.get_retroarch_launcher().prefetch_alsa_device();
     }
     
     // Load and play intro video if found
@@ -437,35 +502,33 @@ int main(int /* argc */, char* /* argv */[]) {
         
         auto intro_result = controller.load_file_with_resolution(intro_video_path, playlist_directory, 0.0, 0.0, false);
         if (intro_result) {
-            controller.play();
+            // load_file() already set the pipeline to PLAYING; no second play() needed
             std::cout << "Intro video loaded, waiting for playback to start..." << std::endl;
             
             // Wait for intro video to actually start playing AND render at least one frame
             // This ensures the first thing user sees is the video, not UI or blank screen
-            // Increased timeout to 10s (200 * 50ms) to allow for slower startup on Pi
-            int wait_count = 0;
-            const int max_wait = 200;  // Wait up to 10 seconds
+            // Up to 10s to allow for slower startup on Pi. Each pass sleeps on the pipeline
+            // bus, so it wakes as soon as preroll/PLAYING/duration is reported rather than
+            // on a fixed 50ms tick
+            const auto intro_deadline = std::chrono::steady_clock::now() + std::chrono::seconds(10);
             bool first_frame_rendered = false;
             
-            while ((!state.intro_ready || !first_frame_rendered) && wait_count < max_wait) {
-                std::this_thread::sleep_for(std::chrono::milliseconds(50));
+            while ((!state.intro_ready || !first_frame_rendered) && std::chrono::steady_clock::now() < intro_deadline) {
+                player.wait_for_bus_message(50);
+                player.update_state();
                 controller.update_state(state);
                 
-                // Check if mpv has rendered a frame
+                // Check if the pipeline has a frame ready
                 if (state.intro_ready && !first_frame_rendered) {
-                // Check if frame is ready - let main loop handle actual rendering
-                // This prevents race condition with main loop's buffer management
-                uint64_t flags = gst_renderer.get_update_flags();
-                if (flags & GstRenderer::UPDATE_FRAME) {
                     // Frame is ready - mark as rendered and let main loop handle it
                     // DON'T call gst_renderer.render() or egl.swap_buffers() here!
                     // The main loop will handle all rendering and buffer swapping
-                    first_frame_rendered = true;
-                    std::cout << "Intro video first frame ready, entering main loop" << std::endl;
-                }
+                    uint64_t flags = gst_renderer.get_update_flags();
+                    if (flags & GstRenderer::UPDATE_FRAME) {
+                        first_frame_rendered = true;
+                        std::cout << "Intro video first frame ready, entering main loop" << std::endl;
+                    }
                 }
-                
-                wait_count++;
             }
             
             if (state.intro_ready && first_frame_rendered) {
@@ -490,7 +553,19 @@ int main(int /* argc */, char* /* argv */[]) {
     
     // Main loop
     bool running = true;
-    auto last_frame = std::chrono::steady_clock::now();
+    
+    // Frame pacing: sleep (on the input fds, so a button press still wakes us at once)
+    // until 16ms after the frame started. Measuring from the frame's own start means its
+    // work counts against the budget, rather than the previous frame's length deciding
+    // how long this one sleeps
+    constexpr auto FRAME_INTERVAL = std::chrono::milliseconds(16);
+    auto wait_for_next_frame = [&input](std::chrono::steady_clock::time_point deadline) {
+        auto remaining = std::chrono::duration_cast<std::chrono::milliseconds>(
+            deadline - std::chrono::steady_clock::now()).count();
+        if (remaining > 0) {
+            input.wait_for_input(static_cast<int>(remaining));
+        }
+    };
 
     std::cout << "Entering main loop..." << std::endl;
 
@@ -506,6 +581,7 @@ int main(int /* argc */, char* /* argv */[]) {
         int consecutive_buffer_failures = 0;  // Track consecutive buffer lock failures
         int page_flip_failures = 0;           // Track page flip failures
         int successful_page_flips = 0;        // Track successful page flips for counter reset
+        bool vsync_paced = false;             // Last present blocked until its page flip completed
 
         // Reset all state for display recovery
         void reset(int drm_fd, struct gbm_surface* gbm_surface) {
@@ -529,6 +605,7 @@ int main(int /* argc */, char* /* argv */[]) {
             consecutive_buffer_failures = 0;
             page_flip_failures = 0;
             successful_page_flips = 0;
+            vsync_paced = false;
         }
     };
 
@@ -537,6 +614,8 @@ int main(int /* argc */, char* /* argv */[]) {
     // Frame presentation lambda
     // Encapsulates GBM/DRM logic to be shared between main loop and loading callback
     auto present_frame = [&]() {
+        frame_ctx.vsync_paced = false;
+
         // Double buffering strategy (GBM pools typically have only 2-3 buffers):
         // - previous_bo: previous frame (release after we've presented next frame)
         // - current bo: being presented now
@@ -728,6 +807,7 @@ int main(int /* argc */, char* /* argv */[]) {
                             break;
                         }
                     }
+                    frame_ctx.vsync_paced = !flip_ctx.waiting_for_flip;
 
                     // Reset failure counter periodically
                     frame_ctx.successful_page_flips++;
@@ -823,6 +903,48 @@ int main(int /* argc */, char* /* argv */[]) {
     
     // Track current mode to detect changes at runtime
     app::DisplayMode current_display_mode = state.display_settings.mode;
+    
+    // Idle-frame tracking: a static UI is only repainted when something changes
+    bool redraw_pending = true;  // Forces a repaint on the next frame
+    // Damage tracking for Modern TV mode: the letterbox borders and bezel only change
+    // with the bezel selection or a display reset/mode change
+    bool full_damage_pending = true;
+    int last_presented_bezel = -1;
+    int64_t last_blink_phase = -1;
+
+    // Progress callback that keeps the loading screen alive during a game launch.
+    // Built once here so a SELECT press doesn't wrap a fresh std::function each time.
+    const std::function<void()> game_launch_progress = [&]() {
+        // Clear screen
+        glClearColor(0.0f, 0.0f, 0.0f, 1.0f);
+        // Render UI to show loading screen
+        ui_renderer.render_loading_overlay(state);
+        
+        // Swap buffers (renders to GBM surface)
+        egl.swap_buffers();
+        
+        // Present frame (flips DRM page)
+        present_frame();
+    };
+
+    // Event arms shared by several inputs, defined once outside the loop
+    // Briefly reveal the playlist UI over a playing video
+    auto show_ui_briefly = [&]() {
+        state.ui_visible_when_playing = true;
+        state.ui_visibility_timer = 3.0; // Show for 3 seconds
+    };
+
+    // Menu-held volume change in 5% steps, clamped to 0-100
+    auto adjust_master_volume = [&](int steps) {
+        state.master_volume = std::clamp(state.master_volume + steps * 5, 0, 100);
+        controller.set_system_volume(state.master_volume);
+        // Show slider immediately on interaction
+        state.show_volume_slider = true;
+    };
+
+    // Intro fade-out volume levels, one per 60Hz frame, filled in when the fade starts
+    constexpr int INTRO_FADE_OUT_MS = static_cast<int>(app::AppState::INTRO_FADE_OUT_DURATION.count());
+    std::vector<double> intro_fade_volume_lut;
 
     while (running) {
         // Skip rendering if display is cleaned up (RetroArch is running)
@@ -852,6 +974,8 @@ int main(int /* argc */, char* /* argv */[]) {
             // Reset all frame presentation state (framebuffers, GBM buffers, counters)
             frame_ctx.reset(display.get_fd(), egl.get_gbm_surface());
             state.reset_display = false;
+            redraw_pending = true;
+            full_damage_pending = true;
             
             // CRITICAL: Re-make EGL context current after RetroArch released it
             // RetroArch uses its own EGL/DRM context, so we need to restore ours
@@ -898,6 +1022,8 @@ int main(int /* argc */, char* /* argv */[]) {
         if (state.display_settings.mode != current_display_mode) {
             std::cout << "Display Mode changed! Switching resolution..." << std::endl;
             current_display_mode = state.display_settings.mode;
+            redraw_pending = true;
+            full_damage_pending = true;
             
             bool ok = false;
             if (current_display_mode == app::DisplayMode::CRT_NATIVE) {
@@ -938,9 +1064,9 @@ int main(int /* argc */, char* /* argv */[]) {
         }
         
         static int frame_count = 0;
+        // One timestamp per frame, shared by every timer check below
         auto now = std::chrono::steady_clock::now();
-        auto delta = std::chrono::duration_cast<std::chrono::milliseconds>(now - last_frame).count();
-        last_frame = now;
+        const auto frame_deadline = now + FRAME_INTERVAL;
         
         // Update menu state (Wi-Fi scanning, etc.)
         settings_menu.update();
@@ -954,6 +1080,9 @@ int main(int /* argc */, char* /* argv */[]) {
             input_events.insert(input_events.end(), gpio_events.begin(), gpio_events.end());
         }
         
+        // Collapse bursts of rotation (fast encoder spin, stick repeat) into one step per frame
+        InputManager::coalesce_rotations(input_events);
+        
         // Track Menu button state for volume control
         static bool menu_button_held = false;
         static bool volume_changed_while_held = false;
@@ -961,27 +1090,29 @@ int main(int /* argc */, char* /* argv */[]) {
         
         // Time-based check for showing slider (if held long enough)
         if (menu_button_held && !state.show_volume_slider) {
-            auto now = std::chrono::steady_clock::now();
             auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(now - menu_press_time).count();
             if (duration > 300) {
                 state.show_volume_slider = true;
             }
         }
         
+        // Playlists are fixed after startup, so size the bounds once per event batch
+        const int playlist_count = static_cast<int>(state.playlists.size());
+        const int game_playlist_count = static_cast<int>(game_playlists.size());
+
         for (const auto& ev : input_events) {
             // Handle Menu button hold logic
             if (ev.action == InputAction::SETTINGS_MENU) {
                 if (ev.pressed) {
                     menu_button_held = true;
                     volume_changed_while_held = false;
-                    menu_press_time = std::chrono::steady_clock::now();
+                    menu_press_time = now;
                     state.show_volume_slider = false; // Don't show immediately
                 } else {
                     menu_button_held = false;
                     state.show_volume_slider = false; // Hide immediately
                     
-                    auto release_time = std::chrono::steady_clock::now();
-                    auto hold_duration = std::chrono::duration_cast<std::chrono::milliseconds>(release_time - menu_press_time).count();
+                    auto hold_duration = std::chrono::duration_cast<std::chrono::milliseconds>(now - menu_press_time).count();
                     
                     // Only toggle menu if we didn't change volume AND it was a short press
                     if (!volume_changed_while_held && hold_duration < 300) {
@@ -1001,33 +1132,11 @@ int main(int /* argc */, char* /* argv */[]) {
             // If Menu button is held, hijack Rotate/Up/Down for volume
             if (menu_button_held) {
                 if (ev.action == InputAction::ROTATE) {
-                    int vol_change = ev.delta * 5; // 5% increments
-                    state.master_volume += vol_change;
-                    
-                    // Clamp volume
-                    if (state.master_volume < 0) state.master_volume = 0;
-                    if (state.master_volume > 100) state.master_volume = 100;
-                    
-                    // Apply volume
-                    controller.set_system_volume(state.master_volume);
-                    
-                    // Show slider immediately on interaction and mark as changed
-                    state.show_volume_slider = true;
+                    adjust_master_volume(ev.delta);
                     volume_changed_while_held = true;
                 } else if (ev.action == InputAction::ROTATE_VERTICAL) {
                     // Invert delta for vertical axis (Up = -1 -> Volume Up)
-                    int vol_change = -ev.delta * 5; // 5% increments
-                    state.master_volume += vol_change;
-                    
-                    // Clamp volume
-                    if (state.master_volume < 0) state.master_volume = 0;
-                    if (state.master_volume > 100) state.master_volume = 100;
-                    
-                    // Apply volume
-                    controller.set_system_volume(state.master_volume);
-                    
-                    // Show slider immediately on interaction and mark as changed
-                    state.show_volume_slider = true;
+                    adjust_master_volume(-ev.delta);
                     volume_changed_while_held = true;
                 }
                 continue; // Consume event
@@ -1047,12 +1156,16 @@ int main(int /* argc */, char* /* argv */[]) {
             if (ev.pressed || is_navigation) { 
                 switch (ev.action) {
                     case InputAction::ROTATE_VERTICAL:
-                            if (ev.delta < 0) keyboard.navigate_up();
-                            else if (ev.delta > 0) keyboard.navigate_down();
+                            for (int step = 0; step < std::abs(ev.delta); ++step) {
+                                if (ev.delta < 0) keyboard.navigate_up();
+                                else keyboard.navigate_down();
+                            }
                             break;
                         case InputAction::ROTATE:
-                            if (ev.delta < 0) keyboard.navigate_left();
-                            else if (ev.delta > 0) keyboard.navigate_right();
+                            for (int step = 0; step < std::abs(ev.delta); ++step) {
+                                if (ev.delta < 0) keyboard.navigate_left();
+                                else keyboard.navigate_right();
+                            }
                             break;
                         case InputAction::SELECT: keyboard.select(); break;
                         case InputAction::PREV: // Backspace shortcut
@@ -1076,7 +1189,6 @@ int main(int /* argc */, char* /* argv */[]) {
                         case InputAction::ROTATE:
                         case InputAction::ROTATE_VERTICAL: {
                             // Navigate game browser
-                            int game_playlist_count = static_cast<int>(game_playlists.size());
                             int games_in_current_playlist = 0;
                             if (settings_menu.is_viewing_games_in_playlist()) {
                                 int playlist_idx = settings_menu.get_current_game_playlist_index();
@@ -1105,7 +1217,7 @@ int main(int /* argc */, char* /* argv */[]) {
 
                                 std::cout << "Game browser SELECT: playlist_idx=" << playlist_idx << ", game_idx=" << game_idx << std::endl;
 
-                                if (playlist_idx >= 0 && playlist_idx < static_cast<int>(game_playlists.size())) {
+                                if (playlist_idx >= 0 && playlist_idx < game_playlist_count) {
                                     const auto& playlist = game_playlists[playlist_idx];
                                     
                                     // Check if "Back" button is selected (last item)
@@ -1118,22 +1230,8 @@ int main(int /* argc */, char* /* argv */[]) {
                                         // Set loading state
                                         state.is_loading_game = true;
                                         
-                                        // Create progress callback to keep UI alive during launch
-                                        auto progress_callback = [&]() {
-                                            // Clear screen
-                                            glClearColor(0.0f, 0.0f, 0.0f, 1.0f);
-                                            // Render UI to show loading screen
-                                            ui_renderer.render_loading_overlay(state);
-                                            
-                                            // Swap buffers (renders to GBM surface)
-                                            egl.swap_buffers();
-                                            
-                                            // Present frame (flips DRM page)
-                                            present_frame();
-                                        };
-                                        
                                         // Launch the game
-                                        auto launch_result = controller.load_playlist_item(state, playlist, game_idx, playlist_directory, progress_callback);
+                                        auto launch_result = controller.load_playlist_item(state, playlist, game_idx, playlist_directory, game_launch_progress);
 
                                         // Reset loading state
                                         state.is_loading_game = false;
@@ -1150,16 +1248,16 @@ int main(int /* argc */, char* /* argv */[]) {
                                         std::cout << "Invalid game index: " << game_idx << " (max: " << playlist.items.size() << ")" << std::endl;
                                     }
                                 } else {
-                                    std::cout << "Invalid playlist index: " << playlist_idx << " (max: " << game_playlists.size() << ")" << std::endl;
+                                    std::cout << "Invalid playlist index: " << playlist_idx << " (max: " << game_playlist_count << ")" << std::endl;
                                 }
                             } else {
                                 // Enter selected playlist or go back
                                 int selected_playlist = settings_menu.get_game_browser_selected();
                                 
                                 // Check if "Back" button is selected (last item)
-                                if (selected_playlist == static_cast<int>(game_playlists.size())) {
+                                if (selected_playlist == game_playlist_count) {
                                     settings_menu.exit_game_browser();
-                                } else if (selected_playlist >= 0 && selected_playlist < static_cast<int>(game_playlists.size())) {
+                                } else if (selected_playlist >= 0 && selected_playlist < game_playlist_count) {
                                     settings_menu.enter_game_list(selected_playlist);
                                 }
                             }
@@ -1185,18 +1283,8 @@ int main(int /* argc */, char* /* argv */[]) {
                         if (section == ui::MenuSection::VIDEO_GAMES) {
                             // Go directly to game browser (skip submenu)
                             settings_menu.enter_game_browser();
-                        } else if (section == ui::MenuSection::DISPLAY) {
-                            settings_menu.enter_submenu(ui::MenuSection::DISPLAY);
-                        } else if (section == ui::MenuSection::AUDIO) {
-                            settings_menu.enter_submenu(ui::MenuSection::AUDIO);
-                        } else if (section == ui::MenuSection::SYSTEM) {
-                            settings_menu.enter_submenu(ui::MenuSection::SYSTEM);
-                        } else if (section == ui::MenuSection::WIFI) {
-                            settings_menu.enter_submenu(ui::MenuSection::WIFI);
-                        } else if (section == ui::MenuSection::WIFI_NETWORKS) {
-                            settings_menu.enter_submenu(ui::MenuSection::WIFI_NETWORKS);
-                        } else if (section == ui::MenuSection::INFO) {
-                            settings_menu.enter_submenu(ui::MenuSection::INFO);
+                        } else if (ui::SettingsMenuManager::has_submenu(section)) {
+                            settings_menu.enter_submenu(section);
                         } else if (section == ui::MenuSection::BROWSE_GAMES) {
                             // Enter game browser
                             settings_menu.enter_game_browser();
@@ -1233,16 +1321,12 @@ int main(int /* argc */, char* /* argv */[]) {
                 case InputAction::ROTATE_VERTICAL:
                     // Only allow navigation when UI is available
                     if (ui_available && !state.playlists.empty()) {
-                        if (ev.delta > 0) {
-                            state.selected_index = (state.selected_index + 1) % state.playlists.size();
-                        } else if (ev.delta < 0) {
-                            state.selected_index = (state.selected_index - 1 + state.playlists.size()) % state.playlists.size();
-                        }
+                        // delta may be more than one step after coalescing; wrap in both directions
+                        state.selected_index = ((state.selected_index + ev.delta) % playlist_count + playlist_count) % playlist_count;
                         
                         // If video is active, show UI briefly
                         if (state.video_active) {
-                            state.ui_visible_when_playing = true;
-                            state.ui_visibility_timer = 3.0; // Show for 3 seconds
+                            show_ui_briefly();
                         }
                     }
                     break;
@@ -1257,8 +1341,7 @@ int main(int /* argc */, char* /* argv */[]) {
                     
                     // If video is playing and UI is hidden, just show UI
                     if (state.video_active && !state.ui_visible_when_playing) {
-                        state.ui_visible_when_playing = true;
-                        state.ui_visibility_timer = 3.0; // Show for 3 seconds
+                        show_ui_briefly();
                         break; // Don't trigger selection yet
                     }
                     
@@ -1275,7 +1358,7 @@ int main(int /* argc */, char* /* argv */[]) {
                     state.ui_visible_when_playing = !state.ui_visible_when_playing;
                     
                     // Start fade animation (synchronized UI and audio)
-                    state.fade_start_time = std::chrono::steady_clock::now();
+                    state.fade_start_time = now;
                     state.fade_target_ui_visible = state.ui_visible_when_playing;
                     state.is_fading = true;
                 } else {
@@ -1286,7 +1369,7 @@ int main(int /* argc */, char* /* argv */[]) {
                     }
                     
                     state.is_switching_playlist = true;  // Set flag to prevent overlapping operations
-                    state.playlist_switch_start_time = std::chrono::steady_clock::now();  // Track when switch started
+                    state.playlist_switch_start_time = now;  // Track when switch started
                     
                     // First, update the playlist index BEFORE stopping to prevent reset
                     state.current_playlist_index = state.selected_index;
@@ -1300,23 +1383,12 @@ int main(int /* argc */, char* /* argv */[]) {
                     // Restore volume to 100% before stopping (in case UI was visible and volume was dimmed)
                     controller.set_volume(100.0);
                     
+                    // stop() blocks until the pipeline reaches NULL, which is when it
+                    // releases its buffers, so the new playlist can load straight away
                     controller.stop();
-                    // Wait longer to ensure stop completes and buffers are released
-                    // Increased delay to prevent race conditions and buffer export errors
-                    // The DRM driver needs time to release GEM buffers from previous video
-                    std::this_thread::sleep_for(std::chrono::milliseconds(200));
-                    
-                    // Verify that mpv actually stopped before proceeding
-                    // This prevents race conditions when loading new videos
-                    int retry_count = 0;
-                    const int max_retries = 10;
-                    while (controller.is_playing() && retry_count < max_retries) {
-                        std::this_thread::sleep_for(std::chrono::milliseconds(50));
-                        retry_count++;
-                    }
                     
                     if (controller.is_playing()) {
-                        std::cerr << "Warning: Video did not stop cleanly after " << (max_retries * 50) << "ms, proceeding anyway" << std::endl;
+                        std::cerr << "Warning: Video did not stop cleanly, proceeding anyway" << std::endl;
                     }
                     
                     // Then start the new playlist
@@ -1331,7 +1403,7 @@ int main(int /* argc */, char* /* argv */[]) {
                         
                         // When starting video, hide UI completely so video shows through fully
                         state.ui_visible_when_playing = false;
-                    } else if (!state.playlists.empty() && state.selected_index < static_cast<int>(state.playlists.size())) {
+                    } else if (!state.playlists.empty() && state.selected_index < playlist_count) {
                         state.master_shuffle_active = false; // Disable master shuffle for normal playlists
                         const auto& pl = state.playlists[state.selected_index];
                         if (!pl.items.empty() && pl.is_video_playlist()) {
@@ -1367,7 +1439,7 @@ int main(int /* argc */, char* /* argv */[]) {
                     if (state.selected_index == 0) {
                         std::cout << "Master Shuffle selected (from stopped)!" << std::endl;
                         state.is_switching_playlist = true;
-                        state.playlist_switch_start_time = std::chrono::steady_clock::now();
+                        state.playlist_switch_start_time = now;
                         state.master_shuffle_active = true;
                         
                         controller.play_random_global_video(state, playlist_directory);
@@ -1377,12 +1449,12 @@ int main(int /* argc */, char* /* argv */[]) {
                         
                         // Note: play_random_global_video handles loading, but doesn't return success/fail
                         // We assume it works or retries.
-                    } else if (!state.playlists.empty() && state.selected_index < static_cast<int>(state.playlists.size())) {
+                    } else if (!state.playlists.empty() && state.selected_index < playlist_count) {
                         state.master_shuffle_active = false; // Disable master shuffle for normal playlists
                         const auto& pl = state.playlists[state.selected_index];
                         if (!pl.items.empty() && pl.is_video_playlist()) {
                             state.is_switching_playlist = true;  // Set flag
-                            state.playlist_switch_start_time = std::chrono::steady_clock::now();
+                            state.playlist_switch_start_time = now;
 
                             // Load first item of playlist
                             auto load_result = controller.load_playlist_item(state, pl, 0, playlist_directory);
@@ -1474,14 +1546,19 @@ int main(int /* argc */, char* /* argv */[]) {
                // GStreamer remains alive after intro, just ensure proper state management
         sample_mode.update_state(state);
         
-        // Clear playlist switching flag if it's been stuck for too long (timeout safety)
-        // This prevents the flag from getting stuck if video fails to load or MPV gets into bad state
-        // Increased timeout to handle slow storage and MPV initialization issues
+        // Clear playlist switching flag if the new file failed to load. A pipeline error
+        // ends the switch as soon as update_state() drains it from the bus; the timeout
+        // only remains as a backstop for a pipeline that stalls without reporting one
+        // (slow storage, decoder hangs)
         if (state.is_switching_playlist) {
-            auto now = std::chrono::steady_clock::now();
             auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - state.playlist_switch_start_time);
-            if (elapsed.count() > 5000) {  // 5 second timeout (increased for robustness)
-                std::cerr << "CRITICAL: Playlist switch timeout after " << elapsed.count() << "ms - clearing flag and resetting state" << std::endl;
+            const bool load_failed = controller.has_error();
+            if (load_failed || elapsed.count() > 5000) {  // 5 second timeout (increased for robustness)
+                if (load_failed) {
+                    std::cerr << "Playlist switch failed after " << elapsed.count() << "ms - pipeline reported an error, clearing flag and resetting state" << std::endl;
+                } else {
+                    std::cerr << "CRITICAL: Playlist switch timeout after " << elapsed.count() << "ms - clearing flag and resetting state" << std::endl;
+                }
                 std::cerr << "  Debug info: video_active=" << state.video_active
                           << ", is_playing=" << controller.is_playing()
                           << ", current_playlist=" << state.current_playlist_index
@@ -1507,8 +1584,8 @@ int main(int /* argc */, char* /* argv */[]) {
             // Use multiple conditions to ensure reliable detection
             bool video_ended = false;
 
-            // Primary check: position near end
-            if (state.position >= state.duration - 0.5) {
+            // Primary check: end-of-stream from the pipeline, or position near end
+            if (controller.is_at_end() || state.position >= state.duration - 0.5) {
                 video_ended = true;
             }
 
@@ -1519,19 +1596,24 @@ int main(int /* argc */, char* /* argv */[]) {
 
             if (video_ended && !state.intro_fading_out) {
                 state.intro_fading_out = true;
-                state.intro_fade_out_start_time = std::chrono::steady_clock::now();
+                state.intro_fade_out_start_time = now;
+
+                // Volume from original_volume down to 0 in whole-percent steps, so the
+                // fade only indexes a table and the player only gets a write when the
+                // audible level actually changes
+                const int steps = INTRO_FADE_OUT_MS * 60 / 1000 + 1;
+                intro_fade_volume_lut.resize(steps);
+                for (int i = 0; i < steps; ++i) {
+                    intro_fade_volume_lut[i] = std::round(state.original_volume * (steps - 1 - i) / (steps - 1));
+                }
                 std::cout << "Intro video completed, starting fade-out..." << std::endl;
             }
         }
         
         // Handle intro video fade-out
         if (state.intro_fading_out) {
-            auto now = std::chrono::steady_clock::now();
             auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - state.intro_fade_out_start_time);
-            std::chrono::milliseconds fade_out_duration(300);  // 300ms fade-out duration
-
-
-            if (elapsed >= fade_out_duration) {
+            if (elapsed >= app::AppState::INTRO_FADE_OUT_DURATION) {
                 // Fade-out complete - stop video and start UI fade-in
                 state.intro_fading_out = false;
                 state.showing_intro_video = false;
@@ -1542,39 +1624,16 @@ int main(int /* argc */, char* /* argv */[]) {
 
                 std::cout << "Intro video stopped, transition to UI complete" << std::endl;
 
-                // Force immediate UI rendering by clearing and ensuring clean transition
-                glViewport(0, 0, mode.width, mode.height);
-                glClearColor(0.0f, 0.0f, 0.0f, 1.0f);
-                glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT);
-
-                // Force multiple buffer swaps to ensure the clear takes effect
-                for (int i = 0; i < 3; i++) {
-                    if (!egl.swap_buffers()) {
-                        std::cerr << "Failed to swap buffers during intro transition!" << std::endl;
-                    }
-                }
-
-                std::cout << "Intro transition complete - video stopped, renderer cleaned, screen cleared, UI ready" << std::endl;
+                // No clear-and-swap pass here: buffers only reach the screen through
+                // present_frame(), and this frame's normal render draws the UI fade-in
+                std::cout << "Intro transition complete - video stopped, UI ready" << std::endl;
                 
                 // Stop LED intro animation
                 gpio.stop_animation();
 
-                // Verify that video actually stopped before proceeding
-                int retry_count = 0;
-                const int max_retries = 20;  // Increased retries
-                while (controller.is_playing() && retry_count < max_retries) {
-                    std::this_thread::sleep_for(std::chrono::milliseconds(100));  // Longer delay
-                    controller.update_state(state);  // Update state to get current playing status
-                    retry_count++;
-                    if (retry_count % 5 == 0) {
-                        std::cout << "DEBUG: Waiting for video to stop... attempt " << retry_count << ", is_playing=" << controller.is_playing() << std::endl;
-                    }
-                }
-
+                // stop() returns once the pipeline is in NULL, so there is nothing to wait for
                 if (controller.is_playing()) {
-                    std::cerr << "Warning: Intro video did not stop cleanly after " << (max_retries * 100) << "ms, proceeding anyway" << std::endl;
-                } else {
-                    std::cout << "DEBUG: Intro video stopped successfully after " << retry_count << " attempts" << std::endl;
+                    std::cerr << "Warning: Intro video did not stop cleanly, proceeding anyway" << std::endl;
                 }
                 
                 // Force video_active to false immediately (don't wait for update_state)
@@ -1585,26 +1644,26 @@ int main(int /* argc */, char* /* argv */[]) {
                 state.current_item_index = -1;
                 
                 // Start fade-in animation for UI (from transparent to visible)
-                // Since there's no video active after intro, we fade in the UI
+                // Since there's no video active after intro, we fade in the UI.
+                // Fresh timestamp: stop() above blocks, and the fade must start from zero
                 state.fade_start_time = std::chrono::steady_clock::now();
                 state.fade_target_ui_visible = true;  // Fade to visible
                 state.is_fading = true;
                 
                 std::cout << "Intro video fade-out complete, fading in UI..." << std::endl;
             } else {
-                // Fade-out in progress - interpolate volume from 100% to 0%
-                float fade_progress = static_cast<float>(elapsed.count()) / static_cast<float>(fade_out_duration.count());
-                fade_progress = std::min(1.0f, std::max(0.0f, fade_progress));  // Clamp to [0, 1]
-                
-                // Fade volume from original_volume to 0
-                double current_volume = state.original_volume * (1.0 - fade_progress);
-                controller.set_volume(current_volume);
+                // Fade-out in progress - step volume from original_volume to 0
+                if (!intro_fade_volume_lut.empty()) {
+                    const size_t last = intro_fade_volume_lut.size() - 1;
+                    size_t idx = static_cast<size_t>(std::max<int64_t>(0, elapsed.count())) * last / INTRO_FADE_OUT_MS;
+                    controller.set_volume(intro_fade_volume_lut[std::min(idx, last)]);
+                }
             }
         }
         
-        // Clear fade flag when fade animation completes
+        // Clear fade flag when fade animation completes (UI only - volume stays constant
+        // during the menu overlay, no dimming)
         if (state.is_fading) {
-            auto now = std::chrono::steady_clock::now();
             auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - state.fade_start_time);
             if (elapsed >= state.fade_duration) {
                 state.is_fading = false;  // Fade complete
@@ -1613,9 +1672,10 @@ int main(int /* argc */, char* /* argv */[]) {
         
         // Auto-advance to next item in playlist when current video ends
         if (state.video_active && state.current_playlist_index >= 0 && state.current_item_index >= 0) {
-            // Check if video has ended (position >= duration with small tolerance)
+            // Check if video has ended (end-of-stream, or position >= duration with small tolerance)
             // Only advance once per item (check that we haven't already advanced from this item)
-            if (state.duration > 0.0 && state.position >= state.duration - 0.5) {
+            bool at_end = controller.is_at_end() || state.position >= state.duration - 0.5;
+            if (state.duration > 0.0 && at_end) {
                 // Video has ended - advance to next item
                 // Only advance if we haven't already advanced from this item
                 // Check that we haven't already advanced from this specific item index
@@ -1645,7 +1705,7 @@ int main(int /* argc */, char* /* argv */[]) {
             } else {
                 controller.load_next_item(state, playlist_directory);
             }
-                } else if (state.position >= state.duration - 0.5) {
+                } else {
                     if (!state.master_shuffle_active) {
                     std::cout << "NOT auto-advancing: item=" << state.current_item_index
                               << ", last_advanced=" << state.last_advanced_item_index
@@ -1664,18 +1724,6 @@ int main(int /* argc */, char* /* argv */[]) {
             }
         }
         
-        // Update fade animation (UI only - no audio changes)
-        if (state.is_fading && state.video_active) {
-            auto now = std::chrono::steady_clock::now();
-            auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - state.fade_start_time);
-            
-            if (elapsed >= state.fade_duration) {
-                // Fade complete
-                state.is_fading = false;
-            }
-            // Note: Volume stays constant during menu overlay (no dimming)
-        }
-        
         // Render video (if playing or loading)
         // gst_renderer.render() will only render when UPDATE_FRAME is set, improving performance
         // IMPORTANT: Render video first, then UI overlay on top
@@ -1704,6 +1752,28 @@ int main(int /* argc */, char* /* argv */[]) {
             last_render_decision = should_render_video;
         }
 
+        // While a video plays, the picture only changes when the decoder hands over a
+        // new frame, so a 24/30 fps video no longer forces a 60 Hz render + flip
+        bool video_frame_due = should_render_video ? gst_renderer.poll_frame() : state.video_active;
+
+        // Skip render + present when the screen would come out identical to the last
+        // frame: no input, no new video frame, no fade/transition, no menu or keyboard, and
+        // no time-driven CRT effects. The blinking selection indicator still gets a repaint
+        // each time its phase flips, and one extra frame is drawn after activity stops.
+        bool screen_animating = !input_events.empty() || video_frame_due ||
+                                state.showing_intro_video || state.intro_fading_out || state.is_fading ||
+                                state.is_switching_playlist || state.is_loading_game || state.show_volume_slider ||
+                                settings_menu.is_active() || settings_menu.is_closing() || keyboard.is_active() ||
+                                state.display_settings.interlacing_intensity > 0.0f ||
+                                state.display_settings.flicker_intensity > 0.0f;
+        int64_t blink_phase = Renderer::blink_phase(now);
+        if (!screen_animating && !redraw_pending && blink_phase == last_blink_phase) {
+            frame_count++;
+            wait_for_next_frame(frame_deadline);
+            continue;
+        }
+        last_blink_phase = blink_phase;
+        redraw_pending = screen_animating;
 
         
         // Clear screen in these cases:
@@ -1747,14 +1817,10 @@ int main(int /* argc */, char* /* argv */[]) {
         // Render video - gst will fill the entire framebuffer, so no need to clear if video is ready
         // This handles both intro video and regular video playback
         if (should_render_video) {
-            // Set letterbox mode based on display settings
+            // Set letterbox mode based on display settings. The renderer sets its own
+            // (4:3 in Modern TV mode) viewport for the video quad, so none is set here
             gst_renderer.set_letterbox_mode(use_letterbox);
             
-            // In Modern TV mode, set viewport to 4:3 content area for video
-            if (use_letterbox) {
-                glViewport(content_x, content_y, content_w, content_h);
-            }
-            
             gst_renderer.render();
         }
         
@@ -1791,7 +1857,18 @@ int main(int /* argc */, char* /* argv */[]) {
         }
         
         // Swap EGL buffers
-        if (!egl.swap_buffers()) {
+        // In Modern TV mode the video and every UI layer draw inside the 4:3 content area;
+        // the letterbox borders and bezel are redrawn identically until the bezel selection
+        // changes or the display is reset, so the content area is the damage rect
+        int presented_bezel = use_letterbox ? state.display_settings.bezel_index : -1;
+        bool content_only_damage = use_letterbox && !full_damage_pending &&
+                                   presented_bezel == last_presented_bezel;
+        full_damage_pending = false;
+        last_presented_bezel = presented_bezel;
+        bool swapped = content_only_damage
+            ? egl.swap_buffers_with_damage(content_x, content_y, content_w, content_h)
+            : egl.swap_buffers();
+        if (!swapped) {
             std::cerr << "Failed to swap buffers!" << std::endl;
         }
         
@@ -1808,8 +1885,13 @@ int main(int /* argc */, char* /* argv */[]) {
         frame_count++;
         
         // Frame rate limiting (target 60 FPS)
-        if (delta < 16) {
-            std::this_thread::sleep_for(std::chrono::milliseconds(16 - delta));
+        // A completed page flip already held us until vblank, and DRM completes at most
+        // one flip per vblank, so that is the limiter. The 60 FPS sleep is only the
+        // fallback for frames that went out via SetCrtc or whose flip wait timed out.
+        // Sleep in the kernel on the input fds so a button press wakes us
+        // immediately instead of waiting out the rest of the frame
+        if (!frame_ctx.vsync_paced) {
+            wait_for_next_frame(frame_deadline);
         }
     }
     
@@ -15,6 +15,7 @@ EglContext::EglContext()
     , config_(nullptr)
     , major_version_(0)
     , minor_version_(0)
+    , swap_with_damage_(nullptr)
 {
 }
 
@@ -79,6 +80,16 @@ bool EglContext::initialize(gbm_device* gbm_dev, gbm_surface* gbm_surf) {
         return false;
     }
 
+    // Resolve partial-update swap once (KHR and EXT variants share a signature)
+    const char* extensions = eglQueryString(display_, EGL_EXTENSIONS);
+    if (extensions && std::strstr(extensions, "EGL_KHR_swap_buffers_with_damage")) {
+        swap_with_damage_ = reinterpret_cast<PFNEGLSWAPBUFFERSWITHDAMAGEKHRPROC>(
+            eglGetProcAddress("eglSwapBuffersWithDamageKHR"));
+    } else if (extensions && std::strstr(extensions, "EGL_EXT_swap_buffers_with_damage")) {
+        swap_with_damage_ = reinterpret_cast<PFNEGLSWAPBUFFERSWITHDAMAGEKHRPROC>(
+            eglGetProcAddress("eglSwapBuffersWithDamageEXT"));
+    }
+
     return true;
 }
 
@@ -117,6 +128,19 @@ bool EglContext::swap_buffers() {
     return eglSwapBuffers(display_, surface_);
 }
 
+bool EglContext::swap_buffers_with_damage(int x, int y, int width, int height) {
+    if (surface_ == EGL_NO_SURFACE) {
+        return false;
+    }
+
+    if (!swap_with_damage_) {
+        return eglSwapBuffers(display_, surface_);
+    }
+
+    EGLint rect[4] = { x, y, width, height };
+    return swap_with_damage_(display_, surface_, rect, 1);
+}
+
 void EglContext::cleanup() {
     if (display_ != EGL_NO_DISPLAY) {
         eglMakeCurrent(display_, EGL_NO_SURFACE, EGL_NO_SURFACE, EGL_NO_CONTEXT);
@@ -133,6 +157,7 @@ void EglContext::cleanup() {
         
         eglTerminate(display_);
         display_ = EGL_NO_DISPLAY;
+        swap_with_damage_ = nullptr;
     }
 }
 
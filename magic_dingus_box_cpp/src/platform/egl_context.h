@@ -2,6 +2,7 @@
 
 #include <cstdint>
 #include <EGL/egl.h>
+#include <EGL/eglext.h>
 
 struct gbm_device;
 struct gbm_surface;
@@ -22,6 +23,10 @@ public:
     // Swap buffers (returns GBM bo handle for page flip)
     bool swap_buffers();
     
+    // Swap buffers, hinting that only the given rect (GL window coordinates) changed.
+    // Falls back to a full swap when EGL_KHR/EXT_swap_buffers_with_damage is unavailable.
+    bool swap_buffers_with_damage(int x, int y, int width, int height);
+    
     // Get the current GBM surface (for page flipping)
     gbm_surface* get_gbm_surface() const { return gbm_surface_; }
     
@@ -49,6 +54,7 @@ private:
     gbm_surface* gbm_surface_;
     int major_version_;
     int minor_version_;
+    PFNEGLSWAPBUFFERSWITHDAMAGEKHRPROC swap_with_damage_;
     
     bool choose_config();
 };
@@ -279,13 +279,49 @@ void GpioManager::set_led(int index, bool on) {
         return;
     }
     
+    if (led_values_[index] == static_cast<int>(on)) {
+        return;  // Line already holds this value
+    }
+    
     enum gpiod_line_value value = on ? GPIOD_LINE_VALUE_ACTIVE : GPIOD_LINE_VALUE_INACTIVE;
-    gpiod_line_request_set_value(impl_->output_request, gpio::LED_PINS[index], value);
+    if (gpiod_line_request_set_value(impl_->output_request, gpio::LED_PINS[index], value) == 0) {
+        led_values_[index] = static_cast<int>(on);
+    }
 }
 
 void GpioManager::set_all_leds(bool on) {
+    set_leds(on ? (1u << gpio::NUM_BUTTONS) - 1 : 0u);
+}
+
+void GpioManager::set_leds(unsigned int mask) {
+    if (!impl_->output_request) {
+        return;
+    }
+    
+    // Gather only the lines whose value changes and push them in a single
+    // request, rather than one set_value call per LED
+    unsigned int offsets[gpio::NUM_BUTTONS];
+    enum gpiod_line_value values[gpio::NUM_BUTTONS];
+    int changed[gpio::NUM_BUTTONS];
+    size_t count = 0;
     for (int i = 0; i < gpio::NUM_BUTTONS; i++) {
-        set_led(i, on);
+        int on = (mask >> i) & 1u;
+        if (led_values_[i] == on) {
+            continue;
+        }
+        offsets[count] = gpio::LED_PINS[i];
+        values[count] = on ? GPIOD_LINE_VALUE_ACTIVE : GPIOD_LINE_VALUE_INACTIVE;
+        changed[count] = i;
+        count++;
+    }
+    if (count == 0) {
+        return;  // Lines already hold these values
+    }
+    
+    if (gpiod_line_request_set_values_subset(impl_->output_request, count, offsets, values) == 0) {
+        for (size_t j = 0; j < count; j++) {
+            led_values_[changed[j]] = values[j] == GPIOD_LINE_VALUE_ACTIVE;
+        }
     }
 }
 
@@ -340,20 +376,16 @@ void GpioManager::update_intro_animation(uint64_t elapsed_ms) {
         uint64_t pair_phase = (elapsed_ms / 300) % 4;
         switch (pair_phase) {
             case 0: // LEDs 0,1 on
-                set_led(0, true); set_led(1, true);
-                set_led(2, false); set_led(3, false);
+                set_leds(0b0011);
                 break;
             case 1: // LEDs 2,3 on
-                set_led(0, false); set_led(1, false);
-                set_led(2, true); set_led(3, true);
+                set_leds(0b1100);
                 break;
             case 2: // LEDs 0,2 on (diagonals)
-                set_led(0, true); set_led(1, false);
-                set_led(2, true); set_led(3, false);
+                set_leds(0b0101);
                 break;
             case 3: // LEDs 1,3 on
-                set_led(0, false); set_led(1, true);
-                set_led(2, false); set_led(3, true);
+                set_leds(0b1010);
                 break;
         }
     }
@@ -371,17 +403,13 @@ void GpioManager::update_intro_animation(uint64_t elapsed_ms) {
             case 5: led_index = 1; break;
             default: led_index = 0; break;
         }
-        for (int i = 0; i < 4; i++) {
-            set_led(i, i == led_index);
-        }
+        set_leds(1u << led_index);
     }
     else if (elapsed_ms < 10000) {
         // Phase 5: All combinations cycling faster
         uint64_t combo = (elapsed_ms / 200) % 8;
-        set_led(0, combo & 1);
-        set_led(1, combo & 2);
-        set_led(2, combo & 4);
-        set_led(3, (combo + 1) & 1);  // Offset for variation
+        // LEDs 0-2 follow the low bits of combo; LED 3 is offset for variation
+        set_leds(static_cast<unsigned int>(combo & 7) | static_cast<unsigned int>(((combo + 1) & 1) << 3));
     }
     else {
         // Phase 6: Building finale - all on with pulse
@@ -443,6 +471,9 @@ void GpioManager::cleanup() {
             gpiod_line_request_release(impl_->output_request);
             impl_->output_request = nullptr;
         }
+        for (int& value : led_values_) {
+            value = -1;
+        }
         if (impl_->chip) {
             gpiod_chip_close(impl_->chip);
             impl_->chip = nullptr;
@@ -471,6 +502,7 @@ std::vector<InputEvent> GpioManager::poll() {
 
 void GpioManager::set_led(int /*index*/, bool /*on*/) {}
 void GpioManager::set_all_leds(bool /*on*/) {}
+void GpioManager::set_leds(unsigned int /*mask*/) {}
 void GpioManager::cleanup() { available_ = false; }
 uint64_t GpioManager::get_time_ms() const { return 0; }
 int GpioManager::read_line(int /*gpio*/) { return 1; }
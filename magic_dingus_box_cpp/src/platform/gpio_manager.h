@@ -58,6 +58,7 @@ public:
     // LED control
     void set_led(int index, bool on);  // index 0-3
     void set_all_leds(bool on);
+    void set_leds(unsigned int mask);  // bit i = LED i; changed lines are written in one request
     
     // LED Animation methods
     // Run intro dance pattern - call repeatedly from main loop during intro
@@ -96,6 +97,10 @@ private:
     // Encoder state
     int last_clk_state_ = 1;
     
+    // Last value written to each LED line (-1 = unknown). The intro animation
+    // runs every frame, so only actual changes are pushed to the GPIO chip
+    int led_values_[gpio::NUM_BUTTONS] = {-1, -1, -1, -1};
+    
     // Restart button state
     ButtonState restart_btn_state_;
     
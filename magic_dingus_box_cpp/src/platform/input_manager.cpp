@@ -4,6 +4,9 @@
 #include <linux/input-event-codes.h>
 #include <linux/input.h>
 #include <fcntl.h>
+#include <poll.h>
+#include <sys/epoll.h>
+#include <sys/ioctl.h>
 #include <unistd.h>
 #include <dirent.h>
 #include <cstring>
@@ -35,6 +38,28 @@ struct InputManager::Device {
     }
 };
 
+// Have the kernel drop event codes poll() never acts on: scan codes (EV_MSC, sent
+// alongside every key press) and axes other than the stick X/Y, right stick X and
+// d-pad hat (triggers, right stick Y, motion sensors). They then neither wake the
+// main loop nor get read and thrown away one at a time. Best effort: kernels
+// without EVIOCSMASK keep delivering everything, which poll() already ignores.
+static void mask_unused_events(int fd) {
+#ifdef EVIOCSMASK
+    unsigned char msc_codes[MSC_MAX / 8 + 1] = {};
+    struct input_mask msc_mask = {EV_MSC, sizeof(msc_codes), reinterpret_cast<uintptr_t>(msc_codes)};
+    ioctl(fd, EVIOCSMASK, &msc_mask);
+
+    unsigned char abs_codes[ABS_MAX / 8 + 1] = {};
+    for (int code : {ABS_X, ABS_Y, ABS_RX, ABS_HAT0X, ABS_HAT0Y}) {
+        abs_codes[code / 8] |= static_cast<unsigned char>(1u << (code % 8));
+    }
+    struct input_mask abs_mask = {EV_ABS, sizeof(abs_codes), reinterpret_cast<uintptr_t>(abs_codes)};
+    ioctl(fd, EVIOCSMASK, &abs_mask);
+#else
+    (void)fd;
+#endif
+}
+
 InputManager::InputManager()
     : last_rotate_dir_(0)
     , last_rotate_time_(0.0)
@@ -45,14 +70,19 @@ InputManager::~InputManager() {
     cleanup();
 }
 
+void InputManager::wake_controllers() {
+    // One trigger covers both node types (repeated --sysname-match is OR'ed), and
+    // settle waits for udev to finish instead of sleeping a fixed interval
+    std::system("sudo udevadm trigger --action=change --sysname-match='js*' --sysname-match='event*' 2>/dev/null; "
+                "udevadm settle --timeout=1 2>/dev/null || true");
+}
+
 bool InputManager::initialize() {
     std::cout << "  Opening input devices..." << std::endl;
     
     // CRITICAL: Wake up controller before opening devices
     // Controller may be in sleep mode and needs to be triggered
-    std::system("sudo udevadm trigger --action=change --sysname-match=js* 2>/dev/null || true");
-    std::system("sudo udevadm trigger --action=change --sysname-match=event* 2>/dev/null || true");
-    std::this_thread::sleep_for(std::chrono::milliseconds(200));
+    wake_controllers();
     
     if (!open_joystick_devices()) {
         std::cerr << "Warning: No joystick devices found" << std::endl;
@@ -64,6 +94,20 @@ bool InputManager::initialize() {
         std::cout << "  No dedicated rotary encoder device found (will check later)" << std::endl;
     }
     
+    // One epoll set over every opened device, shared by poll() and wait_for_input()
+    if (epoll_fd_ >= 0) {
+        close(epoll_fd_);
+    }
+    epoll_fd_ = epoll_create1(EPOLL_CLOEXEC);
+    if (epoll_fd_ >= 0) {
+        for (auto& device : devices_) {
+            struct epoll_event watch = {};
+            watch.events = EPOLLIN;
+            watch.data.ptr = device.get();
+            epoll_ctl(epoll_fd_, EPOLL_CTL_ADD, device->fd, &watch);
+        }
+    }
+    
     // CRITICAL: Read from controller to wake it up after opening
     // This ensures the controller is active and generating events
     for (auto& device : devices_) {
@@ -133,6 +177,7 @@ bool InputManager::open_joystick_devices() {
             if (grab_rc < 0) {
                 std::cerr << "  Warning: Could not grab device " << device->name << std::endl;
             }
+            mask_unused_events(fd);
             
             std::string device_name = device->name;  // Save name before move
             devices_.push_back(std::move(device));
@@ -199,6 +244,7 @@ bool InputManager::open_keyboard_devices() {
             if (grab_rc < 0) {
                 std::cerr << "  Warning: Could not grab device " << device->name << std::endl;
             }
+            mask_unused_events(fd);
             
             std::string device_name = device->name;  // Save name before move
             devices_.push_back(std::move(device));
@@ -256,6 +302,7 @@ bool InputManager::open_rotary_devices() {
             if (grab_rc < 0) {
                  std::cerr << "  Warning: Could not grab rotary device " << device->name << std::endl;
             }
+            mask_unused_events(fd);
             
             std::string device_name = device->name;
             devices_.push_back(std::move(device));
@@ -273,129 +320,257 @@ bool InputManager::open_rotary_devices() {
 std::vector<InputEvent> InputManager::poll() {
     std::vector<InputEvent> events;
     
+    if (epoll_fd_ >= 0) {
+        // Only devices with pending events are read, so an idle frame costs a single
+        // epoll_wait instead of a read per device. Anything beyond the batch stays
+        // readable (level-triggered) and is picked up next frame.
+        struct epoll_event ready[16];
+        int n = epoll_wait(epoll_fd_, ready, 16, 0);
+        for (int i = 0; i < n; ++i) {
+            Device* device = static_cast<Device*>(ready[i].data.ptr);
+            drain_device(*device, events);
+            // A hung-up fd stays ready forever; drop it so it can't keep waking the loop
+            if (ready[i].events & (EPOLLHUP | EPOLLERR)) {
+                remove_device(device);
+            }
+        }
+        return events;
+    }
+    
     for (auto& device : devices_) {
-        struct input_event ev;
-        int rc = libevdev_next_event(device->dev, LIBEVDEV_READ_FLAG_NORMAL, &ev);
+        drain_device(*device, events);
+    }
+    
+    return events;
+}
+
+void InputManager::remove_device(Device* device) {
+    auto it = std::find_if(devices_.begin(), devices_.end(),
+                           [device](const std::unique_ptr<Device>& d) { return d.get() == device; });
+    if (it == devices_.end()) {
+        return;
+    }
+    std::cout << "InputManager: Device disconnected: " << device->name << std::endl;
+    if (epoll_fd_ >= 0) {
+        epoll_ctl(epoll_fd_, EPOLL_CTL_DEL, device->fd, nullptr);
+    }
+    devices_.erase(it);  // ~Device frees libevdev and closes the fd
+}
+
+void InputManager::drain_device(Device& device, std::vector<InputEvent>& events) {
+    struct input_event ev;
+    int rc = libevdev_next_event(device.dev, LIBEVDEV_READ_FLAG_NORMAL, &ev);
+    
+    while (rc == LIBEVDEV_READ_STATUS_SYNC || rc == LIBEVDEV_READ_STATUS_SUCCESS) {
+        InputEvent input_ev;
+        input_ev.action = InputAction::NONE;
+        input_ev.delta = 0;
+        input_ev.pressed = false;
         
-        while (rc == LIBEVDEV_READ_STATUS_SYNC || rc == LIBEVDEV_READ_STATUS_SUCCESS) {
-            InputEvent input_ev;
-            input_ev.action = InputAction::NONE;
-            input_ev.delta = 0;
-            input_ev.pressed = false;
+        if (rc == LIBEVDEV_READ_STATUS_SYNC) {
+            // Handle sync events
+            std::cout << "InputManager: SYNC event received" << std::endl;
+            rc = libevdev_next_event(device.dev, LIBEVDEV_READ_FLAG_NORMAL, &ev);
+            continue;
+        }
+        
+        if (ev.type == EV_KEY) {
+            // Button/key press
+            input_ev.pressed = (ev.value == 1);
             
-            if (rc == LIBEVDEV_READ_STATUS_SYNC) {
-                // Handle sync events
-                std::cout << "InputManager: SYNC event received" << std::endl;
-                rc = libevdev_next_event(device->dev, LIBEVDEV_READ_FLAG_NORMAL, &ev);
-                continue;
+            // Handle keyboard arrow keys for rotation (before other mappings)
+            if (device.is_keyboard) {
+                if (ev.code == KEY_LEFT && ev.value == 1) {
+                    input_ev.action = InputAction::ROTATE;
+                    input_ev.delta = -1;
+                } else if (ev.code == KEY_RIGHT && ev.value == 1) {
+                    input_ev.action = InputAction::ROTATE;
+                    input_ev.delta = 1;
+                } else if (ev.code == KEY_UP && ev.value == 1) {
+                    input_ev.action = InputAction::ROTATE_VERTICAL;
+                    input_ev.delta = -1;
+                } else if (ev.code == KEY_DOWN && ev.value == 1) {
+                    input_ev.action = InputAction::ROTATE_VERTICAL;
+                    input_ev.delta = 1;
+                } else {
+                    input_ev.action = map_key_to_action(ev.code);
+                }
+            } else if (device.is_joystick) {
+                // Handle D-pad buttons (common on some controllers)
+                if (ev.code == BTN_DPAD_UP && ev.value == 1) {
+                    input_ev.action = InputAction::ROTATE_VERTICAL;
+                    input_ev.delta = -1;
+                } else if (ev.code == BTN_DPAD_DOWN && ev.value == 1) {
+                    input_ev.action = InputAction::ROTATE_VERTICAL;
+                    input_ev.delta = 1;
+                } else if (ev.code == BTN_DPAD_LEFT && ev.value == 1) {
+                    input_ev.action = InputAction::ROTATE;
+                    input_ev.delta = -1;
+                } else if (ev.code == BTN_DPAD_RIGHT && ev.value == 1) {
+                    input_ev.action = InputAction::ROTATE;
+                    input_ev.delta = 1;
+                } else {
+                    input_ev.action = map_button_to_action(ev.code, input_ev.pressed);
+                }
             }
-            
-            if (ev.type == EV_KEY) {
-                // Button/key press
-                input_ev.pressed = (ev.value == 1);
+        } else if (ev.type == EV_ABS && device.is_joystick) {
+            // Handle DPad hat switches (ABS_HAT0X, ABS_HAT0Y)
+            if (ev.code == ABS_HAT0Y) {
+                // DPad Up/Down for ROTATE_VERTICAL (matching Python: DPad Up = -1, Down = +1)
+                if (ev.value == -1) {  // Up
+                    input_ev.action = InputAction::ROTATE_VERTICAL;
+                    input_ev.delta = -1;
+                } else if (ev.value == 1) {  // Down
+                    input_ev.action = InputAction::ROTATE_VERTICAL;
+                    input_ev.delta = 1;
+                }
+            } else if (ev.code == ABS_HAT0X) {
+                // DPad Left/Right for ROTATE
+                if (ev.value == -1) {  // Left
+                    input_ev.action = InputAction::ROTATE;
+                    input_ev.delta = -1;
+                } else if (ev.value == 1) {  // Right
+                    input_ev.action = InputAction::ROTATE;
+                    input_ev.delta = 1;
+                }
+            } else if (ev.code == ABS_Y) {
+                // Analog Stick Y for ROTATE_VERTICAL
+                // Deadzone check (simple)
+                if (ev.value < -16000) { // Up
+                     input_ev.action = InputAction::ROTATE_VERTICAL;
+                     input_ev.delta = -1;
+                } else if (ev.value > 16000) { // Down
+                     input_ev.action = InputAction::ROTATE_VERTICAL;
+                     input_ev.delta = 1;
+                }
+            } else {
+                // Regular axis movement
+                input_ev.action = map_axis_to_action(ev.code, ev.value);
+                // Set delta for ROTATE action
+                if (input_ev.action == InputAction::ROTATE) {
+                    input_ev.delta = (ev.value > 0) ? 1 : (ev.value < 0) ? -1 : 0;
+                }
+            }
+        } else if (ev.type == EV_REL) {
+            // Handle Rotary Encoder (REL_X)
+            if (ev.code == REL_X) {
+                // Software Accumulator to fix sensitivity and "skipping"
+                // Require accumulating 4 units (either magnitude 4 or 4 events of 1) to trigger 1 step
+                static int accumulator = 0;
+                const int THRESHOLD = 4; 
+                
+                accumulator += ev.value;
                 
-                // Handle keyboard arrow keys for rotation (before other mappings)
-                if (device->is_keyboard) {
-                    if (ev.code == KEY_LEFT && ev.value == 1) {
-                        input_ev.action = InputAction::ROTATE;
-                        input_ev.delta = -1;
-                    } else if (ev.code == KEY_RIGHT && ev.value == 1) {
-                        input_ev.action = InputAction::ROTATE;
-                        input_ev.delta = 1;
-                    } else if (ev.code == KEY_UP && ev.value == 1) {
-                        input_ev.action = InputAction::ROTATE_VERTICAL;
-                        input_ev.delta = -1;
-                    } else if (ev.code == KEY_DOWN && ev.value == 1) {
-                        input_ev.action = InputAction::ROTATE_VERTICAL;
-                        input_ev.delta = 1;
-                    } else {
-                        input_ev.action = map_key_to_action(ev.code);
-                    }
-                } else if (device->is_joystick) {
-                    // Handle D-pad buttons (common on some controllers)
-                    if (ev.code == BTN_DPAD_UP && ev.value == 1) {
-                        input_ev.action = InputAction::ROTATE_VERTICAL;
-                        input_ev.delta = -1;
-                    } else if (ev.code == BTN_DPAD_DOWN && ev.value == 1) {
-                        input_ev.action = InputAction::ROTATE_VERTICAL;
-                        input_ev.delta = 1;
-                    } else if (ev.code == BTN_DPAD_LEFT && ev.value == 1) {
-                        input_ev.action = InputAction::ROTATE;
-                        input_ev.delta = -1;
-                    } else if (ev.code == BTN_DPAD_RIGHT && ev.value == 1) {
-                        input_ev.action = InputAction::ROTATE;
-                        input_ev.delta = 1;
-                    } else {
-                        input_ev.action = map_button_to_action(ev.code, input_ev.pressed);
-                    }
+                if (std::abs(accumulator) >= THRESHOLD) {
+                    input_ev.action = InputAction::ROTATE;
+                    // INVERT direction: positive accumulator -> negative delta
+                    // (User requested inversion)
+                    input_ev.delta = (accumulator > 0) ? -1 : 1;
+                    accumulator = 0;
                 }
-            } else if (ev.type == EV_ABS && device->is_joystick) {
-                // Handle DPad hat switches (ABS_HAT0X, ABS_HAT0Y)
-                if (ev.code == ABS_HAT0Y) {
-                    // DPad Up/Down for ROTATE_VERTICAL (matching Python: DPad Up = -1, Down = +1)
-                    if (ev.value == -1) {  // Up
-                        input_ev.action = InputAction::ROTATE_VERTICAL;
-                        input_ev.delta = -1;
-                    } else if (ev.value == 1) {  // Down
-                        input_ev.action = InputAction::ROTATE_VERTICAL;
-                        input_ev.delta = 1;
-                    }
-                } else if (ev.code == ABS_HAT0X) {
-                    // DPad Left/Right for ROTATE
-                    if (ev.value == -1) {  // Left
-                        input_ev.action = InputAction::ROTATE;
-                        input_ev.delta = -1;
-                    } else if (ev.value == 1) {  // Right
-                        input_ev.action = InputAction::ROTATE;
-                        input_ev.delta = 1;
-                    }
-                } else if (ev.code == ABS_Y) {
-                    // Analog Stick Y for ROTATE_VERTICAL
-                    // Deadzone check (simple)
-                    if (ev.value < -16000) { // Up
-                         input_ev.action = InputAction::ROTATE_VERTICAL;
-                         input_ev.delta = -1;
-                    } else if (ev.value > 16000) { // Down
-                         input_ev.action = InputAction::ROTATE_VERTICAL;
-                         input_ev.delta = 1;
-                    }
+            }
+        }
+        
+        if (input_ev.action != InputAction::NONE) {
+            events.push_back(input_ev);
+        }
+        
+        rc = libevdev_next_event(device.dev, LIBEVDEV_READ_FLAG_NORMAL, &ev);
+    }
+}
+
+void InputManager::coalesce_rotations(std::vector<InputEvent>& events) {
+    if (events.size() < 2) {
+        return;
+    }
+    
+    size_t out = 0;
+    for (size_t i = 0; i < events.size(); ++i) {
+        const InputEvent& ev = events[i];
+        bool is_rotation = (ev.action == InputAction::ROTATE || ev.action == InputAction::ROTATE_VERTICAL);
+        if (out > 0 && is_rotation && events[out - 1].action == ev.action) {
+            events[out - 1].delta += ev.delta;
+            // Opposite steps cancelled out; drop the run rather than emit a no-op rotation
+            if (events[out - 1].delta == 0) {
+                --out;
+            }
+            continue;
+        }
+        events[out++] = ev;
+    }
+    events.resize(out);
+}
+
+bool InputManager::wait_for_input(int timeout_ms) {
+    if (timeout_ms <= 0) {
+        return false;
+    }
+    
+    if (epoll_fd_ >= 0) {
+        // Hung-up devices are dropped rather than counted as input, then the wait
+        // resumes for what is left of the timeout
+        const auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(timeout_ms);
+        while (!devices_.empty()) {
+            struct epoll_event ready[16];
+            int n = epoll_wait(epoll_fd_, ready, 16, timeout_ms);
+            bool readable = false;
+            bool removed = false;
+            for (int i = 0; i < n; ++i) {
+                if (ready[i].events & (EPOLLHUP | EPOLLERR)) {
+                    remove_device(static_cast<Device*>(ready[i].data.ptr));
+                    removed = true;
                 } else {
-                    // Regular axis movement
-                    input_ev.action = map_axis_to_action(ev.code, ev.value);
-                    // Set delta for ROTATE action
-                    if (input_ev.action == InputAction::ROTATE) {
-                        input_ev.delta = (ev.value > 0) ? 1 : (ev.value < 0) ? -1 : 0;
-                    }
-                }
-            } else if (ev.type == EV_REL) {
-                // Handle Rotary Encoder (REL_X)
-                if (ev.code == REL_X) {
-                    // Software Accumulator to fix sensitivity and "skipping"
-                    // Require accumulating 4 units (either magnitude 4 or 4 events of 1) to trigger 1 step
-                    static int accumulator = 0;
-                    const int THRESHOLD = 4; 
-                    
-                    accumulator += ev.value;
-                    
-                    if (std::abs(accumulator) >= THRESHOLD) {
-                        input_ev.action = InputAction::ROTATE;
-                        // INVERT direction: positive accumulator -> negative delta
-                        // (User requested inversion)
-                        input_ev.delta = (accumulator > 0) ? -1 : 1;
-                        accumulator = 0;
-                    }
+                    readable = true;
                 }
             }
-            
-            if (input_ev.action != InputAction::NONE) {
-                events.push_back(input_ev);
+            if (readable || !removed) {
+                return readable;
+            }
+            timeout_ms = static_cast<int>(std::chrono::duration_cast<std::chrono::milliseconds>(
+                deadline - std::chrono::steady_clock::now()).count());
+            if (timeout_ms <= 0) {
+                return false;
             }
-            
-            rc = libevdev_next_event(device->dev, LIBEVDEV_READ_FLAG_NORMAL, &ev);
         }
     }
     
-    return events;
+    // Without epoll: poll() every device, treating a hung-up fd the same way
+    const auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(timeout_ms);
+    while (!devices_.empty()) {
+        std::vector<struct pollfd> fds;
+        fds.reserve(devices_.size());
+        for (auto& device : devices_) {
+            fds.push_back({device->fd, POLLIN, 0});
+        }
+        
+        if (::poll(fds.data(), fds.size(), timeout_ms) <= 0) {
+            return false;
+        }
+        
+        std::vector<Device*> dead;
+        bool readable = false;
+        for (size_t i = 0; i < fds.size(); ++i) {
+            if (fds[i].revents & (POLLHUP | POLLERR | POLLNVAL)) {
+                dead.push_back(devices_[i].get());
+            } else if (fds[i].revents & POLLIN) {
+                readable = true;
+            }
+        }
+        for (Device* device : dead) {
+            remove_device(device);
+        }
+        if (readable || dead.empty()) {
+            return readable;
+        }
+        timeout_ms = static_cast<int>(std::chrono::duration_cast<std::chrono::milliseconds>(
+            deadline - std::chrono::steady_clock::now()).count());
+        if (timeout_ms <= 0) {
+            return false;
+        }
+    }
+    
+    std::this_thread::sleep_for(std::chrono::milliseconds(timeout_ms));
+    return false;
 }
 
 InputAction InputManager::map_button_to_action(uint16_t code, bool pressed) {
@@ -501,6 +676,10 @@ void InputManager::cleanup() {
             libevdev_grab(device->dev, LIBEVDEV_UNGRAB);
         }
     }
+    if (epoll_fd_ >= 0) {
+        close(epoll_fd_);
+        epoll_fd_ = -1;
+    }
     devices_.clear();
 }
 
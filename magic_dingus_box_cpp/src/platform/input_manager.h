@@ -43,12 +43,32 @@ public:
     // Poll for input events (non-blocking)
     std::vector<InputEvent> poll();
     
+    // Merge runs of adjacent ROTATE / ROTATE_VERTICAL events into one event with
+    // the summed delta, so a burst from a fast spin is handled once per frame.
+    // Runs that cancel out to a zero delta are removed.
+    static void coalesce_rotations(std::vector<InputEvent>& events);
+    
+    // Block until an input device becomes readable or timeout_ms elapses.
+    // Returns true if input is pending.
+    bool wait_for_input(int timeout_ms);
+    
+    // Wake sleeping controllers by re-triggering udev for joystick/event nodes,
+    // returning once udev has processed the events
+    static void wake_controllers();
+    
     // Cleanup
     void cleanup();
 
 private:
     struct Device;
     std::vector<std::unique_ptr<Device>> devices_;
+    int epoll_fd_ = -1;  // Watches every device fd; rebuilt by initialize(), closed by cleanup()
+    
+    // Read and translate everything pending on one device
+    void drain_device(Device& device, std::vector<InputEvent>& events);
+    
+    // Stop watching and close a device whose fd hung up (e.g. unplugged controller)
+    void remove_device(Device* device);
     
     bool open_joystick_devices();
     bool open_keyboard_devices();
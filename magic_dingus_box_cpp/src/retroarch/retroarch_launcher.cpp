@@ -1,7 +1,10 @@
 #include "retroarch_launcher.h"
 #include "../utils/config.h"
+#include "../utils/logger.h"
+#include "../utils/process_utils.h"
 #include <iostream>
 #include <cstdlib>
+#include <csignal>
 #include <cstring>
 #include <unistd.h>
 #include <sys/types.h>
@@ -12,18 +15,22 @@
 #include <chrono>
 #include <chrono>
 #include <fstream>
+#include <future>
 #include <vector>
 #include <errno.h>
 #include <ctime>
 #include <sstream>
-#include <regex>
 #include <cmath>
+#include <json/json.h>
 
 namespace fs = std::filesystem;
 
 namespace retroarch {
 
 namespace {
+    // Bump when the cached ALSA device format or selection rules change
+    constexpr int ALSA_CACHE_VERSION = 1;
+
     struct ControllerMapping {
         // Metadata
         std::string name = "Default";
@@ -372,6 +379,27 @@ namespace {
         }
         return map;
     }
+
+    // chmod +x without spawning a shell
+    void make_executable(const std::string& path) {
+        std::error_code ec;
+        fs::permissions(path, fs::perms::owner_exec | fs::perms::group_exec | fs::perms::others_exec,
+                        fs::perm_options::add, ec);
+        if (ec) {
+            std::cerr << "Warning: Could not make " << path << " executable: " << ec.message() << std::endl;
+        }
+    }
+
+    // Convert system volume (0-100) to RetroArch dB format
+    // RetroArch uses decibels: 0 dB = 100%, negative dB = quieter
+    // Formula: dB = 20 * log10(volume_percent / 100), clamped to -60 dB .. 0 dB
+    float volume_percent_to_db(int system_volume_percent) {
+        float volume_decimal = system_volume_percent / 100.0f;
+        float volume_db = (volume_decimal > 0.001f) ? (20.0f * log10f(volume_decimal)) : -60.0f;
+        if (volume_db > 0.0f) volume_db = 0.0f;
+        if (volume_db < -60.0f) volume_db = -60.0f;
+        return volume_db;
+    }
 }
 
 RetroArchLauncher::RetroArchLauncher() : retroarch_available_(false) {
@@ -490,7 +518,8 @@ bool RetroArchLauncher::launch_drm(const GameLaunchInfo& game_info, int system_v
         retroarch_cmd += " \"" + escaped_arg + "\"";
     }
 
-    // Detect ALSA device
+    // Detect ALSA device (after any startup prefetch, which fills the same cache)
+    if (alsa_prefetch_.valid()) alsa_prefetch_.get();
     std::string alsa_device = detect_alsa_device();
 
     // Create a simple launcher script (persistent for debugging)
@@ -557,14 +586,6 @@ bool RetroArchLauncher::launch_drm(const GameLaunchInfo& game_info, int system_v
             script_file << "    echo 'Launcher: Created autoconfig file' >> /tmp/retroarch_launcher.log\n";
             script_file << "fi\n";
             script_file << "# CRITICAL: Audio settings will be in the main config file (simpler approach)\n";
-            // Get service name for restart
-            const char* service_name_env = std::getenv("MAGIC_UI_SERVICE");
-            if (!service_name_env) {
-                service_name_env = "magic-dingus-box-cpp.service";
-            }
-
-            // Service name already obtained above
-
             script_file << "echo \"$(date): Launcher: Starting RetroArch launcher script\" >> /tmp/retroarch_launcher.log\n";
             script_file << "echo \"$(date): Launcher: Detected ALSA device: " << alsa_device << "\" >> /tmp/retroarch_launcher.log\n";
             script_file << "echo \"$(date): Launcher: GStreamer cleanup completed\" >> /tmp/retroarch_launcher.log\n";
@@ -573,8 +594,13 @@ bool RetroArchLauncher::launch_drm(const GameLaunchInfo& game_info, int system_v
             script_file << "echo 'Launcher: DRM master access already dropped by main service, launching RetroArch...'\n";
             script_file << "echo 'Launcher: Creating RetroArch config...'\n";
             script_file << "echo 'Launcher: ALSA device: " << alsa_device << "'\n";
-            script_file << "echo 'Launcher: aplay -l output:' >> /tmp/retroarch_launcher.log\n";
-            script_file << "aplay -l >> /tmp/retroarch_launcher.log 2>&1 || true\n";
+            // /proc/asound/pcm lists the same playback devices as `aplay -l` without
+            // opening every card's control device on each launch. The listing is only
+            // diagnostics, so the extra process is skipped unless debug logging is on
+            if (logging::is_enabled(spdlog::level::debug)) {
+                script_file << "echo 'Launcher: ALSA PCM devices:' >> /tmp/retroarch_launcher.log\n";
+                script_file << "cat /proc/asound/pcm >> /tmp/retroarch_launcher.log 2>&1 || true\n";
+            }
             
             // Create Core Options file
             script_file << "cat > /tmp/retroarch_core_options.cfg << 'OPTS'\n";
@@ -674,15 +700,7 @@ bool RetroArchLauncher::launch_drm(const GameLaunchInfo& game_info, int system_v
             script_file << "audio_device = \"" << alsa_device << "\"\n";
             script_file << "audio_enable = \"true\"\n";
             script_file << "audio_mute_enable = \"false\"\n";
-            // Convert system volume (0-100) to RetroArch dB format
-            // RetroArch uses decibels: 0 dB = 100%, negative dB = quieter
-            // Formula: dB = 20 * log10(volume_percent / 100)
-            // For safety, clamp to reasonable range: -60 dB to 0 dB
-            float volume_decimal = system_volume_percent / 100.0f;
-            float volume_db = (volume_decimal > 0.001f) ? (20.0f * log10f(volume_decimal)) : -60.0f;
-            // Clamp to valid range
-            if (volume_db > 0.0f) volume_db = 0.0f;
-            if (volume_db < -60.0f) volume_db = -60.0f;
+            float volume_db = volume_percent_to_db(system_volume_percent);
             // Apply user's game volume offset (e.g., -3dB, -6dB, -12dB)
             float final_volume_db = volume_db + volume_offset_db;
             if (final_volume_db < -60.0f) final_volume_db = -60.0f;
@@ -876,9 +894,8 @@ bool RetroArchLauncher::launch_drm(const GameLaunchInfo& game_info, int system_v
             script_file << "# The manual test works because the USER presses buttons, waking the controller\n";
             script_file << "# We need to simulate this by actually reading from the controller\n";
             script_file << "echo 'Launcher: Waking up controller...' >> /tmp/retroarch_launcher.log\n";
-            script_file << "# Trigger udev events to ensure controller is active\n";
-            script_file << "sudo udevadm trigger --action=change --sysname-match=js* 2>/dev/null || true\n";
-            script_file << "sudo udevadm trigger --action=change --sysname-match=event* 2>/dev/null || true\n";
+            script_file << "# Trigger udev events to ensure controller is active (one trigger covers both device kinds)\n";
+            script_file << "sudo udevadm trigger --action=change --sysname-match='js*' --sysname-match='event*' 2>/dev/null || true\n";
             script_file << "udevadm settle --timeout=2 2>/dev/null || true\n";
             script_file << "# CRITICAL: Actually read from controller to wake it (like user pressing buttons)\n";
             script_file << "# This simulates the manual test where user interaction wakes the controller\n";
@@ -906,8 +923,7 @@ bool RetroArchLauncher::launch_drm(const GameLaunchInfo& game_info, int system_v
             script_file << "    echo 'Launcher: WARNING - Autoconfig file missing!' >> /tmp/retroarch_launcher.log\n";
             script_file << "fi\n";
             script_file << "# CRITICAL: Ensure udev has processed controller events before RetroArch starts\n";
-            script_file << "sudo udevadm trigger --action=change --sysname-match=js* 2>/dev/null || true\n";
-            script_file << "sudo udevadm trigger --action=change --sysname-match=event* 2>/dev/null || true\n";
+            script_file << "# (the trigger above is idempotent, so it is not repeated here; just drain the queue)\n";
             script_file << "udevadm settle --timeout=1 2>/dev/null || true\n";
             script_file << "# CRITICAL: Redirect stdout/stderr to log file\n";
             script_file << "exec 1>>" << config::retroarch::get_launcher_log() << " 2>&1\n";
@@ -940,8 +956,8 @@ bool RetroArchLauncher::launch_drm(const GameLaunchInfo& game_info, int system_v
 
             script_file.close();
 
-            // Make script executable
-            std::system(("chmod +x " + launcher_script).c_str());
+            // Make script executable (direct chmod, no shell fork)
+            make_executable(launcher_script);
             std::cout << "Created launcher script: " << launcher_script << std::endl;
         } else {
             std::cerr << "Failed to create launcher script" << std::endl;
@@ -949,10 +965,15 @@ bool RetroArchLauncher::launch_drm(const GameLaunchInfo& game_info, int system_v
             }
         }
 
-        // Set environment variables for the RetroArch process
-        setenv("XDG_RUNTIME_DIR", "/run/user/1000", 1);
-        setenv("HOME", config::get_home_path().c_str(), 1);
-        setenv("DISPLAY", ":0", 1);
+        // Set environment variables for the RetroArch process. They are inherited
+        // from this process and never change, so they only need setting on the first launch
+        static const bool launch_env_set = []() {
+            setenv("XDG_RUNTIME_DIR", "/run/user/1000", 1);
+            setenv("HOME", config::get_home_path().c_str(), 1);
+            setenv("DISPLAY", ":0", 1);
+            return true;
+        }();
+        (void)launch_env_set;
         
         // CRITICAL: Verify controller device is accessible before forking
         std::cout << "Verifying controller device accessibility..." << std::endl;
@@ -1046,7 +1067,8 @@ bool RetroArchLauncher::open_core_downloader_direct(int system_volume_percent) {
     // Stop GStreamer and cleanup audio resources first
     stop_gstreamer_and_cleanup();
     
-    // Detect ALSA device
+    // Detect ALSA device (after any startup prefetch, which fills the same cache)
+    if (alsa_prefetch_.valid()) alsa_prefetch_.get();
     std::string alsa_device = detect_alsa_device();
 
     // Build command for core downloader
@@ -1091,8 +1113,13 @@ bool RetroArchLauncher::open_core_downloader_direct(int system_volume_percent) {
             script_file << "sleep 3\n";  // Wait for main app to fully exit and clean up DRM resources
             script_file << "echo 'Downloader: Creating RetroArch config...'\n";
             script_file << "echo 'Downloader: ALSA device: " << alsa_device << "'\n";
-            script_file << "echo 'Downloader: aplay -l output:' >> /tmp/retroarch_launcher.log\n";
-            script_file << "aplay -l >> /tmp/retroarch_launcher.log 2>&1 || true\n";
+            // /proc/asound/pcm lists the same playback devices as `aplay -l` without
+            // opening every card's control device on each launch. The listing is only
+            // diagnostics, so the extra process is skipped unless debug logging is on
+            if (logging::is_enabled(spdlog::level::debug)) {
+                script_file << "echo 'Downloader: ALSA PCM devices:' >> /tmp/retroarch_launcher.log\n";
+                script_file << "cat /proc/asound/pcm >> /tmp/retroarch_launcher.log 2>&1 || true\n";
+            }
             script_file << "cat > /tmp/retroarch_launcher.cfg << 'EOF'\n";
             script_file << "# DRM/KMS RetroArch config for Magic Dingus Box\n";
             script_file << "# CRITICAL: Use Vulkan driver (works best with KMS/DRM)\n";
@@ -1157,15 +1184,7 @@ bool RetroArchLauncher::open_core_downloader_direct(int system_volume_percent) {
             script_file << "audio_device = \"" << alsa_device << "\"\n";
             script_file << "audio_enable = \"true\"\n";
             script_file << "audio_mute_enable = \"false\"\n";
-            // Convert system volume (0-100) to RetroArch dB format
-            // RetroArch uses decibels: 0 dB = 100%, negative dB = quieter
-            // Formula: dB = 20 * log10(volume_percent / 100)
-            // For safety, clamp to reasonable range: -60 dB to 0 dB
-            float volume_decimal = system_volume_percent / 100.0f;
-            float volume_db = (volume_decimal > 0.001f) ? (20.0f * log10f(volume_decimal)) : -60.0f;
-            // Clamp to valid range
-            if (volume_db > 0.0f) volume_db = 0.0f;
-            if (volume_db < -60.0f) volume_db = -60.0f;
+            float volume_db = volume_percent_to_db(system_volume_percent);
             script_file << "audio_volume = \"" << volume_db << "\"\n";
             script_file << "audio_mixer_volume = \"1.0\"\n";
             script_file << "audio_mixer_mute_enable = \"false\"\n";
@@ -1260,20 +1279,14 @@ bool RetroArchLauncher::open_core_downloader_direct(int system_volume_percent) {
             script_file << "rm -f /tmp/retroarch_launcher.cfg\n";
             script_file << "sleep 0.5\n";  // Small delay to ensure RetroArch releases resources
 
-            // Get service name
-            const char* service_name_env = std::getenv("MAGIC_UI_SERVICE");
-            if (!service_name_env) {
-                service_name_env = "magic-dingus-box-cpp.service";
-            }
-
             script_file << "echo 'Downloader: Restarting UI service...'\n";
-            script_file << "sudo systemctl start " << service_name_env << "\n";
+            script_file << "sudo systemctl start " << config::get_ui_service_name() << "\n";
             script_file << "echo 'Downloader: Service restart complete'\n";
 
             script_file.close();
 
-            // Make script executable
-            std::system(("chmod +x " + launcher_script).c_str());
+            // Make script executable (direct chmod, no shell fork)
+            make_executable(launcher_script);
             std::cout << "Created downloader script: " << launcher_script << std::endl;
         } else {
             std::cerr << "Failed to create downloader script" << std::endl;
@@ -1303,82 +1316,175 @@ bool RetroArchLauncher::open_core_downloader_direct(int system_volume_percent) {
 void RetroArchLauncher::release_controllers() {
     std::cout << "Releasing controller devices before RetroArch launch" << std::endl;
     
-    // Iterate through joystick devices
+    // Iterate through joystick devices and collect them into a single udev trigger
+    // (one fork+exec for all controllers instead of one per device)
+    std::string udev_cmd = "udevadm trigger --action=change";
+    int device_count = 0;
     for (int i = 0; i < 4; ++i) {
         std::string js_path = "/dev/input/js" + std::to_string(i);
         
         // Check if device exists and is readable
         if (access(js_path.c_str(), R_OK) == 0) {
             std::cout << "Releasing controller device: " << js_path << std::endl;
-            
-            // Trigger udev to reset the device
-            std::string udev_cmd = "udevadm trigger --action=change --sysname-match=js" + std::to_string(i);
-            int result = std::system(udev_cmd.c_str());
-            if (result != 0) {
-                std::cerr << "Warning: Failed to trigger udev for " << js_path << std::endl;
-            }
+            udev_cmd += " --sysname-match=js" + std::to_string(i);
+            device_count++;
         }
     }
     
+    if (device_count == 0) {
+        return;
+    }
+    
+    // Trigger udev to reset the devices
+    int result = std::system(udev_cmd.c_str());
+    if (result != 0) {
+        std::cerr << "Warning: Failed to trigger udev for " << device_count << " controller(s)" << std::endl;
+    }
+    
     // Small delay for devices to settle
     std::this_thread::sleep_for(std::chrono::milliseconds(100));
 }
 
+void RetroArchLauncher::prefetch_alsa_device() {
+    if (alsa_prefetch_.valid()) return;
+    alsa_prefetch_ = std::async(std::launch::async, [this]() { detect_alsa_device(); });
+}
+
 std::string RetroArchLauncher::detect_alsa_device() {
+    // The sound card list identifies the HDMI setup; on a Pi it only changes when
+    // hardware or the kernel driver changes, so it keys the cached device choice
+    std::string cards;
+    {
+        std::ifstream cards_file("/proc/asound/cards");
+        if (cards_file) {
+            std::ostringstream ss;
+            ss << cards_file.rdbuf();
+            cards = ss.str();
+        }
+    }
+    
+    // Same cards as the last launch (or the startup prefetch): reuse the device
+    // without re-reading the on-disk cache
+    if (!cards.empty() && cards == alsa_cards_) {
+        std::cout << "Using cached ALSA device: " << alsa_device_ << std::endl;
+        return alsa_device_;
+    }
+    
+    const std::string cache_path = config::get_audio_device_cache_file();
+    if (!cards.empty()) {
+        std::ifstream cache_file(cache_path);
+        Json::Value cached;
+        Json::CharReaderBuilder reader;
+        std::string errors;
+        if (cache_file && Json::parseFromStream(reader, cache_file, &cached, &errors) &&
+            cached.get("version", 0).asInt() == ALSA_CACHE_VERSION &&
+            cached.get("cards", "").asString() == cards) {
+            std::string device = cached.get("device", "").asString();
+            if (!device.empty()) {
+                std::cout << "Using cached ALSA device: " << device << std::endl;
+                alsa_device_ = device;
+                alsa_cards_ = cards;
+                return device;
+            }
+        }
+    }
+    
+    std::string device = probe_alsa_device(cards);
+    
+    if (!cards.empty()) {
+        alsa_device_ = device;
+        alsa_cards_ = cards;
+        
+        Json::Value cached;
+        cached["version"] = ALSA_CACHE_VERSION;
+        cached["device"] = device;
+        cached["cards"] = cards;
+        
+        std::error_code ec;
+        fs::create_directories(fs::path(cache_path).parent_path(), ec);
+        std::ofstream cache_file(cache_path);
+        if (cache_file) {
+            Json::StreamWriterBuilder writer;
+            writer["indentation"] = "  ";
+            cache_file << Json::writeString(writer, cached) << std::endl;
+        } else {
+            std::cerr << "Warning: Failed to write ALSA device cache: " << cache_path << std::endl;
+        }
+    }
+    
+    return device;
+}
+
+std::string RetroArchLauncher::probe_alsa_device(const std::string& cards) {
     std::cout << "Detecting ALSA device (matching Pi game version priority)..." << std::endl;
     
-    // PRIORITY 1: Try sysdefault:CARD=vc4hdmi0 (highest priority, matches Pi game version)
+    // PRIORITY 1: Try sysdefault:CARD=vc4hdmi0/1 (highest priority, matches Pi game version)
+    // Classify each line of `aplay -L` once instead of re-scanning the whole output per candidate.
+    bool has_sysdefault_hdmi0 = false;
+    bool has_sysdefault_hdmi1 = false;
     FILE* pipe_l = popen("aplay -L 2>&1", "r");
     if (pipe_l) {
         char buffer[256];
-        std::string output_l;
+        bool at_line_start = true;
         while (fgets(buffer, sizeof(buffer), pipe_l) != nullptr) {
-            output_l += buffer;
+            if (at_line_start) {
+                if (std::strncmp(buffer, "sysdefault:CARD=vc4hdmi0", 24) == 0) {
+                    has_sysdefault_hdmi0 = true;
+                } else if (std::strncmp(buffer, "sysdefault:CARD=vc4hdmi1", 24) == 0) {
+                    has_sysdefault_hdmi1 = true;
+                }
+            }
+            at_line_start = std::strchr(buffer, '\n') != nullptr;
         }
         pclose(pipe_l);
         
-        // Check for sysdefault:CARD=vc4hdmi0
-        std::regex sysdefault_vc4hdmi0_regex(R"(^sysdefault:CARD=vc4hdmi0)");
-        if (std::regex_search(output_l, sysdefault_vc4hdmi0_regex)) {
+        if (has_sysdefault_hdmi0) {
             std::cout << "Found sysdefault:CARD=vc4hdmi0 (PRIORITY 1)" << std::endl;
             return "sysdefault:CARD=vc4hdmi0";
         }
-        
-        // Check for sysdefault:CARD=vc4hdmi1
-        std::regex sysdefault_vc4hdmi1_regex(R"(^sysdefault:CARD=vc4hdmi1)");
-        if (std::regex_search(output_l, sysdefault_vc4hdmi1_regex)) {
+        if (has_sysdefault_hdmi1) {
             std::cout << "Found sysdefault:CARD=vc4hdmi1 (PRIORITY 1)" << std::endl;
             return "sysdefault:CARD=vc4hdmi1";
         }
     }
     
     // PRIORITY 2: Try plughw format (fallback, matches Pi game version)
-    FILE* pipe = popen("aplay -l 2>&1", "r");
-    if (!pipe) {
-        std::cerr << "Warning: Failed to execute aplay -l, using default device" << std::endl;
+    // The card list read by detect_alsa_device() carries the same "N [id]" pairs
+    // that `aplay -l` prints, so parse it instead of spawning a second probe.
+    if (cards.empty()) {
+        std::cerr << "Warning: /proc/asound/cards unavailable, using default device" << std::endl;
         return "plughw:1,0";
     }
     
-    std::string output;
-    char buffer[128];
-    while (fgets(buffer, sizeof(buffer), pipe) != nullptr) {
-        output += buffer;
+    // Single pass over the card list: " N [<id>   ]: <driver> - <name>"
+    bool has_card1_hdmi0 = false;
+    bool has_card2_hdmi1 = false;
+    std::istringstream card_lines(cards);
+    std::string line;
+    while (std::getline(card_lines, line)) {
+        char* end = nullptr;
+        long card_num = std::strtol(line.c_str(), &end, 10);
+        if (end == line.c_str() || !std::strchr(end, '[')) {
+            continue;
+        }
+        if (card_num == 1 && std::strstr(end, "[vc4hdmi0")) {
+            has_card1_hdmi0 = true;
+        } else if (card_num == 2 && std::strstr(end, "[vc4hdmi1")) {
+            has_card2_hdmi1 = true;
+        }
     }
-    pclose(pipe);
     
-    // Log the output for debugging
-    std::cout << "aplay -l output:" << std::endl << output << std::endl;
+    // Log the card list for debugging
+    std::cout << "/proc/asound/cards:" << std::endl << cards << std::endl;
     
     // Look for vc4hdmi0 on card 1 - use plughw: format (PRIORITY 2, matches Pi game version)
-    std::regex vc4hdmi0_regex(R"(card\s+1.*vc4hdmi0)");
-    if (std::regex_search(output, vc4hdmi0_regex)) {
+    if (has_card1_hdmi0) {
         std::cout << "Found vc4hdmi0 on card 1, using plughw:1,0 (PRIORITY 2)" << std::endl;
         return "plughw:1,0";
     }
     
     // Look for vc4hdmi1 on card 2 - use plughw: format (PRIORITY 2)
-    std::regex vc4hdmi1_regex(R"(card\s+2.*vc4hdmi1)");
-    if (std::regex_search(output, vc4hdmi1_regex)) {
+    if (has_card2_hdmi1) {
         std::cout << "Found vc4hdmi1 on card 2, using plughw:2,0 (PRIORITY 2)" << std::endl;
         return "plughw:2,0";
     }
@@ -1391,37 +1497,24 @@ std::string RetroArchLauncher::detect_alsa_device() {
 void RetroArchLauncher::stop_gstreamer_and_cleanup() {
     std::cout << "Stopping GStreamer and cleaning up audio resources..." << std::endl;
     
-    // Kill any GStreamer processes
+    // Kill any GStreamer processes (including lingering magic+GStreamer ones)
+    // with one in-process /proc scan rather than forking pkill
     std::cout << "Killing GStreamer processes..." << std::endl;
-    std::system("pkill -9 gst-launch-1.0 2>/dev/null || true");
-    std::system("pkill -9 -f 'gst.*playbin' 2>/dev/null || true");
+    utils::signal_processes(utils::find_processes_by_cmdline("gst-launch-1.0|gst.*playbin|magic.*gst"), SIGKILL);
     
     // Wait for processes to exit
     std::this_thread::sleep_for(std::chrono::milliseconds(200));
     
-    // Check if ALSA device is still in use
-    FILE* lsof_pipe = popen("lsof 2>/dev/null | grep snd || true", "r");
-    if (lsof_pipe) {
-        char buffer[256];
-        bool device_busy = false;
-        while (fgets(buffer, sizeof(buffer), lsof_pipe) != nullptr) {
-            std::string line(buffer);
-            if (line.find("snd") != std::string::npos) {
-                device_busy = true;
-                std::cout << "ALSA device still in use: " << line;
-            }
-        }
-        pclose(lsof_pipe);
-        
-        if (device_busy) {
-            std::cout << "ALSA device still busy, waiting additional 300ms..." << std::endl;
-            std::this_thread::sleep_for(std::chrono::milliseconds(300));
+    // Check if ALSA device is still in use (a /proc fd scan instead of lsof | grep)
+    std::vector<pid_t> snd_users = utils::find_processes_with_open_file("/dev/snd/");
+    if (!snd_users.empty()) {
+        for (pid_t pid : snd_users) {
+            std::cout << "ALSA device still in use by PID " << pid << std::endl;
         }
+        std::cout << "ALSA device still busy, waiting additional 300ms..." << std::endl;
+        std::this_thread::sleep_for(std::chrono::milliseconds(300));
     }
     
-    // Kill any lingering magic+GStreamer processes
-    std::system("pkill -9 -f 'magic.*gst' 2>/dev/null || true");
-    
     std::cout << "GStreamer cleanup complete" << std::endl;
 }
 
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <future>
 #include <string>
 #include <optional>
 #include <vector>
@@ -27,6 +28,10 @@ public:
     
     // Check if RetroArch is available
     bool is_available() const { return retroarch_available_; }
+    
+    // Resolve the ALSA device on a background thread ahead of the first launch so it
+    // lands in the on-disk cache; a launch only waits for it if it is still running
+    void prefetch_alsa_device();
 
 private:
     // Find RetroArch executable
@@ -41,15 +46,24 @@ private:
     // Release controllers before launch
     void release_controllers();
     
-    // Detect ALSA device for audio
+    // Detect ALSA device for audio (uses the cached result while the sound cards are unchanged)
     std::string detect_alsa_device();
     
+    // Enumerate ALSA devices via aplay and the /proc/asound/cards text, and pick
+    // the preferred HDMI output
+    std::string probe_alsa_device(const std::string& cards);
+    
     // Stop GStreamer and cleanup audio resources
     void stop_gstreamer_and_cleanup();
 
 private:
     std::optional<std::string> retroarch_bin_;
     bool retroarch_available_;
+    
+    // ALSA device resolved this session and the sound card list it was resolved for
+    std::string alsa_device_;
+    std::string alsa_cards_;
+    std::future<void> alsa_prefetch_;  // Startup detect_alsa_device() run, joined before first use
 };
 
 } // namespace retroarch
@@ -21,9 +21,13 @@
 #include <iomanip>
 #include <vector>
 #include <algorithm> // Added for std::min/max
+#include <cstring>
 
 namespace ui {
 
+// Below one 8-bit alpha step the UI layer rounds to nothing, so don't draw it
+static constexpr float MIN_VISIBLE_ALPHA = 1.0f / 255.0f;
+
 // Simple vertex shader for 2D rendering
 static const char* vertex_shader_source = R"(
 #version 300 es
@@ -214,6 +218,9 @@ Renderer::Renderer(uint32_t width, uint32_t height)
 }
 
 Renderer::~Renderer() {
+    if (bezel_prefetch_.valid()) {
+        stbi_image_free(bezel_prefetch_.get().data);
+    }
     cleanup();
 }
 
@@ -239,6 +246,14 @@ void Renderer::reset_gl() {
         glDeleteBuffers(1, &vbo_);
         vbo_ = 0;
     }
+    if (crt_vao_ != 0) {
+        glDeleteVertexArrays(1, &crt_vao_);
+        crt_vao_ = 0;
+    }
+    if (crt_vbo_ != 0) {
+        glDeleteBuffers(1, &crt_vbo_);
+        crt_vbo_ = 0;
+    }
     if (logo_texture_id_ != 0) {
         glDeleteTextures(1, &logo_texture_id_);
         logo_texture_id_ = 0;
@@ -278,24 +293,16 @@ void Renderer::reset_gl() {
     
     glBindVertexArray(0);
     
-    // Re-load logo texture using config paths
-    unsigned char* data = nullptr;
-    int channels;
-    std::vector<std::string> logo_paths = config::get_logo_search_paths();
-    for (const auto& logo_path : logo_paths) {
-        data = stbi_load(logo_path.c_str(), &logo_width_, &logo_height_, &channels, 4);
-        if (data) break;
-    }
-    
-    if (data) {
+    // Re-upload the logo from the pixels decoded in initialize() rather than
+    // decoding the PNG again on every return from RetroArch
+    if (!logo_pixels_.empty()) {
         glGenTextures(1, &logo_texture_id_);
         glBindTexture(GL_TEXTURE_2D, logo_texture_id_);
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE);
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE);
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR);
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR);
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, logo_width_, logo_height_, 0, GL_RGBA, GL_UNSIGNED_BYTE, data);
-        stbi_image_free(data);
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, logo_width_, logo_height_, 0, GL_RGBA, GL_UNSIGNED_BYTE, logo_pixels_.data());
     }
     
     // CRITICAL: Re-enable blending - RetroArch may have disabled it
@@ -312,9 +319,26 @@ bool Renderer::load_bezel(const std::string& path) {
         return true;
     }
     
-    // Delete old texture if exists
+    // Swap back to the previous bezel if that's the one requested
+    if (!path.empty() && path == previous_bezel_path_ && previous_bezel_texture_id_ != 0) {
+        std::swap(bezel_texture_id_, previous_bezel_texture_id_);
+        std::swap(bezel_width_, previous_bezel_width_);
+        std::swap(bezel_height_, previous_bezel_height_);
+        std::swap(bezel_hole_, previous_bezel_hole_);
+        std::swap(current_bezel_path_, previous_bezel_path_);
+        return true;
+    }
+    
+    // Keep the outgoing texture as the previous bezel, dropping the older one
     if (bezel_texture_id_ != 0) {
-        glDeleteTextures(1, &bezel_texture_id_);
+        if (previous_bezel_texture_id_ != 0) {
+            glDeleteTextures(1, &previous_bezel_texture_id_);
+        }
+        previous_bezel_texture_id_ = bezel_texture_id_;
+        previous_bezel_width_ = bezel_width_;
+        previous_bezel_height_ = bezel_height_;
+        previous_bezel_hole_ = bezel_hole_;
+        previous_bezel_path_ = current_bezel_path_;
         bezel_texture_id_ = 0;
     }
     
@@ -325,28 +349,22 @@ bool Renderer::load_bezel(const std::string& path) {
         return true;
     }
     
-    // Try multiple paths using config
-    std::vector<std::string> bezel_paths = {
-        "../assets/bezels/" + path,
-        "assets/bezels/" + path,
-        config::get_bezels_dir() + "/" + path
-    };
-    
-    unsigned char* data = nullptr;
-    int channels;
-    
-    for (const auto& bezel_path : bezel_paths) {
-        data = stbi_load(bezel_path.c_str(), &bezel_width_, &bezel_height_, &channels, 4);
-        if (data) {
-            std::cout << "Loaded bezel from: " << bezel_path << " (" << bezel_width_ << "x" << bezel_height_ << ")" << std::endl;
-            break;
-        }
+    DecodedBezel decoded;
+    if (bezel_prefetch_.valid() && bezel_prefetch_path_ == path) {
+        decoded = bezel_prefetch_.get();
+        bezel_prefetch_path_.clear();
+    } else {
+        decoded = decode_bezel(path);
     }
     
-    if (!data) {
+    if (!decoded.data) {
         std::cerr << "Failed to load bezel: " << path << std::endl;
         return false;
     }
+    unsigned char* data = decoded.data;
+    bezel_width_ = decoded.width;
+    bezel_height_ = decoded.height;
+    bezel_hole_ = decoded.hole;
     
     glGenTextures(1, &bezel_texture_id_);
     glBindTexture(GL_TEXTURE_2D, bezel_texture_id_);
@@ -360,6 +378,88 @@ bool Renderer::load_bezel(const std::string& path) {
     return true;
 }
 
+void Renderer::prefetch_bezel(const std::string& path) {
+    if (path.empty() || path == current_bezel_path_ || path == previous_bezel_path_ ||
+        (bezel_prefetch_.valid() && path == bezel_prefetch_path_)) {
+        return;
+    }
+    // A superseded prefetch is waited for and dropped
+    if (bezel_prefetch_.valid()) {
+        stbi_image_free(bezel_prefetch_.get().data);
+    }
+    bezel_prefetch_path_ = path;
+    bezel_prefetch_ = std::async(std::launch::async, &Renderer::decode_bezel, path);
+}
+
+Renderer::DecodedBezel Renderer::decode_bezel(const std::string& path) {
+    // Try multiple paths using config
+    std::vector<std::string> bezel_paths = {
+        "../assets/bezels/" + path,
+        "assets/bezels/" + path,
+        config::get_bezels_dir() + "/" + path
+    };
+    
+    DecodedBezel decoded;
+    int channels;
+    
+    for (const auto& bezel_path : bezel_paths) {
+        decoded.data = stbi_load(bezel_path.c_str(), &decoded.width, &decoded.height, &channels, 4);
+        if (decoded.data) {
+            std::cout << "Loaded bezel from: " << bezel_path << " (" << decoded.width << "x" << decoded.height << ")" << std::endl;
+            decoded.hole = find_bezel_hole(decoded.data, decoded.width, decoded.height);
+            break;
+        }
+    }
+    return decoded;
+}
+
+Renderer::BezelHole Renderer::find_bezel_hole(const unsigned char* rgba, int width, int height) {
+    BezelHole hole;
+    if (!rgba || width <= 0 || height <= 0) return hole;
+    
+    const int cx = width / 2;
+    const int cy = height / 2;
+    auto alpha = [&](int x, int y) { return rgba[(static_cast<size_t>(y) * width + x) * 4 + 3]; };
+    
+    // Per row, the run of fully transparent pixels through the center column
+    // ([left, right), empty where the center column itself is opaque)
+    std::vector<int> left(height), right(height);
+    for (int y = 0; y < height; ++y) {
+        int l = cx;
+        int r = cx;
+        if (alpha(cx, y) == 0) {
+            while (l > 0 && alpha(l - 1, y) == 0) --l;
+            while (r < width && alpha(r, y) == 0) ++r;
+        }
+        left[y] = l;
+        right[y] = r;
+    }
+    
+    // Largest rectangle through the center whose rows all lie inside their runs.
+    // Rounded screen corners make the bounding box of the transparent area unsafe.
+    int64_t best_area = 0;
+    int top_l = 0;
+    int top_r = width;
+    for (int y0 = cy; y0 >= 0; --y0) {
+        top_l = std::max(top_l, left[y0]);
+        top_r = std::min(top_r, right[y0]);
+        if (top_r <= top_l) break;
+        int l = top_l;
+        int r = top_r;
+        for (int y1 = cy; y1 < height; ++y1) {
+            l = std::max(l, left[y1]);
+            r = std::min(r, right[y1]);
+            if (r <= l) break;
+            const int64_t area = static_cast<int64_t>(r - l) * (y1 + 1 - y0);
+            if (area > best_area) {
+                best_area = area;
+                hole = {l, y0, r - l, y1 + 1 - y0};
+            }
+        }
+    }
+    return hole;
+}
+
 void Renderer::render_bezel() {
     if (bezel_texture_id_ == 0) return;
     
@@ -372,29 +472,53 @@ void Renderer::render_bezel() {
     float bezel_h = static_cast<float>(original_height_);
     
     // Set screenSize uniform for the shader (uses screen coords divider)
-    glUniform2f(glGetUniformLocation(shader_program_, "screenSize"), bezel_w, bezel_h);
-    
-    // Render bezel as fullscreen textured quad
-    float x = 0.0f;
-    float y = 0.0f;
-    
-    float vertices[] = {
-        x, y,             0.0f, 0.0f,
-        x + bezel_w, y,   1.0f, 0.0f,
-        x, y + bezel_h,   0.0f, 1.0f,
-        x + bezel_w, y + bezel_h, 1.0f, 1.0f
+    glUniform2f(screen_size_loc_, bezel_w, bezel_h);
+    
+    // Render the bezel as up to four bands (top, bottom, left, right) around its
+    // transparent screen area instead of one fullscreen quad. Nothing in that area
+    // would be drawn, so this skips blending the largest part of the screen every frame.
+    // The hole is inset one texel so linear filtering at its edge can't pull in the
+    // frame, then rounded inward to whole screen pixels.
+    const float scale_x = bezel_w / static_cast<float>(bezel_width_);
+    const float scale_y = bezel_h / static_cast<float>(bezel_height_);
+    const float hx0 = std::ceil((bezel_hole_.x + 1) * scale_x);
+    const float hy0 = std::ceil((bezel_hole_.y + 1) * scale_y);
+    const float hx1 = std::floor((bezel_hole_.x + bezel_hole_.w - 1) * scale_x);
+    const float hy1 = std::floor((bezel_hole_.y + bezel_hole_.h - 1) * scale_y);
+    
+    float vertices[4 * 6 * 4];  // 4 bands x 2 triangles x (pos.xy, uv)
+    int vertex_count = 0;
+    auto add_band = [&](float x0, float y0, float x1, float y1) {
+        if (x1 <= x0 || y1 <= y0) return;
+        const float u0 = x0 / bezel_w, u1 = x1 / bezel_w;
+        const float v0 = y0 / bezel_h, v1 = y1 / bezel_h;
+        const float band[6][4] = {
+            {x0, y0, u0, v0}, {x1, y0, u1, v0}, {x0, y1, u0, v1},
+            {x1, y0, u1, v0}, {x1, y1, u1, v1}, {x0, y1, u0, v1}
+        };
+        std::memcpy(&vertices[vertex_count * 4], band, sizeof(band));
+        vertex_count += 6;
     };
+    if (hx1 > hx0 && hy1 > hy0) {
+        add_band(0.0f, 0.0f, bezel_w, hy0);     // Top
+        add_band(0.0f, hy1, bezel_w, bezel_h);  // Bottom
+        add_band(0.0f, hy0, hx0, hy1);          // Left
+        add_band(hx1, hy0, bezel_w, hy1);       // Right
+    } else {
+        add_band(0.0f, 0.0f, bezel_w, bezel_h);
+    }
+    if (vertex_count == 0) return;
     
     glBindBuffer(GL_ARRAY_BUFFER, vbo_);
-    glBufferData(GL_ARRAY_BUFFER, sizeof(vertices), vertices, GL_DYNAMIC_DRAW);
+    glBufferData(GL_ARRAY_BUFFER, vertex_count * 4 * sizeof(float), vertices, GL_DYNAMIC_DRAW);
     
     // Use white color with full alpha to render texture as-is
-    glUniform4f(glGetUniformLocation(shader_program_, "color"), 1.0f, 1.0f, 1.0f, 1.0f);
-    glUniform1i(glGetUniformLocation(shader_program_, "useTexture"), 1);
+    glUniform4f(color_loc_, 1.0f, 1.0f, 1.0f, 1.0f);
+    glUniform1i(use_texture_loc_, 1);
     
     // Ensure we are using Texture Unit 0 and tell the shader
     glActiveTexture(GL_TEXTURE0);
-    glUniform1i(glGetUniformLocation(shader_program_, "tex"), 0);
+    glUniform1i(tex_loc_, 0);
     
     // Enable blending for transparent areas of the bezel
     glEnable(GL_BLEND);
@@ -403,7 +527,7 @@ void Renderer::render_bezel() {
     glBindTexture(GL_TEXTURE_2D, bezel_texture_id_);
     
     glBindVertexArray(vao_);
-    glDrawArrays(GL_TRIANGLE_STRIP, 0, 4);
+    glDrawArrays(GL_TRIANGLES, 0, vertex_count);
     glBindVertexArray(0);
     
     glBindTexture(GL_TEXTURE_2D, 0);
@@ -512,6 +636,7 @@ bool Renderer::initialize(const std::string& title_font_path, const std::string&
         glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, logo_width_, logo_height_, 0, GL_RGBA, GL_UNSIGNED_BYTE, data);
         glGenerateMipmap(GL_TEXTURE_2D);
         
+        logo_pixels_.assign(data, data + static_cast<size_t>(logo_width_) * logo_height_ * 4);
         stbi_image_free(data);
         std::cout << "Loaded logo from: " << loaded_logo_path << " (" << logo_width_ << "x" << logo_height_ << ")" << std::endl;
     } else {
@@ -523,6 +648,9 @@ bool Renderer::initialize(const std::string& title_font_path, const std::string&
 
 void Renderer::render(const app::AppState& state) {
     // Debug logging removed for performance - only log errors
+
+    // One timestamp for the whole frame: fades, blink phases and CRT time all read it
+    frame_time_ = std::chrono::steady_clock::now();
     
     // CRITICAL: Don't render UI at all when intro video is showing (even if not ready yet)
     // This prevents UI from briefly appearing before intro video starts
@@ -568,8 +696,7 @@ void Renderer::render(const app::AppState& state) {
     // Handle fade animation (works for both video active and intro fade-in cases)
     if (state.is_fading) {
         // Calculate fade progress
-        auto now = std::chrono::steady_clock::now();
-        auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - state.fade_start_time);
+        auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(frame_time_ - state.fade_start_time);
         if (elapsed < state.fade_duration) {
             float fade_progress = static_cast<float>(elapsed.count()) / static_cast<float>(state.fade_duration.count());
             fade_progress = std::min(1.0f, std::max(0.0f, fade_progress));  // Clamp to [0, 1]
@@ -611,7 +738,7 @@ void Renderer::render(const app::AppState& state) {
     }
     
     // Set screen size uniform
-    GLint screenSizeLoc = glGetUniformLocation(shader_program_, "screenSize");
+    GLint screenSizeLoc = screen_size_loc_;
     if (screenSizeLoc < 0) {
         std::cerr << "Warning: screenSize uniform not found" << std::endl;
     } else {
@@ -631,9 +758,8 @@ void Renderer::render(const app::AppState& state) {
     
     // Handle intro video fade-out: draw black overlay that fades in over the video
     if (state.intro_fading_out && state.video_active) {
-        auto now = std::chrono::steady_clock::now();
-        auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - state.intro_fade_out_start_time);
-        std::chrono::milliseconds fade_out_duration(300);
+        auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(frame_time_ - state.intro_fade_out_start_time);
+        const auto fade_out_duration = app::AppState::INTRO_FADE_OUT_DURATION;
         
         float fade_out_progress = 1.0f;
         if (elapsed < fade_out_duration) {
@@ -647,7 +773,8 @@ void Renderer::render(const app::AppState& state) {
     }
     
     // Only render UI components if they are visible
-    if (ui_overlay_alpha > 0.0f) {
+    bool ui_visible = ui_overlay_alpha >= MIN_VISIBLE_ALPHA;
+    if (ui_visible) {
         // When UI overlay should be visible, draw dark overlay behind text
         // Draw overlay first so it's behind all text elements
         if (state.video_active && !state.intro_fading_out) {
@@ -740,8 +867,12 @@ void Renderer::render(const app::AppState& state) {
         
     // Apply CRT effects (scanlines, warmth, glow, etc.)
     // These are rendered as an overlay on top of everything
-    // Pass ui_overlay_alpha > 0.0f to enable/disable scanlines specifically
-    render_crt_effects(state, ui_overlay_alpha > 0.0f);
+    // Pass the UI visibility to enable/disable scanlines specifically
+    // Skipped during the intro fade-out: the video is no longer drawn and the frame is
+    // fading to black, so the full-screen pass resumes once the UI fade-in starts
+    if (!state.intro_fading_out) {
+        render_crt_effects(state, ui_visible);
+    }
     
     // Check for errors after rendering
     GLenum err = glGetError();
@@ -761,9 +892,9 @@ void Renderer::draw_quad(float x, float y, float w, float h, const ui::Color& co
     glBindBuffer(GL_ARRAY_BUFFER, vbo_);
     glBufferData(GL_ARRAY_BUFFER, sizeof(vertices), vertices, GL_DYNAMIC_DRAW);
     
-    glUniform4f(glGetUniformLocation(shader_program_, "color"),
+    glUniform4f(color_loc_,
                 color.r / 255.0f, color.g / 255.0f, color.b / 255.0f, (color.a / 255.0f) * ui_alpha_ * alpha_multiplier);
-    glUniform1i(glGetUniformLocation(shader_program_, "useTexture"), 0);
+    glUniform1i(use_texture_loc_, 0);
     
     glBindVertexArray(vao_);
     glDrawArrays(GL_TRIANGLE_STRIP, 0, 4);
@@ -834,12 +965,12 @@ void Renderer::draw_text(const std::string& text, float x, float y, int font_siz
         // IMPORTANT: For text, we want colors to stay vibrant, so we DON'T multiply RGB by ui_alpha_
         // ui_alpha_ is only for background transparency, not text dimming
         // alpha_multiplier controls fade in/out animation, which we do want
-        GLint colorLoc = glGetUniformLocation(shader_program_, "color");
+        GLint colorLoc = color_loc_;
         if (colorLoc >= 0) {
             glUniform4f(colorLoc, color.r / 255.0f, color.g / 255.0f, color.b / 255.0f, (color.a / 255.0f) * alpha_multiplier);
         }
         
-        GLint useTextureLoc = glGetUniformLocation(shader_program_, "useTexture");
+        GLint useTextureLoc = use_texture_loc_;
         if (useTextureLoc >= 0) {
             glUniform1i(useTextureLoc, 1);
         }
@@ -889,9 +1020,9 @@ void Renderer::draw_line(float x1, float y1, float x2, float y2, float width, co
     glBindBuffer(GL_ARRAY_BUFFER, vbo_);
     glBufferData(GL_ARRAY_BUFFER, sizeof(vertices), vertices, GL_DYNAMIC_DRAW);
     
-    glUniform4f(glGetUniformLocation(shader_program_, "color"),
+    glUniform4f(color_loc_,
                 color.r / 255.0f, color.g / 255.0f, color.b / 255.0f, (color.a / 255.0f) * ui_alpha_ * alpha_multiplier);
-    glUniform1i(glGetUniformLocation(shader_program_, "useTexture"), 0);
+    glUniform1i(use_texture_loc_, 0);
     
     glBindVertexArray(vao_);
     glDrawArrays(GL_TRIANGLE_STRIP, 0, 4);
@@ -923,7 +1054,7 @@ void Renderer::render_virtual_keyboard(const VirtualKeyboard& keyboard) {
     // Text cursor blinking
     std::string display_text = keyboard.get_text();
     // Simple cursor visualization
-    if (static_cast<int>(std::chrono::duration_cast<std::chrono::milliseconds>(std::chrono::steady_clock::now().time_since_epoch()).count() / 500) % 2 == 0) {
+    if (blink_phase(frame_time_) % 2 == 0) {
         display_text += "_";
     }
     draw_text(display_text, start_x + 10, start_y - 12, 20, theme_->fg);
@@ -1008,9 +1139,9 @@ void Renderer::render_title(float text_alpha, bool /* video_active */, bool /* u
         glBufferData(GL_ARRAY_BUFFER, sizeof(vertices), vertices, GL_DYNAMIC_DRAW);
         
         // Use white color to render texture as-is (multiplied by alpha)
-        glUniform4f(glGetUniformLocation(shader_program_, "color"),
+        glUniform4f(color_loc_,
                     1.0f, 1.0f, 1.0f, ui_alpha_ * text_alpha);
-        glUniform1i(glGetUniformLocation(shader_program_, "useTexture"), 1); // Enable texture
+        glUniform1i(use_texture_loc_, 1); // Enable texture
         
         glBindTexture(GL_TEXTURE_2D, logo_texture_id_);
         
@@ -1090,10 +1221,7 @@ void Renderer::render_playlist_list(const std::vector<app::Playlist>& playlists,
     // Removed to eliminate unused variable warning
     
     // Get current time for blinking indicator (time-based, matching Python: 500ms)
-    static auto last_blink_time = std::chrono::steady_clock::now();
-    auto now = std::chrono::steady_clock::now();
-    auto elapsed_ms = std::chrono::duration_cast<std::chrono::milliseconds>(now - last_blink_time).count();
-    bool indicator_visible = (elapsed_ms / 500) % 2 == 0;  // Blink every 500ms (matching Python)
+    bool indicator_visible = blink_phase(frame_time_) % 2 == 0;  // Blink every 500ms (matching Python)
     
     for (size_t i = 0; i < playlists.size() && i < 12; i++) {
         const auto& pl = playlists[i];
@@ -1163,12 +1291,12 @@ void Renderer::render_playlist_list(const std::vector<app::Playlist>& playlists,
             glBindBuffer(GL_ARRAY_BUFFER, vbo_);
             glBufferData(GL_ARRAY_BUFFER, sizeof(triangle_vertices), triangle_vertices, GL_DYNAMIC_DRAW);
             
-            GLint colorLoc = glGetUniformLocation(shader_program_, "color");
+            GLint colorLoc = color_loc_;
             if (colorLoc >= 0) {
                 glUniform4f(colorLoc, theme_->accent2.r / 255.0f, theme_->accent2.g / 255.0f, 
                            theme_->accent2.b / 255.0f, (theme_->accent2.a / 255.0f) * ui_alpha_ * text_alpha);
             }
-            GLint useTextureLoc = glGetUniformLocation(shader_program_, "useTexture");
+            GLint useTextureLoc = use_texture_loc_;
             if (useTextureLoc >= 0) {
                 glUniform1i(useTextureLoc, 0);  // No texture, solid color
             }
@@ -1198,6 +1326,10 @@ std::string Renderer::format_time(double seconds) {
     return std::string(buf);
 }
 
+int64_t Renderer::blink_phase(std::chrono::steady_clock::time_point now) {
+    return std::chrono::duration_cast<std::chrono::milliseconds>(now.time_since_epoch()).count() / 500;
+}
+
 void Renderer::render_loading_overlay(const app::AppState& state) {
     if (!state.is_loading_game) return;
     
@@ -1273,12 +1405,12 @@ void Renderer::render_loading_overlay(const app::AppState& state) {
     glBindBuffer(GL_ARRAY_BUFFER, vbo_);
     glBufferData(GL_ARRAY_BUFFER, sizeof(triangle_vertices), triangle_vertices, GL_DYNAMIC_DRAW);
 
-    GLint colorLoc = glGetUniformLocation(shader_program_, "color");
+    GLint colorLoc = color_loc_;
     if (colorLoc >= 0) {
         glUniform4f(colorLoc, theme_->accent.r / 255.0f, theme_->accent.g / 255.0f,
                    theme_->accent.b / 255.0f, 1.0f);
     }
-    GLint useTextureLoc = glGetUniformLocation(shader_program_, "useTexture");
+    GLint useTextureLoc = use_texture_loc_;
     if (useTextureLoc >= 0) {
         glUniform1i(useTextureLoc, 0);
     }
@@ -1486,12 +1618,12 @@ void Renderer::render_settings_menu(ui::SettingsMenuManager* menu, const std::ve
             glBindBuffer(GL_ARRAY_BUFFER, vbo_);
             glBufferData(GL_ARRAY_BUFFER, sizeof(triangle_vertices), triangle_vertices, GL_DYNAMIC_DRAW);
             
-            GLint colorLoc = glGetUniformLocation(shader_program_, "color");
+            GLint colorLoc = color_loc_;
             if (colorLoc >= 0) {
                 glUniform4f(colorLoc, section_color.r / 255.0f, section_color.g / 255.0f,
                            section_color.b / 255.0f, (section_color.a / 255.0f) * ui_alpha_ * text_alpha);
             }
-            GLint useTextureLoc = glGetUniformLocation(shader_program_, "useTexture");
+            GLint useTextureLoc = use_texture_loc_;
             if (useTextureLoc >= 0) {
                 glUniform1i(useTextureLoc, 0);
             }
@@ -1641,12 +1773,12 @@ void Renderer::render_game_browser(ui::SettingsMenuManager* menu, const std::vec
                     glBindBuffer(GL_ARRAY_BUFFER, vbo_);
                     glBufferData(GL_ARRAY_BUFFER, sizeof(triangle_vertices), triangle_vertices, GL_DYNAMIC_DRAW);
 
-                    GLint colorLoc = glGetUniformLocation(shader_program_, "color");
+                    GLint colorLoc = color_loc_;
                     if (colorLoc >= 0) {
                         glUniform4f(colorLoc, section_color.r / 255.0f, section_color.g / 255.0f,
                                    section_color.b / 255.0f, (section_color.a / 255.0f) * ui_alpha_ * text_alpha);
                     }
-                    GLint useTextureLoc = glGetUniformLocation(shader_program_, "useTexture");
+                    GLint useTextureLoc = use_texture_loc_;
                     if (useTextureLoc >= 0) {
                         glUniform1i(useTextureLoc, 0);
                     }
@@ -1724,12 +1856,12 @@ void Renderer::render_game_browser(ui::SettingsMenuManager* menu, const std::vec
                 glBindBuffer(GL_ARRAY_BUFFER, vbo_);
                 glBufferData(GL_ARRAY_BUFFER, sizeof(triangle_vertices), triangle_vertices, GL_DYNAMIC_DRAW);
 
-                GLint colorLoc = glGetUniformLocation(shader_program_, "color");
+                GLint colorLoc = color_loc_;
                 if (colorLoc >= 0) {
                     glUniform4f(colorLoc, section_color.r / 255.0f, section_color.g / 255.0f,
                                section_color.b / 255.0f, (section_color.a / 255.0f) * ui_alpha_ * text_alpha);
                 }
-                GLint useTextureLoc = glGetUniformLocation(shader_program_, "useTexture");
+                GLint useTextureLoc = use_texture_loc_;
                 if (useTextureLoc >= 0) {
                     glUniform1i(useTextureLoc, 0);
                 }
@@ -1787,6 +1919,12 @@ bool Renderer::compile_shaders() {
     glDeleteShader(vertex_shader);
     glDeleteShader(fragment_shader);
     
+    // Look up uniform locations once per link; draw calls reuse them
+    color_loc_ = glGetUniformLocation(shader_program_, "color");
+    use_texture_loc_ = glGetUniformLocation(shader_program_, "useTexture");
+    screen_size_loc_ = glGetUniformLocation(shader_program_, "screenSize");
+    tex_loc_ = glGetUniformLocation(shader_program_, "tex");
+    
     return true;
 }
 
@@ -1835,84 +1973,109 @@ bool Renderer::compile_crt_shader() {
     glDeleteShader(vertex_shader);
     glDeleteShader(fragment_shader);
     
+    // Look up uniform locations once per link (order matches the effect array
+    // uploaded in render_crt_effects)
+    crt_screen_size_loc_ = glGetUniformLocation(crt_shader_program_, "screenSize");
+    crt_time_loc_ = glGetUniformLocation(crt_shader_program_, "time");
+    static const char* const effect_uniforms[7] = {
+        "scanlineIntensity", "warmthIntensity", "glowIntensity", "rgbMaskIntensity",
+        "bloomIntensity", "interlacingIntensity", "flickerIntensity"
+    };
+    for (int i = 0; i < 7; ++i) {
+        crt_effect_locs_[i] = glGetUniformLocation(crt_shader_program_, effect_uniforms[i]);
+    }
+    crt_uniforms_valid_ = false;  // New program starts with default uniform values
+    
     return true;
 }
 
 void Renderer::render_crt_effects(const app::AppState& state, bool scanlines_enabled) {
     if (crt_shader_program_ == 0) return;
     
-    // Check if any effects are active
     const auto& s = state.display_settings;
-    if (s.scanline_intensity <= 0.0f && s.warmth_intensity <= 0.0f && 
-        s.glow_intensity <= 0.0f && s.rgb_mask_intensity <= 0.0f && 
-        s.bloom_intensity <= 0.0f && s.interlacing_intensity <= 0.0f && 
-        s.flicker_intensity <= 0.0f) {
+    
+    // Scanlines are only enabled if the UI is visible (scanlines_enabled flag)
+    // OR if scanline intensity is set to a value > 0 and we want to force them?
+    // User request: "except for the scan lines. Make these only present during the video UI."
+    // So if scanlines_enabled is false, we force intensity to 0.
+    float effective_scanline_intensity = scanlines_enabled ? s.scanline_intensity : 0.0f;
+    const float effects[7] = {
+        effective_scanline_intensity, s.warmth_intensity, s.glow_intensity, s.rgb_mask_intensity,
+        s.bloom_intensity, s.interlacing_intensity, s.flicker_intensity
+    };
+    
+    // Check if any effect would be visible this frame (e.g. scanlines alone while the
+    // UI is hidden leave nothing to draw, so skip the full-screen pass)
+    bool any_effect = false;
+    for (float intensity : effects) {
+        if (intensity > 0.0f) {
+            any_effect = true;
+            break;
+        }
+    }
+    if (!any_effect) {
         return;
     }
     
     glUseProgram(crt_shader_program_);
     
-    // Set uniforms
-    glUniform2f(glGetUniformLocation(crt_shader_program_, "screenSize"), static_cast<float>(width_), static_cast<float>(height_));
+    // Set uniforms (only time changes every frame; the rest are re-sent when they change)
+    float screen_w = static_cast<float>(width_);
+    float screen_h = static_cast<float>(height_);
+    if (!crt_uniforms_valid_ || screen_w != crt_uploaded_width_ || screen_h != crt_uploaded_height_) {
+        glUniform2f(crt_screen_size_loc_, screen_w, screen_h);
+        crt_uploaded_width_ = screen_w;
+        crt_uploaded_height_ = screen_h;
+    }
     
-    auto now = std::chrono::steady_clock::now();
-    float time = std::chrono::duration<float>(now.time_since_epoch()).count();
-    glUniform1f(glGetUniformLocation(crt_shader_program_, "time"), time);
+    float time = std::chrono::duration<float>(frame_time_.time_since_epoch()).count();
+    glUniform1f(crt_time_loc_, time);
     
-    // Scanlines are only enabled if the UI is visible (scanlines_enabled flag)
-    // OR if scanline intensity is set to a value > 0 and we want to force them?
-    // User request: "except for the scan lines. Make these only present during the video UI."
-    // So if scanlines_enabled is false, we force intensity to 0.
-    float effective_scanline_intensity = scanlines_enabled ? s.scanline_intensity : 0.0f;
-    glUniform1f(glGetUniformLocation(crt_shader_program_, "scanlineIntensity"), effective_scanline_intensity);
-    
-    glUniform1f(glGetUniformLocation(crt_shader_program_, "warmthIntensity"), s.warmth_intensity);
-    glUniform1f(glGetUniformLocation(crt_shader_program_, "glowIntensity"), s.glow_intensity);
-    glUniform1f(glGetUniformLocation(crt_shader_program_, "rgbMaskIntensity"), s.rgb_mask_intensity);
-    glUniform1f(glGetUniformLocation(crt_shader_program_, "bloomIntensity"), s.bloom_intensity);
-    glUniform1f(glGetUniformLocation(crt_shader_program_, "interlacingIntensity"), s.interlacing_intensity);
-    glUniform1f(glGetUniformLocation(crt_shader_program_, "flickerIntensity"), s.flicker_intensity);
-    
-    // Draw full screen quad
-    // We reuse the existing VBO which has a quad from (-1,-1) to (1,1) in clip space?
-    // Wait, the vertex shader expects 'position' and 'texCoord'.
-    // The VBO setup in initialize() creates a quad for the whole screen.
-    // Vertex shader:
-    // in vec2 position;
-    // in vec2 texCoord;
-    // uniform vec2 screenSize;
-    // normalizedPos = (position / screenSize) * 2.0 - 1.0;
-    
-    // So we need to pass position as screen coordinates (0..width, 0..height)
-    // The VBO setup in initialize() creates a quad:
-    // 0, 0, 0, 0
-    // width, 0, 1, 0
-    // width, height, 1, 1
-    // 0, height, 0, 1
-    // Wait, I need to check initialize() again to be sure about VBO content.
-    // But draw_quad uses it.
-    
-    // Let's just use draw_quad? No, draw_quad uses shader_program_.
-    // We need to manually draw using crt_shader_program_.
-    
-    // Re-upload quad data to VBO if needed?
-    // draw_quad uploads data every time.
-    // Let's do the same here for simplicity.
+    for (int i = 0; i < 7; ++i) {
+        if (!crt_uniforms_valid_ || effects[i] != crt_uploaded_effects_[i]) {
+            glUniform1f(crt_effect_locs_[i], effects[i]);
+            crt_uploaded_effects_[i] = effects[i];
+        }
+    }
+    crt_uniforms_valid_ = true;
     
-    float vertices[] = {
-        0.0f, 0.0f, 0.0f, 0.0f,
-        static_cast<float>(width_), 0.0f, 1.0f, 0.0f,
-        static_cast<float>(width_), static_cast<float>(height_), 1.0f, 1.0f,
+    // Draw full screen quad in screen coordinates (the vertex shader normalizes by screenSize).
+    // The quad lives in its own VAO/VBO and is only re-uploaded when the screen size changes.
+    if (crt_vao_ == 0) {
+        glGenVertexArrays(1, &crt_vao_);
+        glGenBuffers(1, &crt_vbo_);
         
-        0.0f, 0.0f, 0.0f, 0.0f,
-        static_cast<float>(width_), static_cast<float>(height_), 1.0f, 1.0f,
-        0.0f, static_cast<float>(height_), 0.0f, 1.0f
-    };
+        glBindVertexArray(crt_vao_);
+        glBindBuffer(GL_ARRAY_BUFFER, crt_vbo_);
+        
+        // Vertex attributes: position (2), texCoord (2)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 4 * sizeof(float), (void*)0);
+        glEnableVertexAttribArray(0);
+        glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, 4 * sizeof(float), (void*)(2 * sizeof(float)));
+        glEnableVertexAttribArray(1);
+        
+        crt_quad_width_ = 0.0f;
+        crt_quad_height_ = 0.0f;
+    } else {
+        glBindVertexArray(crt_vao_);
+        glBindBuffer(GL_ARRAY_BUFFER, crt_vbo_);
+    }
     
-    glBindBuffer(GL_ARRAY_BUFFER, vbo_);
-    glBufferData(GL_ARRAY_BUFFER, sizeof(vertices), vertices, GL_DYNAMIC_DRAW);
+    if (screen_w != crt_quad_width_ || screen_h != crt_quad_height_) {
+        float vertices[] = {
+            0.0f, 0.0f, 0.0f, 0.0f,
+            screen_w, 0.0f, 1.0f, 0.0f,
+            screen_w, screen_h, 1.0f, 1.0f,
+            
+            0.0f, 0.0f, 0.0f, 0.0f,
+            screen_w, screen_h, 1.0f, 1.0f,
+            0.0f, screen_h, 0.0f, 1.0f
+        };
+        glBufferData(GL_ARRAY_BUFFER, sizeof(vertices), vertices, GL_STATIC_DRAW);
+        crt_quad_width_ = screen_w;
+        crt_quad_height_ = screen_h;
+    }
     
-    glBindVertexArray(vao_);
     glDrawArrays(GL_TRIANGLES, 0, 6);
     glBindVertexArray(0);
     
@@ -1937,6 +2100,14 @@ void Renderer::cleanup() {
         glDeleteBuffers(1, &vbo_);
         vbo_ = 0;
     }
+    if (crt_vao_ != 0) {
+        glDeleteVertexArrays(1, &crt_vao_);
+        crt_vao_ = 0;
+    }
+    if (crt_vbo_ != 0) {
+        glDeleteBuffers(1, &crt_vbo_);
+        crt_vbo_ = 0;
+    }
     if (title_font_manager_) {
         title_font_manager_->cleanup();
     }
@@ -1,6 +1,8 @@
 #pragma once
 
+#include <chrono>
 #include <cstdint>
+#include <future>
 #include <string>
 #include <vector>
 #include <memory>
@@ -39,6 +41,10 @@ public:
     // Render loading overlay
     void render_loading_overlay(const app::AppState& state);
     
+    // Blink phase for the selection indicator and text cursor (flips every 500ms).
+    // The main loop uses it to know when an otherwise idle screen needs repainting.
+    static int64_t blink_phase(std::chrono::steady_clock::time_point now);
+    
     // Render CRT effects (scanlines, warmth, glow, etc.)
     // scanlines_enabled: if true, scanlines are rendered (based on settings), otherwise forced off
     void render_crt_effects(const app::AppState& state, bool scanlines_enabled);
@@ -52,7 +58,12 @@ public:
     
     // Bezel management for Modern TV mode
     bool load_bezel(const std::string& path);  // Load bezel texture from file
-    void render_bezel();  // Render bezel overlay (fullscreen)
+    // Start decoding a bezel PNG on a background thread so the first load_bezel()
+    // for it only has to upload the texture
+    void prefetch_bezel(const std::string& path);
+    // Render bezel overlay (fullscreen); the bezel's fully transparent screen area
+    // (measured when it is decoded) is left undrawn
+    void render_bezel();
     
     // Set content viewport dimensions for Modern TV mode (4:3 pillarboxing)
     // This affects the projection matrix used for rendering
@@ -77,16 +88,76 @@ private:
     uint32_t vao_;
     uint32_t vbo_;
     
+    // Cached uniform locations for shader_program_ (refreshed in compile_shaders)
+    int32_t color_loc_ = -1;
+    int32_t use_texture_loc_ = -1;
+    int32_t screen_size_loc_ = -1;
+    int32_t tex_loc_ = -1;
+    
+    // Cached uniform locations for crt_shader_program_ (refreshed in compile_crt_shader)
+    int32_t crt_screen_size_loc_ = -1;
+    int32_t crt_time_loc_ = -1;
+    int32_t crt_effect_locs_[7] = {-1, -1, -1, -1, -1, -1, -1};
+    
+    // Last values uploaded to crt_shader_program_. Uniforms persist with the program,
+    // so unchanged CRT settings are not re-sent every frame
+    bool crt_uniforms_valid_ = false;
+    float crt_uploaded_width_ = 0.0f;
+    float crt_uploaded_height_ = 0.0f;
+    float crt_uploaded_effects_[7] = {};
+    
+    // Full-screen quad for the CRT pass in its own buffer, so it is only
+    // re-uploaded when the screen size changes (vbo_ is rewritten by every draw_quad)
+    uint32_t crt_vao_ = 0;
+    uint32_t crt_vbo_ = 0;
+    float crt_quad_width_ = 0.0f;
+    float crt_quad_height_ = 0.0f;
+    
+    // Timestamp taken once at the top of render() and shared by the whole frame
+    std::chrono::steady_clock::time_point frame_time_;
+    
     // Logo
     uint32_t logo_texture_id_;
     int logo_width_;
     int logo_height_;
+    // Decoded RGBA logo, kept to re-upload after reset_gl() without another PNG decode
+    std::vector<unsigned char> logo_pixels_;
+    
+    // Largest fully transparent rectangle around the bezel's center, in texture
+    // pixels (top-left origin). Empty if the center is not transparent.
+    struct BezelHole {
+        int x = 0;
+        int y = 0;
+        int w = 0;
+        int h = 0;
+    };
+    static BezelHole find_bezel_hole(const unsigned char* rgba, int width, int height);
     
     // Bezel overlay
     uint32_t bezel_texture_id_ = 0;
     int bezel_width_ = 0;
     int bezel_height_ = 0;
+    BezelHole bezel_hole_;
     std::string current_bezel_path_;
+    // Last bezel swapped out, kept uploaded so flipping back (or returning from the
+    // built-in bezel) doesn't decode the 1080p PNG again. Only one is kept to bound
+    // GPU memory.
+    uint32_t previous_bezel_texture_id_ = 0;
+    int previous_bezel_width_ = 0;
+    int previous_bezel_height_ = 0;
+    BezelHole previous_bezel_hole_;
+    std::string previous_bezel_path_;
+    
+    // Bezel pixels decoded off the render thread (GL calls must stay on it)
+    struct DecodedBezel {
+        unsigned char* data = nullptr;
+        int width = 0;
+        int height = 0;
+        BezelHole hole;
+    };
+    static DecodedBezel decode_bezel(const std::string& path);
+    std::future<DecodedBezel> bezel_prefetch_;
+    std::string bezel_prefetch_path_;
     
     // Helper methods
     void draw_quad(float x, float y, float w, float h, const ui::Color& color, float alpha_multiplier = 1.0f);
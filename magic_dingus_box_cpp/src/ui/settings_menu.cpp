@@ -5,6 +5,7 @@
 #include <cmath>
 #include <cstdlib>  // For std::max
 #include <iostream>
+#include <unordered_map>
 #include <ifaddrs.h>
 #include <net/if.h>
 #include <sys/types.h>
@@ -114,65 +115,36 @@ std::vector<MenuItem> SettingsMenuManager::build_display_submenu() {
     }
     
     // CRT effect settings (show for both modes, but mostly useful for CRT Native)
-    items.insert(items.end(), {
-        MenuItem("Scanlines: " + intensity_to_label(settings.scanline_intensity), 
-                 MenuSection::CYCLE_SCANLINES, "CRT lines", 
-                 [&]() { 
-                     settings.cycle_setting(settings.scanline_intensity); 
-                     rebuild_current_submenu();
-                     app::SettingsPersistence::save_settings(*app_state_); 
-                 }),
-                 
-        MenuItem("Color Warmth: " + intensity_to_label(settings.warmth_intensity), 
-                 MenuSection::CYCLE_WARMTH, "Temperature",
-                 [&]() { 
-                     settings.cycle_setting(settings.warmth_intensity); 
-                     rebuild_current_submenu();
-                     app::SettingsPersistence::save_settings(*app_state_); 
-                 }),
-                 
-        MenuItem("Phosphor Glow: " + intensity_to_label(settings.glow_intensity), 
-                 MenuSection::CYCLE_GLOW, "Radial glow",
-                 [&]() { 
-                     settings.cycle_setting(settings.glow_intensity); 
-                     rebuild_current_submenu();
-                     app::SettingsPersistence::save_settings(*app_state_); 
-                 }),
-                 
-        MenuItem("RGB Mask: " + intensity_to_label(settings.rgb_mask_intensity), 
-                 MenuSection::CYCLE_PHOSPHOR_MASK, "RGB stripes",
-                 [&]() { 
-                     settings.cycle_setting(settings.rgb_mask_intensity); 
-                     rebuild_current_submenu();
-                     app::SettingsPersistence::save_settings(*app_state_); 
-                 }),
-                 
-        MenuItem("Screen Bloom: " + intensity_to_label(settings.bloom_intensity), 
-                 MenuSection::CYCLE_BLOOM, "Bright glow",
-                 [&]() { 
-                     settings.cycle_setting(settings.bloom_intensity); 
-                     rebuild_current_submenu();
-                     app::SettingsPersistence::save_settings(*app_state_); 
-                 }),
-                 
-        MenuItem("Interlacing: " + intensity_to_label(settings.interlacing_intensity), 
-                 MenuSection::CYCLE_INTERLACING, "Video lines",
-                 [&]() { 
-                     settings.cycle_setting(settings.interlacing_intensity); 
-                     rebuild_current_submenu();
-                     app::SettingsPersistence::save_settings(*app_state_); 
-                 }),
-                 
-        MenuItem("Flicker: " + intensity_to_label(settings.flicker_intensity), 
-                 MenuSection::CYCLE_FLICKER, "Subtle pulse",
-                 [&]() { 
-                     settings.cycle_setting(settings.flicker_intensity); 
-                     rebuild_current_submenu();
-                     app::SettingsPersistence::save_settings(*app_state_); 
-                 }),
-                 
-        MenuItem("Back", MenuSection::BACK)
-    });
+    // Every effect is the same "cycle intensity, rebuild, save" item, so build them from a table
+    using Settings = app::AppState::DisplaySettings;
+    struct CrtEffectItem {
+        const char* label;
+        MenuSection section;
+        const char* sublabel;
+        float Settings::* intensity;
+    };
+    static const CrtEffectItem crt_effects[] = {
+        {"Scanlines: ",     MenuSection::CYCLE_SCANLINES,      "CRT lines",    &Settings::scanline_intensity},
+        {"Color Warmth: ",  MenuSection::CYCLE_WARMTH,         "Temperature",  &Settings::warmth_intensity},
+        {"Phosphor Glow: ", MenuSection::CYCLE_GLOW,           "Radial glow",  &Settings::glow_intensity},
+        {"RGB Mask: ",      MenuSection::CYCLE_PHOSPHOR_MASK,  "RGB stripes",  &Settings::rgb_mask_intensity},
+        {"Screen Bloom: ",  MenuSection::CYCLE_BLOOM,          "Bright glow",  &Settings::bloom_intensity},
+        {"Interlacing: ",   MenuSection::CYCLE_INTERLACING,    "Video lines",  &Settings::interlacing_intensity},
+        {"Flicker: ",       MenuSection::CYCLE_FLICKER,        "Subtle pulse", &Settings::flicker_intensity},
+    };
+    
+    for (const auto& effect : crt_effects) {
+        float Settings::* intensity = effect.intensity;
+        items.emplace_back(effect.label + intensity_to_label(settings.*intensity),
+                           effect.section, effect.sublabel,
+                           [this, intensity]() {
+                               auto& display = app_state_->display_settings;
+                               display.cycle_setting(display.*intensity);
+                               rebuild_current_submenu();
+                               app::SettingsPersistence::save_settings(*app_state_);
+                           });
+    }
+    items.emplace_back("Back", MenuSection::BACK);
     
     return items;
 }
@@ -309,23 +281,29 @@ void SettingsMenuManager::enter_submenu(MenuSection section) {
     selected_index_ = 0;
     scroll_offset_ = 0;
     
-    if (section == MenuSection::VIDEO_GAMES) {
-        submenu_items_ = build_games_submenu();
-    } else if (section == MenuSection::DISPLAY) {
-        submenu_items_ = build_display_submenu();
-    } else if (section == MenuSection::AUDIO) {
-        submenu_items_ = build_audio_submenu();
-    } else if (section == MenuSection::SYSTEM) {
-        submenu_items_ = build_system_submenu();
-    } else if (section == MenuSection::WIFI) {
-        submenu_items_ = build_wifi_submenu();
-    } else if (section == MenuSection::WIFI_NETWORKS) {
-        submenu_items_ = build_wifi_networks_submenu();
-    } else if (section == MenuSection::INFO) {
-        submenu_items_ = build_info_submenu();
+    auto builder = submenu_builders().find(section);
+    if (builder != submenu_builders().end()) {
+        submenu_items_ = (this->*(builder->second))();
     }
 }
 
+bool SettingsMenuManager::has_submenu(MenuSection section) {
+    return submenu_builders().count(section) > 0;
+}
+
+const std::unordered_map<MenuSection, SettingsMenuManager::SubmenuBuilder>& SettingsMenuManager::submenu_builders() {
+    static const std::unordered_map<MenuSection, SubmenuBuilder> builders = {
+        {MenuSection::VIDEO_GAMES, &SettingsMenuManager::build_games_submenu},
+        {MenuSection::DISPLAY, &SettingsMenuManager::build_display_submenu},
+        {MenuSection::AUDIO, &SettingsMenuManager::build_audio_submenu},
+        {MenuSection::SYSTEM, &SettingsMenuManager::build_system_submenu},
+        {MenuSection::WIFI, &SettingsMenuManager::build_wifi_submenu},
+        {MenuSection::WIFI_NETWORKS, &SettingsMenuManager::build_wifi_networks_submenu},
+        {MenuSection::INFO, &SettingsMenuManager::build_info_submenu},
+    };
+    return builders;
+}
+
 void SettingsMenuManager::exit_submenu() {
     current_submenu_ = MenuSection::BACK;
     selected_index_ = 0;
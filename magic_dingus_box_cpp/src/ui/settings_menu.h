@@ -4,6 +4,7 @@
 #include <vector>
 #include <functional>
 #include <chrono>
+#include <unordered_map>
 
 namespace app {
     struct AppState;
@@ -70,6 +71,7 @@ public:
     MenuSection select_current();
     
     void enter_submenu(MenuSection section);
+    static bool has_submenu(MenuSection section);
     void exit_submenu();
     void rebuild_current_submenu();
     
@@ -118,6 +120,10 @@ private:
     int current_game_playlist_index_;
     int selected_game_in_playlist_;
     
+    // Submenu builders keyed by section, so entering a submenu is one lookup
+    using SubmenuBuilder = std::vector<MenuItem> (SettingsMenuManager::*)();
+    static const std::unordered_map<MenuSection, SubmenuBuilder>& submenu_builders();
+    
     std::vector<MenuItem> build_games_submenu();
     std::vector<MenuItem> build_display_submenu();
     std::vector<MenuItem> build_audio_submenu();
@@ -9,47 +9,77 @@ namespace config {
 // =============================================================================
 // Base Paths
 // =============================================================================
+// Environment overrides are fixed for the life of the process, so each of these
+// is resolved on first use and the cached string is returned afterwards.
 
 std::string get_base_path() {
-    if (const char* env = std::getenv("MAGIC_BASE_PATH")) {
-        return env;
-    }
-    return "/opt/magic_dingus_box";
+    static const std::string path = []() -> std::string {
+        if (const char* env = std::getenv("MAGIC_BASE_PATH")) {
+            return env;
+        }
+        return "/opt/magic_dingus_box";
+    }();
+    return path;
 }
 
 std::string get_app_path() {
-    if (const char* env = std::getenv("MAGIC_APP_PATH")) {
-        return env;
-    }
-    return get_base_path() + "/magic_dingus_box_cpp";
+    static const std::string path = []() -> std::string {
+        if (const char* env = std::getenv("MAGIC_APP_PATH")) {
+            return env;
+        }
+        return get_base_path() + "/magic_dingus_box_cpp";
+    }();
+    return path;
 }
 
 std::string get_data_path() {
-    if (const char* env = std::getenv("MAGIC_DATA_PATH")) {
-        return env;
-    }
-    return get_app_path() + "/data";
+    static const std::string path = []() -> std::string {
+        if (const char* env = std::getenv("MAGIC_DATA_PATH")) {
+            return env;
+        }
+        return get_app_path() + "/data";
+    }();
+    return path;
 }
 
 std::string get_config_path() {
-    if (const char* env = std::getenv("MAGIC_CONFIG_PATH")) {
-        return env;
-    }
-    return get_base_path() + "/config";
+    static const std::string path = []() -> std::string {
+        if (const char* env = std::getenv("MAGIC_CONFIG_PATH")) {
+            return env;
+        }
+        return get_base_path() + "/config";
+    }();
+    return path;
 }
 
 std::string get_assets_path() {
-    if (const char* env = std::getenv("MAGIC_ASSETS_PATH")) {
-        return env;
-    }
-    return get_app_path() + "/assets";
+    static const std::string path = []() -> std::string {
+        if (const char* env = std::getenv("MAGIC_ASSETS_PATH")) {
+            return env;
+        }
+        return get_app_path() + "/assets";
+    }();
+    return path;
 }
 
 std::string get_home_path() {
-    if (const char* env = std::getenv("HOME")) {
-        return env;
-    }
-    return "/home/magic";
+    static const std::string path = []() -> std::string {
+        if (const char* env = std::getenv("HOME")) {
+            return env;
+        }
+        return "/home/magic";
+    }();
+    return path;
+}
+
+std::string get_ui_service_name() {
+    static const std::string name = []() -> std::string {
+        if (const char* env = std::getenv("MAGIC_UI_SERVICE")) {
+            return env;
+        }
+        return "magic-dingus-box-cpp.service";
+    }();
+    return name;
 }
 
 // =============================================================================
@@ -57,19 +87,37 @@ std::string get_home_path() {
 // =============================================================================
 
 std::string get_settings_file() {
-    if (const char* env = std::getenv("MAGIC_SETTINGS_FILE")) {
-        return env;
-    }
-    return get_config_path() + "/settings.json";
+    static const std::string path = []() -> std::string {
+        if (const char* env = std::getenv("MAGIC_SETTINGS_FILE")) {
+            return env;
+        }
+        return get_config_path() + "/settings.json";
+    }();
+    return path;
 }
 
 std::string get_log_file() {
-    if (const char* env = std::getenv("MAGIC_LOG_FILE")) {
-        return env;
-    }
-    // Return empty string to disable file logging, or return a path to enable it
-    // File logging can be disabled by setting MAGIC_LOG_FILE=""
-    return get_config_path() + "/magic_dingus_box.log";
+    static const std::string path = []() -> std::string {
+        if (const char* env = std::getenv("MAGIC_LOG_FILE")) {
+            return env;
+        }
+        // Return empty string to disable file logging, or return a path to enable it
+        // File logging can be disabled by setting MAGIC_LOG_FILE=""
+        return get_config_path() + "/magic_dingus_box.log";
+    }();
+    return path;
+}
+
+std::string get_audio_device_cache_file() {
+    return get_config_path() + "/audio_device.json";
+}
+
+std::string get_playlist_cache_file() {
+    return get_config_path() + "/playlist_cache.json";
+}
+
+std::string get_instance_lock_file() {
+    return get_config_path() + "/engine.lock";
 }
 
 std::string get_playlists_dir() {
@@ -27,6 +27,10 @@ std::string get_assets_path();
 // Get the user home directory (HOME or /home/magic)
 std::string get_home_path();
 
+// Get the systemd unit to restart after an external app exits
+// (MAGIC_UI_SERVICE or magic-dingus-box-cpp.service)
+std::string get_ui_service_name();
+
 // =============================================================================
 // Specific File/Directory Paths
 // =============================================================================
@@ -37,6 +41,15 @@ std::string get_settings_file();
 // Log file ($CONFIG/magic_dingus_box.log)
 std::string get_log_file();
 
+// Cached ALSA device for RetroArch ($CONFIG/audio_device.json)
+std::string get_audio_device_cache_file();
+
+// Parsed playlist cache keyed by YAML mtime/size ($CONFIG/playlist_cache.json)
+std::string get_playlist_cache_file();
+
+// Single-instance lock file ($CONFIG/engine.lock)
+std::string get_instance_lock_file();
+
 // Playlists directory ($DATA/playlists)
 std::string get_playlists_dir();
 
@@ -80,6 +80,28 @@ inline void set_debug_mode(bool enable) {
     set_console_level(enable ? spdlog::level::debug : spdlog::level::info);
 }
 
+/**
+ * Check whether a message at the given level would reach any sink.
+ * Use this to skip work that only exists to produce a log message.
+ * @param level The log level to test
+ */
+inline bool is_enabled(spdlog::level::level_enum level) {
+    // The LOG_* macros compile out anything below SPDLOG_ACTIVE_LEVEL
+    if (static_cast<int>(level) < SPDLOG_ACTIVE_LEVEL) {
+        return false;
+    }
+    auto logger = spdlog::default_logger();
+    if (!logger) {
+        return false;
+    }
+    for (const auto& sink : logger->sinks()) {
+        if (sink->should_log(level)) {
+            return true;
+        }
+    }
+    return false;
+}
+
 } // namespace logging
 
 // Convenience macros for logging with source location
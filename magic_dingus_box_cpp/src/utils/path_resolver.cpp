@@ -3,6 +3,7 @@
 
 #include <filesystem>
 #include <iostream>
+#include <unordered_map>
 
 namespace fs = std::filesystem;
 
@@ -44,17 +45,19 @@ static std::string find_fuzzy_match(const fs::path& dir, const std::string& file
     return "";
 }
 
-std::string resolve_video_path(const std::string& item_path, const std::string& playlist_dir) {
-    if (item_path.empty()) {
-        return "";
-    }
+// Runs the resolution strategies below; empty if none of them found the file
+static std::string resolve_uncached(const std::string& item_path, const std::string& playlist_dir) {
 
     fs::path p(item_path);
     std::string path_str = item_path;
     
+    // Classify the prefix once; find() == 0 would search the whole path when it doesn't match
+    const bool is_dev_data = path_str.compare(0, 9, "dev_data/") == 0;
+    const bool is_data = !is_dev_data && path_str.compare(0, 5, "data/") == 0;
+    
     // Strategy 1: Check absolute path or relative to app path
     // Handle relative paths that start with dev_data/ or data/
-    if (path_str.find("dev_data/") == 0 || path_str.find("data/") == 0) {
+    if (is_dev_data || is_data) {
         std::string absolute_path = config::get_app_path() + "/" + path_str;
         if (fs::exists(absolute_path)) {
             std::cout << "Resolved path: " << item_path << " -> " << absolute_path << std::endl;
@@ -67,7 +70,7 @@ std::string resolve_video_path(const std::string& item_path, const std::string&
         if (!fuzzy.empty()) return fuzzy;
 
         // Fallback: If dev_data/, try data/
-        if (path_str.find("dev_data/") == 0) {
+        if (is_dev_data) {
             std::string data_path_str = path_str;
             data_path_str.replace(0, 8, "data"); // replace dev_data with data
             std::string data_absolute_path = config::get_app_path() + "/" + data_path_str;
@@ -87,7 +90,7 @@ std::string resolve_video_path(const std::string& item_path, const std::string&
         }
 
         // Fallback: try old dev_data mapping for backward compatibility
-        if (path_str.find("dev_data/") == 0) {
+        if (is_dev_data) {
             std::string old_data_path = config::get_home_path() + "/magic_dingus_box/" + path_str;
             if (fs::exists(old_data_path)) {
                 std::cout << "Resolved path (old location): " << item_path << " -> " << old_data_path << std::endl;
@@ -182,10 +185,41 @@ std::string resolve_video_path(const std::string& item_path, const std::string&
         // Canonical failed, continue to next option
     }
     
-    // Fallback: return original path (mpv might handle it)
-    std::cerr << "Warning: Could not resolve video path: " << item_path << std::endl;
-    std::cerr << "  Tried all resolution strategies, file not found" << std::endl;
-    return item_path;
+    return "";
+}
+
+std::string resolve_video_path(const std::string& item_path, const std::string& playlist_dir) {
+    if (item_path.empty()) {
+        return "";
+    }
+
+    // Playlists loop and shuffle over the same items, so remember where each one was
+    // found. A remembered path costs one stat to confirm; if the file has since been
+    // removed or replaced (e.g. through the web admin) the strategies run again.
+    static std::unordered_map<std::string, std::string> resolved_cache;
+    std::string key = playlist_dir;
+    key += '\0';
+    key += item_path;
+
+    auto it = resolved_cache.find(key);
+    if (it != resolved_cache.end()) {
+        std::error_code ec;
+        if (fs::exists(it->second, ec)) {
+            return it->second;
+        }
+        resolved_cache.erase(it);
+    }
+
+    std::string resolved = resolve_uncached(item_path, playlist_dir);
+    if (resolved.empty()) {
+        // Fallback: return original path (mpv might handle it)
+        std::cerr << "Warning: Could not resolve video path: " << item_path << std::endl;
+        std::cerr << "  Tried all resolution strategies, file not found" << std::endl;
+        return item_path;
+    }
+
+    resolved_cache.emplace(std::move(key), resolved);
+    return resolved;
 }
 
 } // namespace utils
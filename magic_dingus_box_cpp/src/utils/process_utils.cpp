@@ -0,0 +1,98 @@
+#include "process_utils.h"
+
+#include <dirent.h>
+#include <signal.h>
+#include <unistd.h>
+#include <algorithm>
+#include <cctype>
+#include <climits>
+#include <cstdlib>
+#include <cstring>
+#include <fstream>
+#include <functional>
+#include <iterator>
+#include <regex>
+
+namespace utils {
+
+// Read /proc/<pid>/<name>; empty if the process is gone or the file is unreadable
+static std::string read_proc_file(const char* pid, const char* name) {
+    std::ifstream file(std::string("/proc/") + pid + "/" + name, std::ios::binary);
+    if (!file) return "";
+    return std::string(std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>());
+}
+
+// Visit every numeric /proc entry except our own, collecting PIDs the predicate accepts
+static std::vector<pid_t> scan_processes(const std::function<bool(const char* pid)>& matches) {
+    std::vector<pid_t> pids;
+    DIR* proc = opendir("/proc");
+    if (!proc) return pids;
+
+    const pid_t self = getpid();
+    while (struct dirent* entry = readdir(proc)) {
+        const char* name = entry->d_name;
+        if (!std::all_of(name, name + std::char_traits<char>::length(name),
+                         [](unsigned char c) { return std::isdigit(c); })) {
+            continue;
+        }
+        pid_t pid = static_cast<pid_t>(std::strtol(name, nullptr, 10));
+        if (pid == self) continue;
+        if (matches(name)) {
+            pids.push_back(pid);
+        }
+    }
+    closedir(proc);
+    return pids;
+}
+
+std::vector<pid_t> find_processes_by_name(const std::string& name) {
+    return scan_processes([&name](const char* pid) {
+        return read_proc_file(pid, "comm").find(name) != std::string::npos;
+    });
+}
+
+std::vector<pid_t> find_processes_by_cmdline(const std::string& pattern) {
+    const std::regex re(pattern, std::regex::extended);
+    return scan_processes([&re](const char* pid) {
+        // Arguments are NUL-separated; join them with spaces as pgrep -f does
+        std::string cmdline = read_proc_file(pid, "cmdline");
+        while (!cmdline.empty() && cmdline.back() == '\0') cmdline.pop_back();
+        if (cmdline.empty()) return false;  // Kernel threads have no command line
+        std::replace(cmdline.begin(), cmdline.end(), '\0', ' ');
+        return std::regex_search(cmdline, re);
+    });
+}
+
+std::vector<pid_t> find_processes_with_open_file(const std::string& path_prefix) {
+    return scan_processes([&path_prefix](const char* pid) {
+        const std::string fd_dir = std::string("/proc/") + pid + "/fd";
+        DIR* fds = opendir(fd_dir.c_str());
+        if (!fds) return false;  // Gone, or not ours to inspect
+        bool found = false;
+        char target[PATH_MAX];
+        while (struct dirent* entry = readdir(fds)) {
+            if (entry->d_name[0] == '.') continue;
+            const std::string link = fd_dir + "/" + entry->d_name;
+            ssize_t len = readlink(link.c_str(), target, sizeof(target) - 1);
+            if (len >= static_cast<ssize_t>(path_prefix.size()) &&
+                std::strncmp(target, path_prefix.c_str(), path_prefix.size()) == 0) {
+                found = true;
+                break;
+            }
+        }
+        closedir(fds);
+        return found;
+    });
+}
+
+int signal_processes(const std::vector<pid_t>& pids, int sig) {
+    int signalled = 0;
+    for (pid_t pid : pids) {
+        if (kill(pid, sig) == 0) {
+            ++signalled;
+        }
+    }
+    return signalled;
+}
+
+} // namespace utils
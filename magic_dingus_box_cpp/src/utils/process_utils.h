@@ -0,0 +1,25 @@
+#pragma once
+
+#include <string>
+#include <vector>
+#include <sys/types.h>
+
+namespace utils {
+
+// Process lookup by scanning /proc directly, instead of forking pgrep/pkill
+// (which walk /proc themselves). The calling process is never matched.
+
+// PIDs whose process name (/proc/<pid>/comm) contains name, like `pgrep name`
+std::vector<pid_t> find_processes_by_name(const std::string& name);
+
+// PIDs whose full command line matches the extended regex pattern, like `pgrep -f pattern`
+std::vector<pid_t> find_processes_by_cmdline(const std::string& pattern);
+
+// PIDs holding an open file whose path starts with path_prefix (e.g. "/dev/snd/"),
+// like `lsof | grep`. Only processes whose fd table we may read are seen.
+std::vector<pid_t> find_processes_with_open_file(const std::string& path_prefix);
+
+// Send sig to each PID, like `pkill -<sig>`. Returns how many were signalled.
+int signal_processes(const std::vector<pid_t>& pids, int sig);
+
+} // namespace utils
@@ -6,6 +6,12 @@
 #include <algorithm>
 #include <thread>
 #include <cstdio>
+#include <cstdlib>
+#include <unistd.h>
+#include <arpa/inet.h>
+#include <ifaddrs.h>
+#include <net/if.h>
+#include <netinet/in.h>
 
 namespace utils {
 
@@ -25,9 +31,19 @@ WifiManager::~WifiManager() {
 }
 
 bool WifiManager::initialize() {
-    // Check if nmcli exists
-    std::string output = exec_command("which nmcli");
-    return !output.empty();
+    // Check if nmcli exists (resolved once, by walking PATH like `which` does)
+    static const bool has_nmcli = []() {
+        const char* path = std::getenv("PATH");
+        std::istringstream dirs(path ? path : "/usr/local/bin:/usr/bin:/bin");
+        std::string dir;
+        while (std::getline(dirs, dir, ':')) {
+            if (!dir.empty() && access((dir + "/nmcli").c_str(), X_OK) == 0) {
+                return true;
+            }
+        }
+        return false;
+    }();
+    return has_nmcli;
 }
 
 void WifiManager::scan_networks_async() {
@@ -76,19 +92,24 @@ void WifiManager::connect_async(const std::string& ssid, const std::string& pass
         std::string cmd;
         
         // Delete existing connections with matching SSID to avoid "property is missing" errors
-        // Use UUIDs to avoid ambiguity with names containing spaces
-        std::string list_out = exec_command("sudo nmcli -t -f UUID,NAME connection show");
+        // Use UUIDs to avoid ambiguity with names containing spaces. Listing the type too
+        // lets wired/loopback profiles be skipped without an nmcli query each.
+        std::string list_out = exec_command("sudo nmcli -t -f UUID,TYPE,NAME connection show");
         std::istringstream stream(list_out);
         std::string line;
         while (std::getline(stream, line)) {
             if (line.empty()) continue;
             
-            // Format is UUID:NAME
+            // Format is UUID:TYPE:NAME (UUIDs and type names contain no colons)
             size_t colon = line.find(':');
             if (colon == std::string::npos) continue;
+            size_t type_colon = line.find(':', colon + 1);
+            if (type_colon == std::string::npos) continue;
             
             std::string uuid = line.substr(0, colon);
-            std::string name = line.substr(colon + 1);
+            std::string type = line.substr(colon + 1, type_colon - colon - 1);
+            std::string name = line.substr(type_colon + 1);
+            if (type != "802-11-wireless") continue;
             
             // Query SSID for this connection using UUID
             std::string query = "sudo nmcli -t -f 802-11-wireless.ssid connection show " + uuid + " 2>/dev/null";
@@ -136,6 +157,7 @@ void WifiManager::connect_async(const std::string& ssid, const std::string& pass
             connection_result_ = ConnectionResult::FAILURE;
         }
         
+        invalidate_status_cache();
         is_connecting_ = false;
     }).detach();
 }
@@ -146,40 +168,66 @@ void WifiManager::reset_connection_state() {
 }
 
 std::string WifiManager::get_current_ssid() {
-    // Get active connection on wifi device
-    // nmcli -t -f NAME connection show --active
-    // This might show UUIDs or other connections, simpler to look at wifi status
-    std::string output = exec_command("nmcli -t -f GENERAL.CONNECTION dev show wlan0 2>/dev/null");
-    if (output.empty()) {
-        // Try simple scan of in-use
-         output = exec_command("nmcli -t -f SSID,IN-USE dev wifi list | grep ':*'");
-         // Only useful if we parse.
-         // Let's stick to device show
-         // Fallback if wlan0 isn't the interface name?
-         // Try general active connections of type wifi
-         output = exec_command("nmcli -t -f NAME,TYPE connection show --active | grep ':802-11-wireless' | cut -d: -f1");
-    }
-    
-    // Clean up output (remove newlines)
-    output.erase(std::remove(output.begin(), output.end(), '\n'), output.end());
-    // remove "GENERAL.CONNECTION:" prefix if present from device show
-    size_t colon = output.find(':');
-    if (colon != std::string::npos) {
-        output = output.substr(colon + 1);
-    }
-    
-    return output;
+    return cached_status(ssid_status_, [this]() {
+        // Get active connection on wifi device
+        // nmcli -t -f NAME connection show --active
+        // This might show UUIDs or other connections, simpler to look at wifi status
+        std::string output = exec_command("nmcli -t -f GENERAL.CONNECTION dev show wlan0 2>/dev/null");
+        if (output.empty()) {
+             // Fallback if wlan0 isn't the interface name?
+             // Try general active connections of type wifi
+             output = exec_command("nmcli -t -f NAME,TYPE connection show --active | grep ':802-11-wireless' | cut -d: -f1");
+        }
+        
+        // Clean up output (remove newlines)
+        output.erase(std::remove(output.begin(), output.end(), '\n'), output.end());
+        // remove "GENERAL.CONNECTION:" prefix if present from device show
+        size_t colon = output.find(':');
+        if (colon != std::string::npos) {
+            output = output.substr(colon + 1);
+        }
+        
+        return output;
+    });
 }
 
 std::string WifiManager::get_ip_address() {
-    std::string output = exec_command("hostname -I | cut -d' ' -f1"); // quick hack
-    output.erase(std::remove(output.begin(), output.end(), '\n'), output.end());
-    return output;
+    return cached_status(ip_status_, [this]() {
+        // Same pick as `hostname -I | cut -d' ' -f1` (first non-loopback, non-link-local
+        // address, IPv4 before IPv6), read in-process rather than forking a pipeline
+        struct ifaddrs* addrs = nullptr;
+        if (getifaddrs(&addrs) != 0) {
+            return std::string();
+        }
+        std::string ipv4, ipv6;
+        for (struct ifaddrs* ifa = addrs; ifa && ipv4.empty(); ifa = ifa->ifa_next) {
+            if (!ifa->ifa_addr || !(ifa->ifa_flags & IFF_UP) || (ifa->ifa_flags & IFF_LOOPBACK)) {
+                continue;
+            }
+            char buf[INET6_ADDRSTRLEN];
+            if (ifa->ifa_addr->sa_family == AF_INET) {
+                auto* sin = reinterpret_cast<struct sockaddr_in*>(ifa->ifa_addr);
+                if (inet_ntop(AF_INET, &sin->sin_addr, buf, sizeof(buf))) {
+                    ipv4 = buf;
+                }
+            } else if (ifa->ifa_addr->sa_family == AF_INET6 && ipv6.empty()) {
+                auto* sin6 = reinterpret_cast<struct sockaddr_in6*>(ifa->ifa_addr);
+                if (!IN6_IS_ADDR_LINKLOCAL(&sin6->sin6_addr) &&
+                    inet_ntop(AF_INET6, &sin6->sin6_addr, buf, sizeof(buf))) {
+                    ipv6 = buf;
+                }
+            }
+        }
+        freeifaddrs(addrs);
+        return ipv4.empty() ? ipv6 : ipv4;
+    });
 }
 
 bool WifiManager::is_connected() {
     // Check global connectivity
-    std::string output = exec_command("nmcli -t -f CONNECTIVITY general");
+    std::string output = cached_status(connectivity_status_, [this]() {
+        return exec_command("nmcli -t -f CONNECTIVITY general");
+    });
     // full, limited
     return (output.find("full") != std::string::npos || output.find("limited") != std::string::npos);
 }
@@ -188,18 +236,48 @@ bool WifiManager::forget_network(const std::string& ssid) {
     // Use sudo to ensure we can delete root-owned profiles
     std::string cmd = "sudo nmcli connection delete \"" + ssid + "\"";
     std::string output = exec_command(cmd.c_str());
+    invalidate_status_cache();
     return (output.find("successfully") != std::string::npos);
 }
 
+std::string WifiManager::cached_status(CachedStatus& entry, const std::function<std::string()>& fetch) {
+    constexpr auto max_age = std::chrono::seconds(2);
+    auto now = std::chrono::steady_clock::now();
+    {
+        std::lock_guard<std::mutex> lock(status_mutex_);
+        if (entry.valid && now - entry.fetched < max_age) {
+            return entry.value;
+        }
+    }
+    
+    std::string value = fetch();
+    
+    std::lock_guard<std::mutex> lock(status_mutex_);
+    entry.value = value;
+    entry.fetched = now;
+    entry.valid = true;
+    return value;
+}
+
+void WifiManager::invalidate_status_cache() {
+    std::lock_guard<std::mutex> lock(status_mutex_);
+    ssid_status_.valid = false;
+    ip_status_.valid = false;
+    connectivity_status_.valid = false;
+}
+
 std::string WifiManager::exec_command(const char* cmd) {
-    std::array<char, 128> buffer;
+    // Callers split the output into lines themselves, so read it in bulk rather
+    // than line by line through fgets (which also needs a strlen per chunk)
+    std::array<char, 4096> buffer;
     std::string result;
     std::unique_ptr<FILE, decltype(&pclose)> pipe(popen(cmd, "r"), pclose);
     if (!pipe) {
         return "";
     }
-    while (fgets(buffer.data(), buffer.size(), pipe.get()) != nullptr) {
-        result += buffer.data();
+    size_t n;
+    while ((n = fread(buffer.data(), 1, buffer.size(), pipe.get())) > 0) {
+        result.append(buffer.data(), n);
     }
     return result;
 }
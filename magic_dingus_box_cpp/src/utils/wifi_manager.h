@@ -5,6 +5,8 @@
 #include <future>
 #include <mutex>
 #include <atomic>
+#include <chrono>
+#include <functional>
 
 namespace utils {
 
@@ -59,6 +61,21 @@ private:
     // Helper to execute shell command and get output
     std::string exec_command(const char* cmd);
     
+    // Status queries (SSID, IP, connectivity) are cached briefly so menu rebuilds
+    // don't spawn a fresh nmcli/hostname process for every label
+    struct CachedStatus {
+        std::string value;
+        std::chrono::steady_clock::time_point fetched;
+        bool valid = false;
+    };
+    std::string cached_status(CachedStatus& entry, const std::function<std::string()>& fetch);
+    void invalidate_status_cache();
+    
+    std::mutex status_mutex_;
+    CachedStatus ssid_status_;
+    CachedStatus ip_status_;
+    CachedStatus connectivity_status_;
+    
     std::vector<WifiNetwork> parse_nmcli_scan_output(const std::string& output);
     
     // Thread safety
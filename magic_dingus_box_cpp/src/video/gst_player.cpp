@@ -135,16 +135,15 @@ bool GstPlayer::initialize(const std::string& /*hwdec*/) {
         "format", G_TYPE_STRING, "RGBA",
         nullptr));
 
-    g_object_set(G_OBJECT(appsink_raw), "caps", caps, nullptr);
-    gst_caps_unref(caps);
-
-    // Set appsink properties
+    // Set caps and the appsink properties in one call
     g_object_set(G_OBJECT(appsink_raw),
+        "caps", caps,
         "emit-signals", TRUE,
         "sync", TRUE,
         "max-buffers", 1,
         "drop", TRUE,
         nullptr);
+    gst_caps_unref(caps);
 
     // Set the sink bin as playbin's video-sink (playbin takes ownership)
     g_object_set(G_OBJECT(playbin.get()), "video-sink", video_sink_bin.release(), nullptr);
@@ -175,6 +174,7 @@ gboolean GstPlayer::bus_call(GstBus* /*bus*/, GstMessage* msg, gpointer data) {
             // Handle EOS (e.g. auto loop or stop)
             player->is_playing_ = false;
             player->is_paused_ = false;
+            player->eos_ = true;
             break;
 
         case GST_MESSAGE_ERROR: {
@@ -188,6 +188,7 @@ gboolean GstPlayer::bus_call(GstBus* /*bus*/, GstMessage* msg, gpointer data) {
                 g_free(debug);
             }
             player->is_playing_ = false;
+            player->error_ = true;
             break;
         }
 
@@ -204,39 +205,41 @@ gboolean GstPlayer::bus_call(GstBus* /*bus*/, GstMessage* msg, gpointer data) {
                     player->is_playing_ = true;
                     player->is_paused_ = false;
 
-                    // Inspect pipeline to see what decoder is used
-                    GstIterator* it = gst_bin_iterate_recurse(GST_BIN(player->pipeline_));
-                    GValue item = G_VALUE_INIT;
-                    bool done = false;
-                    while (!done) {
-                        switch (gst_iterator_next(it, &item)) {
-                            case GST_ITERATOR_OK: {
-                                GstElement* element = GST_ELEMENT(g_value_get_object(&item));
-                                gchar* name = gst_element_get_name(element);
-                                GstElementFactory* factory = gst_element_get_factory(element);
-
-                                // Check if it looks like a decoder
-                                if (factory) {
-                                    const gchar* factory_name = gst_plugin_feature_get_name(GST_PLUGIN_FEATURE(factory));
-                                    if (factory_name && (strstr(factory_name, "dec") || strstr(factory_name, "avdec"))) {
-                                        LOG_DEBUG("  Decoder: {} ({})", name, factory_name);
+                    // Inspect pipeline to see what decoder is used (only worth walking if it gets logged)
+                    if (logging::is_enabled(spdlog::level::debug)) {
+                        GstIterator* it = gst_bin_iterate_recurse(GST_BIN(player->pipeline_));
+                        GValue item = G_VALUE_INIT;
+                        bool done = false;
+                        while (!done) {
+                            switch (gst_iterator_next(it, &item)) {
+                                case GST_ITERATOR_OK: {
+                                    GstElement* element = GST_ELEMENT(g_value_get_object(&item));
+                                    gchar* name = gst_element_get_name(element);
+                                    GstElementFactory* factory = gst_element_get_factory(element);
+
+                                    // Check if it looks like a decoder
+                                    if (factory) {
+                                        const gchar* factory_name = gst_plugin_feature_get_name(GST_PLUGIN_FEATURE(factory));
+                                        if (factory_name && (strstr(factory_name, "dec") || strstr(factory_name, "avdec"))) {
+                                            LOG_DEBUG("  Decoder: {} ({})", name, factory_name);
+                                        }
                                     }
-                                }
 
-                                g_free(name);
-                                g_value_reset(&item);
-                                break;
+                                    g_free(name);
+                                    g_value_reset(&item);
+                                    break;
+                                }
+                                case GST_ITERATOR_RESYNC:
+                                    gst_iterator_resync(it);
+                                    break;
+                                case GST_ITERATOR_ERROR:
+                                case GST_ITERATOR_DONE:
+                                    done = true;
+                                    break;
                             }
-                            case GST_ITERATOR_RESYNC:
-                                gst_iterator_resync(it);
-                                break;
-                            case GST_ITERATOR_ERROR:
-                            case GST_ITERATOR_DONE:
-                                done = true;
-                                break;
                         }
+                        gst_iterator_free(it);
                     }
-                    gst_iterator_free(it);
 
                 } else if (new_state == GST_STATE_PAUSED) {
                     player->is_paused_ = true;
@@ -282,21 +285,27 @@ gboolean GstPlayer::bus_call(GstBus* /*bus*/, GstMessage* msg, gpointer data) {
 bool GstPlayer::load_file(const std::string& path, double start, double /*end*/, bool /*loop*/) {
     if (!initialized_) return false;
 
-    stop();
+    // playbin only takes a new URI in READY or NULL. READY releases the current stream
+    // but keeps the pipeline's elements and sinks, so switching files skips the full
+    // teardown in stop() (and its EOS drain delay)
+    gst_element_set_state(pipeline_, GST_STATE_READY);
+    gst_element_get_state(pipeline_, nullptr, nullptr, GST_SECOND);
 
-    std::string uri = "file://" + path;
-    // Handle absolute paths
-    if (path.find("://") != std::string::npos) {
-        uri = path;
-    } else if (path[0] != '/') {
-        // Relative path - make absolute (GStreamer needs absolute URI usually)
-        char* real_path = realpath(path.c_str(), nullptr);
-        if (real_path) {
-            uri = "file://" + std::string(real_path);
-            free(real_path);
-        }
+    // Drop messages from the previous file so a stale EOS can't end the new one
+    if (auto bus = get_bus(pipeline_)) {
+        gst_bus_set_flushing(bus.get(), TRUE);
+        gst_bus_set_flushing(bus.get(), FALSE);
     }
 
+    is_playing_ = false;
+    is_paused_ = false;
+    position_ = 0.0;
+    duration_ = 0.0;
+    eos_ = false;
+    error_ = false;
+
+    const std::string& uri = resolve_uri(path);
+
     LOG_DEBUG("GstPlayer::load_file() - setting URI: {}", uri);
     g_object_set(G_OBJECT(playbin_), "uri", uri.c_str(), nullptr);
 
@@ -312,6 +321,30 @@ bool GstPlayer::load_file(const std::string& path, double start, double /*end*/,
     return true;
 }
 
+const std::string& GstPlayer::resolve_uri(const std::string& path) {
+    // URIs are cached per path: playlists loop and shuffle over the same files,
+    // so realpath() only needs to run once per relative path
+    auto it = uri_cache_.find(path);
+    if (it != uri_cache_.end()) {
+        return it->second;
+    }
+
+    std::string uri = "file://" + path;
+    // Handle absolute paths
+    if (path.find("://") != std::string::npos) {
+        uri = path;
+    } else if (!path.empty() && path[0] != '/') {
+        // Relative path - make absolute (GStreamer needs absolute URI usually)
+        char* real_path = realpath(path.c_str(), nullptr);
+        if (real_path) {
+            uri = "file://" + std::string(real_path);
+            free(real_path);
+        }
+    }
+
+    return uri_cache_.emplace(path, std::move(uri)).first->second;
+}
+
 void GstPlayer::play() {
     if (!initialized_) return;
 
@@ -319,13 +352,16 @@ void GstPlayer::play() {
     GstStateChangeReturn ret = gst_element_set_state(pipeline_, GST_STATE_PLAYING);
     LOG_DEBUG("GstPlayer::play() state change return: {}", static_cast<int>(ret));
 
-    // Check current state after a short delay
-    std::this_thread::sleep_for(std::chrono::milliseconds(100));
-    GstState current, pending;
-    gst_element_get_state(pipeline_, &current, &pending, GST_CLOCK_TIME_NONE);
-    LOG_DEBUG("GstPlayer::play() current state: {}, pending: {}",
-              gst_element_state_get_name(current),
-              gst_element_state_get_name(pending));
+    // The switch to PLAYING completes asynchronously and its STATE_CHANGED message
+    // updates is_playing_ from update_state(), so there is nothing to wait for here.
+    // Report where the pipeline is right now, without blocking, if it gets logged.
+    if (logging::is_enabled(spdlog::level::debug)) {
+        GstState current, pending;
+        gst_element_get_state(pipeline_, &current, &pending, 0);
+        LOG_DEBUG("GstPlayer::play() current state: {}, pending: {}",
+                  gst_element_state_get_name(current),
+                  gst_element_state_get_name(pending));
+    }
 }
 
 void GstPlayer::pause() {
@@ -345,6 +381,7 @@ void GstPlayer::seek(double seconds) {
         gint64 seek_pos = pos + static_cast<gint64>(seconds * GST_SECOND);
         if (seek_pos < 0) seek_pos = 0;
         gst_element_seek_simple(pipeline_, GST_FORMAT_TIME, static_cast<GstSeekFlags>(GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_KEY_UNIT), seek_pos);
+        eos_ = false;
     }
 }
 
@@ -352,20 +389,14 @@ void GstPlayer::seek_absolute(double timestamp) {
     if (!initialized_) return;
     gint64 seek_pos = static_cast<gint64>(timestamp * GST_SECOND);
     gst_element_seek_simple(pipeline_, GST_FORMAT_TIME, static_cast<GstSeekFlags>(GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_KEY_UNIT), seek_pos);
+    eos_ = false;
 }
 
 void GstPlayer::stop() {
     if (!initialized_) return;
 
-    // Try to send EOS event first to gracefully stop playback
-    if (playbin_) {
-        gst_element_send_event(playbin_, gst_event_new_eos());
-    }
-
-    // Wait a bit for EOS to be processed
-    std::this_thread::sleep_for(std::chrono::milliseconds(100));
-
-    // Force state change to NULL
+    // Going to NULL tears the pipeline down and releases its buffers in one state
+    // change; draining it with an EOS first only added a fixed wait
     GstStateChangeReturn ret = gst_element_set_state(pipeline_, GST_STATE_NULL);
     if (ret == GST_STATE_CHANGE_FAILURE) {
         LOG_ERROR("Failed to set pipeline to NULL state in stop()");
@@ -381,6 +412,8 @@ void GstPlayer::stop() {
     is_paused_ = false;
     position_ = 0.0;
     duration_ = 0.0;
+    eos_ = false;
+    error_ = false;
 }
 
 bool GstPlayer::is_playing() const {
@@ -392,25 +425,31 @@ bool GstPlayer::is_paused() const {
 }
 
 double GstPlayer::get_position() const {
+    // Served from the value update_state() refreshes every frame, so callers
+    // (the controller, status text) don't each issue their own pipeline query
     if (!initialized_) return 0.0;
-    gint64 pos = 0;
-    if (gst_element_query_position(pipeline_, GST_FORMAT_TIME, &pos)) {
-        return static_cast<double>(pos) / GST_SECOND;
-    }
-    return 0.0;
+    return position_;
+}
+
+bool GstPlayer::is_at_end() const {
+    return eos_;
+}
+
+bool GstPlayer::has_error() const {
+    return error_;
 }
 
 double GstPlayer::get_duration() const {
+    // Cached like get_position(); also kept current by DURATION_CHANGED bus messages
     if (!initialized_) return 0.0;
-    gint64 dur = 0;
-    if (gst_element_query_duration(pipeline_, GST_FORMAT_TIME, &dur)) {
-        return static_cast<double>(dur) / GST_SECOND;
-    }
     return duration_;
 }
 
 void GstPlayer::set_volume(double volume) {
     if (!initialized_) return;
+    // Fades and every file load re-send the volume; skip the property write when unchanged
+    if (volume == last_volume_) return;
+    last_volume_ = volume;
     // GStreamer volume is 0.0 to 1.0 (or more for boost)
     g_object_set(G_OBJECT(playbin_), "volume", volume / 100.0, nullptr);
 }
@@ -425,9 +464,14 @@ double GstPlayer::get_volume() const {
 void GstPlayer::update_state() {
     if (!initialized_ || !pipeline_) return;
 
-    // Poll current pipeline state
+    // End-of-stream arrives as a bus message rather than being inferred from position
+    dispatch_bus_messages();
+
+    // Poll current pipeline state without waiting: while a transition (e.g. preroll)
+    // is still in flight this returns ASYNC and the cached state stays as the bus
+    // messages above left it, instead of blocking the frame until it settles
     GstState current_state, pending_state;
-    GstStateChangeReturn ret = gst_element_get_state(pipeline_, &current_state, &pending_state, GST_CLOCK_TIME_NONE);
+    GstStateChangeReturn ret = gst_element_get_state(pipeline_, &current_state, &pending_state, 0);
 
     if (ret == GST_STATE_CHANGE_SUCCESS || ret == GST_STATE_CHANGE_NO_PREROLL) {
         // Update our cached state
@@ -437,8 +481,9 @@ void GstPlayer::update_state() {
         is_playing_ = now_playing;
         is_paused_ = (current_state == GST_STATE_PAUSED);
 
-        // If we just started playing, inspect the pipeline for decoders
-        if (!was_playing && now_playing) {
+        // If we just started playing, inspect the pipeline for decoders. The walk and its
+        // settle delay exist only for the debug log, so skip them when it is filtered out
+        if (!was_playing && now_playing && logging::is_enabled(spdlog::level::debug)) {
             LOG_DEBUG("Pipeline now playing! Inspecting elements...");
 
             // Give pipeline a moment to fully initialize decoders
@@ -485,6 +530,28 @@ void GstPlayer::update_state() {
     update_position();
 }
 
+void GstPlayer::dispatch_bus_messages() {
+    // The bus watch is only serviced by a GLib main loop, which this process doesn't run,
+    // so pop queued messages here. This also keeps QoS/state messages from piling up.
+    auto bus = get_bus(pipeline_);
+    if (!bus) return;
+    while (GstMessage* msg = gst_bus_pop(bus.get())) {
+        bus_call(bus.get(), msg, this);
+        gst_message_unref(msg);
+    }
+}
+
+void GstPlayer::wait_for_bus_message(int timeout_ms) {
+    if (!initialized_ || !pipeline_) return;
+    auto bus = get_bus(pipeline_);
+    if (!bus) return;
+    if (GstMessage* msg = gst_bus_timed_pop(bus.get(), static_cast<GstClockTime>(timeout_ms) * GST_MSECOND)) {
+        bus_call(bus.get(), msg, this);
+        gst_message_unref(msg);
+    }
+    dispatch_bus_messages();
+}
+
 void GstPlayer::update_position() {
     if (!initialized_ || !pipeline_) return;
 
@@ -510,6 +577,14 @@ void GstPlayer::cleanup() {
         playbin_ = nullptr;
         appsink_ = nullptr;
     }
+    // The NULL transition above is synchronous, so playback is over once it returns
+    is_playing_ = false;
+    is_paused_ = false;
+    position_ = 0.0;
+    duration_ = 0.0;
+    eos_ = false;
+    error_ = false;
+    last_volume_ = -1.0;
     initialized_ = false;
 }
 
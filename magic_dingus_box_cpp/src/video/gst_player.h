@@ -7,6 +7,7 @@
 #include <atomic>
 #include <thread>
 #include <mutex>
+#include <unordered_map>
 
 namespace video {
 
@@ -31,6 +32,8 @@ public:
     bool is_paused() const override;
     double get_position() const override;
     double get_duration() const override;
+    bool is_at_end() const override;
+    bool has_error() const override;
     
     void set_volume(double volume) override;
     double get_volume() const override;
@@ -44,6 +47,11 @@ public:
     // Poll for state updates (call this regularly from main loop)
     void update_state();
 
+    // Block until the pipeline posts a bus message or timeout_ms elapses, handling
+    // it and anything else queued. Lets callers wait on pipeline progress (state
+    // changes, duration, errors) instead of sleeping a fixed interval.
+    void wait_for_bus_message(int timeout_ms);
+
 private:
     GstElement* pipeline_;
     GstElement* playbin_; // We use playbin for simplicity
@@ -54,12 +62,22 @@ private:
     std::atomic<bool> is_paused_;
     std::atomic<double> duration_;
     std::atomic<double> position_;
+    std::atomic<bool> eos_{false};  // Set by the EOS bus message, cleared on load/seek/stop
+    std::atomic<bool> error_{false};  // Set by the ERROR bus message, cleared on load/stop
+    double last_volume_ = -1.0;     // Last volume written to playbin (-1 = not yet written)
     
     // Bus watch
     guint bus_watch_id_;
     static gboolean bus_call(GstBus* bus, GstMessage* msg, gpointer data);
     
+    // Dispatch queued bus messages (no GLib main loop runs to fire the watch)
+    void dispatch_bus_messages();
+    
     void update_position();
+    
+    // Resolve a file path to a playbin URI (cached by path)
+    const std::string& resolve_uri(const std::string& path);
+    std::unordered_map<std::string, std::string> uri_cache_;
 };
 
 } // namespace video
@@ -255,6 +255,10 @@ void GstRenderer::update_shader(int format) {
 }
 
 void GstRenderer::cleanup() {
+    if (pending_sample_) {
+        gst_sample_unref(pending_sample_);
+        pending_sample_ = nullptr;
+    }
     if (gl_initialized_) {
         glDeleteTextures(3, texture_ids_);
         glDeleteVertexArrays(1, &vao_id_);
@@ -268,15 +272,21 @@ uint64_t GstRenderer::get_update_flags() const {
     return UPDATE_FRAME; 
 }
 
+bool GstRenderer::poll_frame() {
+    if (!pending_sample_ && appsink_) {
+        pending_sample_ = gst_app_sink_try_pull_sample(GST_APP_SINK(appsink_), 0);
+    }
+    return pending_sample_ != nullptr;
+}
+
 void GstRenderer::render() {
     if (!gl_initialized_) init_gl_resources();
     
-    // Pull sample (non-blocking)
-    GstSample* sample = gst_app_sink_try_pull_sample(GST_APP_SINK(appsink_), 0);
-    
-    if (sample) {
-        upload_frame(sample);
-        gst_sample_unref(sample);
+    // Pull sample (non-blocking) unless poll_frame() already holds one
+    if (poll_frame()) {
+        upload_frame(pending_sample_);
+        gst_sample_unref(pending_sample_);
+        pending_sample_ = nullptr;
     }
     
     render_quad();
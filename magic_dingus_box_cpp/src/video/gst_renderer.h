@@ -25,6 +25,10 @@ public:
     // Render current frame
     void render();
     
+    // Pull the next decoded frame (non-blocking) and hold it for render().
+    // Returns true while a frame is waiting to be drawn.
+    bool poll_frame();
+    
     // Check if we have a new frame
     uint64_t get_update_flags() const;
     
@@ -49,6 +53,7 @@ public:
 private:
     GstPlayer* player_;
     GstElement* appsink_;
+    GstSample* pending_sample_ = nullptr;  // Pulled by poll_frame(), uploaded by render()
     
     uint32_t width_;
     uint32_t height_;
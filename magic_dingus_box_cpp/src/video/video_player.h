@@ -23,6 +23,13 @@ public:
     virtual double get_position() const = 0;
     virtual double get_duration() const = 0;
     
+    // True once the current file has reached end-of-stream (players without an
+    // end-of-stream signal fall back to callers comparing position and duration)
+    virtual bool is_at_end() const { return false; }
+    
+    // True once the pipeline has reported an error for the current file
+    virtual bool has_error() const { return false; }
+    
     virtual void set_volume(double volume) = 0;
     virtual double get_volume() const = 0;
     